@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""Throughput benchmarks of the wrapper against the in-process stub server.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.run
+    python -m benchmarks.run --latency 0.005 --compare benchmarks/results/<baseline>.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+os.environ.setdefault("AGENT_NO_ANALYTICS", "1")
+
+from report_portal import ReportPortal
+from report_portal.client.rp_client.compression import RequestCompression
+from report_portal.utils import Cache
+
+from .stub_server import StubReportPortal
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+LISTING_FIELDS = ("id", "uuid", "name", "status", "path")
+
+
+def bench_start_finish(rp: ReportPortal, stub: StubReportPortal, args) -> dict:
+    """Sequential start + finish of test items."""
+    step = rp.get_step()
+    started = time.perf_counter()
+    for index in range(args.items):
+        step.start(name=f"step_{index}")
+        step.finish(return_code=0)
+    elapsed = time.perf_counter() - started
+    return {"items": args.items, "seconds": round(elapsed, 4), "items_per_second": round(args.items / elapsed, 1)}
+
+
+def bench_send_log(rp: ReportPortal, stub: StubReportPortal, args) -> dict:
+    """Sequential send_log calls into one item."""
+    step = rp.get_step()
+    step.start(name="logging step")
+    started = time.perf_counter()
+    for index in range(args.logs):
+        step.send_log(message=f"log line {index}")
+    elapsed = time.perf_counter() - started
+    step.finish(return_code=0)
+    return {"logs": args.logs, "seconds": round(elapsed, 4), "logs_per_second": round(args.logs / elapsed, 1)}
+
+
+def bench_pagination(rp: ReportPortal, stub: StubReportPortal, args) -> dict:
+    """Full listing of a seeded launch, sequential and with concurrent page fetches."""
+    launch_id = _seed_listing(rp, stub, args)
+    result = {"items": args.listing, "page_size": args.page_size}
+    for label, max_workers in (("sequential", 1), ("concurrent", args.workers)):
+        Cache().clear()
+        started = time.perf_counter()
+        items = rp.launch.rp_client.get_items(
+            item_type="test_item",
+            launch_id=launch_id,
+            page_size=args.page_size,
+            max_workers=max_workers
+        )
+        elapsed = time.perf_counter() - started
+        result[f"{label}_seconds"] = round(elapsed, 4)
+        result[f"{label}_items_per_second"] = round(len(items) / elapsed, 1)
+    return result
+
+
+def bench_cache_hit(rp: ReportPortal, stub: StubReportPortal, args) -> dict:
+    """Latency of get_info served from the cache versus from the server."""
+    step = rp.get_step()
+    uuid = step.start(name="cached step")
+    step.finish(return_code=0)
+    rp_client = rp.launch.rp_client
+
+    misses = []
+    for _ in range(args.cache_lookups // 10 or 1):
+        started = time.perf_counter()
+        rp_client.get_info(item_type="test_item", uuid=uuid, cache=False)
+        misses.append(time.perf_counter() - started)
+
+    rp_client.get_info(item_type="test_item", uuid=uuid)
+    hits = []
+    for _ in range(args.cache_lookups):
+        started = time.perf_counter()
+        rp_client.get_info(item_type="test_item", uuid=uuid)
+        hits.append(time.perf_counter() - started)
+
+    return {
+        "lookups": args.cache_lookups,
+        "hit_median_us": round(statistics.median(hits) * 1e6, 2),
+        "hit_p99_us": round(_percentile(hits, 99) * 1e6, 2),
+        "miss_median_us": round(statistics.median(misses) * 1e6, 2),
+    }
+
+
+def bench_listing_memory(rp: ReportPortal, stub: StubReportPortal, args) -> dict:
+    """Peak traced memory of a full listing, raw dictionaries versus projected records."""
+    launch_id = _seed_listing(rp, stub, args)
+    result = {"items": args.listing, "fields": list(LISTING_FIELDS)}
+    for label, fields in (("raw", None), ("projected", LISTING_FIELDS)):
+        Cache().clear()
+        tracemalloc.start()
+        items = rp.launch.rp_client.get_items(
+            item_type="test_item",
+            launch_id=launch_id,
+            page_size=args.page_size,
+            fields=fields
+        )
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del items
+        result[f"{label}_peak_kib"] = round(peak / 1024, 1)
+        result[f"{label}_retained_kib"] = round(retained / 1024, 1)
+    return result
+
+
+def bench_compression(rp: ReportPortal, stub: StubReportPortal, args) -> dict:
+    """Bytes sent and throughput for large log messages, uncompressed and gzip-compressed."""
+    requests = rp.launch.rp_client.requests
+    configured = requests.compression
+    step = rp.get_step()
+    step.start(name="compression step")
+    message = "\n".join(f"Traceback line {index}: assertion failed in module_{index % 7}" for index in range(80))
+    result = {"logs": args.logs // 4, "message_bytes": len(message)}
+
+    try:
+        for label, compression in (("plain", None), ("gzip", RequestCompression(encoding="gzip"))):
+            requests.compression = compression
+            received = stub.bytes_received
+            started = time.perf_counter()
+            for _ in range(result["logs"]):
+                step.send_log(message=message)
+            elapsed = time.perf_counter() - started
+            result[f"{label}_kib_sent"] = round((stub.bytes_received - received) / 1024, 1)
+            result[f"{label}_logs_per_second"] = round(result["logs"] / elapsed, 1)
+    finally:
+        requests.compression = configured
+
+    step.finish(return_code=0)
+    return result
+
+
+SCENARIOS = {
+    "start_finish": bench_start_finish,
+    "send_log": bench_send_log,
+    "pagination": bench_pagination,
+    "cache_hit": bench_cache_hit,
+    "listing_memory": bench_listing_memory,
+    "compression": bench_compression,
+}
+
+
+def _seed_listing(rp: ReportPortal, stub: StubReportPortal, args) -> int:
+    """Create a launch holding ``args.listing`` items directly in the stub store."""
+    launch_uuid = rp.launch.rp_client.start_launch(name="listing", start_time=str(int(time.time() * 1000)))
+    stub.seed_items(launch_uuid, args.listing)
+    return stub.launches[launch_uuid]["id"]
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args) -> dict:
+    """Run the selected scenarios against a fresh stub server.
+
+    :return: Results document with metadata and per-scenario metrics.
+    """
+    results = {}
+    with StubReportPortal(latency=args.latency, error_rate=args.error_rate, seed=args.seed) as stub:
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "config.json"
+            config_path.write_text(json.dumps({"endpoint": stub.endpoint, "api_key": "benchmark"}))
+            rp = ReportPortal(project_name=stub.project, config_path=str(config_path))
+
+        rp.launch.start(name="benchmark")
+        try:
+            for name in args.scenarios:
+                Cache().clear()
+                print(f"|INFO| Running {name}...")
+                results[name] = SCENARIOS[name](rp, stub, args)
+        finally:
+            rp.launch.finish()
+
+        return {
+            "meta": {
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "revision": _git_revision(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "params": {
+                    key: value for key, value in vars(args).items()
+                    if key not in ("output", "compare", "scenarios")
+                },
+                "requests": dict(stub.requests),
+            },
+            "results": results,
+        }
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print every numeric metric next to its baseline value and relative change."""
+    print(f"\n{'metric':<45} {'baseline':>12} {'current':>12} {'change':>9}")
+    for scenario, metrics in current["results"].items():
+        base_metrics = baseline.get("results", {}).get(scenario, {})
+        for metric, value in metrics.items():
+            base_value = base_metrics.get(metric)
+            if not isinstance(value, (int, float)) or not isinstance(base_value, (int, float)):
+                continue
+            change = f"{(value - base_value) / base_value * 100:+.1f}%" if base_value else "n/a"
+            print(f"{scenario + '.' + metric:<45} {base_value:>12} {value:>12} {change:>9}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ReportPortal wrapper against a local stub server.")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--items", type=int, default=500, help="Items started and finished.")
+    parser.add_argument("--logs", type=int, default=2000, help="Logs sent.")
+    parser.add_argument("--listing", type=int, default=20000, help="Items in listing scenarios.")
+    parser.add_argument("--page-size", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=8, help="max_workers for concurrent pagination.")
+    parser.add_argument("--cache-lookups", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub server latency per request, seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failed by the stub.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Results file; default benchmarks/results/<time>.json.")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline results file to compare against.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    document = run(args)
+    print(json.dumps(document["results"], indent=2))
+
+    output = args.output or RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2))
+    print(f"|INFO| Results saved to {output}")
+
+    if args.compare:
+        compare(document, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
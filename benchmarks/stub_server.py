@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import uuid as uuid_lib
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StubReportPortal:
+    """In-process ReportPortal stub implementing the endpoints used by the wrapper.
+
+    Launches, items and logs are kept in memory. Every request sleeps ``latency``
+    seconds and fails with ``error_status`` with probability ``error_rate``.
+
+    :param project: Project name served by the stub.
+    :param latency: Delay in seconds added to every request.
+    :param error_rate: Probability (0..1) of answering with error_status.
+    :param error_status: HTTP status of injected errors.
+    :param seed: Random seed for error injection.
+    :param accept_encodings: Request body encodings accepted; others are answered with 415.
+    :param bulk_endpoints: Serve bulk launch delete/stop; without them those calls get 404.
+
+    ``failures`` maps a handler name (e.g. '_update_item') to an HTTP status its
+    route answers with instead of being served, for deterministic error tests.
+    """
+
+    def __init__(
+            self,
+            project: str = "benchmark",
+            latency: float = 0.0,
+            error_rate: float = 0.0,
+            error_status: int = 500,
+            seed: int = None,
+            accept_encodings: tuple = ("gzip", "deflate"),
+            bulk_endpoints: bool = True,
+    ):
+        self.project = project
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.accept_encodings = accept_encodings
+        self.bulk_endpoints = bulk_endpoints
+        self.bytes_received = 0
+        self.launches: dict[str, dict] = {}
+        self.items: dict[str, dict] = {}
+        self.logs = 0
+        self.requests = Counter()
+        self.failures: dict[str, int] = {}
+        self._ids = iter(range(1, 1 << 62))
+        self._lock = threading.Lock()
+        self._server = None
+        self._routes = self._build_routes()
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubReportPortal":
+        stub = self
+
+        class Handler(_Handler):
+            server_stub = stub
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True, name="RP-Stub").start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubReportPortal":
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def seed_items(self, launch_uuid: str, count: int, children: int = 10) -> list[str]:
+        """Create items directly in the store: suites with ``children`` steps each.
+
+        :return: Created item UUIDs.
+        """
+        uuids = []
+        suite = None
+        for index in range(count):
+            if index % (children + 1) == 0:
+                suite = self._new_item(launch_uuid, {"name": f"Suite {index}", "type": "SUITE"}, parent=None)
+                uuids.append(suite["uuid"])
+            else:
+                item = self._new_item(
+                    launch_uuid,
+                    {"name": f"test_{index}", "type": "STEP", "codeRef": f"tests.test_module.test_{index}"},
+                    parent=suite
+                )
+                uuids.append(item["uuid"])
+        return uuids
+
+    def handle(self, method: str, path: str, query: dict, body: bytes, headers: dict) -> tuple[int, dict]:
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            return self.error_status, {"message": "Injected error"}
+
+        with self._lock:
+            self.bytes_received += len(body)
+
+        encoding = headers.get("Content-Encoding")
+        if encoding:
+            if encoding not in self.accept_encodings:
+                return 415, {"message": f"Unsupported Content-Encoding: {encoding}"}
+            body = gzip.decompress(body) if encoding == "gzip" else zlib.decompress(body)
+
+        for route_method, pattern, handler in self._routes:
+            if route_method != method:
+                continue
+            match = pattern.fullmatch(path)
+            if match:
+                self.requests[handler.__name__] += 1
+                if handler.__name__ in self.failures:
+                    return self.failures[handler.__name__], {"message": "Injected error"}
+                return handler(query=query, body=body, headers=headers, **match.groupdict())
+
+        return 404, {"message": f"No stub route for {method} {path}"}
+
+    def _build_routes(self) -> list:
+        project = re.escape(self.project)
+        routes = [
+            ("GET", r"/api/info", self._api_info),
+            ("POST", rf"/api/v[12]/{project}/launch", self._start_launch),
+            ("PUT", rf"/api/v[12]/{project}/launch/(?P<launch_uuid>[^/]+)/finish", self._finish_launch),
+            ("GET", rf"/api/v[12]/{project}/launch/uuid/(?P<uuid>[^/]+)", self._launch_info),
+            ("GET", rf"/api/v[12]/{project}/launch", self._list_launches),
+            ("DELETE", rf"/api/v1/{project}/launch", self._delete_launches),
+            ("DELETE", rf"/api/v1/{project}/launch/(?P<launch_id>\d+)", self._delete_launch),
+            ("POST", rf"/api/v1/{project}/launch/merge", self._merge_launches),
+            ("PUT", rf"/api/v1/{project}/launch/stop", self._stop_launches),
+            ("PUT", rf"/api/v1/{project}/launch/(?P<launch_id>\d+)/stop", self._stop_launch),
+            ("POST", rf"/api/v[12]/{project}/item(?:/(?P<parent_uuid>[^/]+))?", self._start_item),
+            ("PUT", rf"/api/v1/{project}/item/(?P<item_id>\d+)/update", self._update_item),
+            ("PUT", rf"/api/v[12]/{project}/item/(?P<item_uuid>[^/]+)", self._finish_item),
+            ("GET", rf"/api/v[12]/{project}/item/uuid/(?P<uuid>[^/]+)", self._item_info),
+            ("GET", rf"/api/v[12]/{project}/item", self._list_items),
+            ("POST", rf"/api/v[12]/{project}/log", self._log),
+        ]
+        return [(method, re.compile(pattern), handler) for method, pattern, handler in routes]
+
+    @staticmethod
+    def _api_info(**_) -> tuple[int, dict]:
+        return 200, {"build": {"version": "5.11.0"}}
+
+    def _start_launch(self, body: bytes, **_) -> tuple[int, dict]:
+        data = json.loads(body or b"{}")
+        with self._lock:
+            launch = {
+                "id": next(self._ids),
+                "uuid": str(uuid_lib.uuid4()),
+                "name": data.get("name"),
+                "number": len(self.launches) + 1,
+                "status": "IN_PROGRESS",
+                "startTime": data.get("startTime"),
+                "description": data.get("description"),
+                "attributes": data.get("attributes") or [],
+                "mode": data.get("mode", "DEFAULT"),
+                "statistics": {"executions": {}, "defects": {}},
+            }
+            self.launches[launch["uuid"]] = launch
+        return 201, {"id": launch["uuid"], "number": launch["number"]}
+
+    def _finish_launch(self, launch_uuid: str, body: bytes, **_) -> tuple[int, dict]:
+        launch = self.launches.get(launch_uuid)
+        if launch is None:
+            return 404, {"message": f"Launch '{launch_uuid}' not found"}
+
+        data = json.loads(body or b"{}")
+        launch.update(status=data.get("status") or "PASSED", endTime=data.get("endTime"))
+        return 200, {"id": launch_uuid, "number": launch["number"], "link": ""}
+
+    def _launch_info(self, uuid: str, **_) -> tuple[int, dict]:
+        launch = self.launches.get(uuid)
+        return (200, launch) if launch else (404, {"message": f"Launch '{uuid}' not found"})
+
+    def _list_launches(self, query: dict, **_) -> tuple[int, dict]:
+        launches = [
+            launch for launch in self.launches.values()
+            if self._matches(launch, query, {"filter.eq.name": "name", "filter.eq.status": "status"})
+            and int(launch.get("startTime") or 0) < int(query.get("filter.lt.startTime", 1 << 62))
+        ]
+        return 200, self._page(launches, query)
+
+    def _delete_launches(self, body: bytes, **_) -> tuple[int, dict]:
+        if not self.bulk_endpoints:
+            return 404, {"message": "Not found"}
+
+        result = {"successfullyRemoved": [], "notFound": [], "errors": []}
+        for launch_id in json.loads(body or b"{}").get("ids", []):
+            status, _ = self._delete_launch(launch_id)
+            key = {200: "successfullyRemoved", 404: "notFound"}.get(status)
+            if key:
+                result[key].append(int(launch_id))
+            else:
+                result["errors"].append({"message": f"Launch '{launch_id}' is in progress"})
+        return 200, result
+
+    def _delete_launch(self, launch_id: str, **_) -> tuple[int, dict]:
+        launch = self._launch_by_id(launch_id)
+        if launch is None:
+            return 404, {"message": f"Launch '{launch_id}' not found"}
+
+        if launch["status"] == "IN_PROGRESS":
+            return 406, {"message": f"Launch '{launch_id}' is in progress"}
+
+        with self._lock:
+            del self.launches[launch["uuid"]]
+            for item_uuid in [uuid for uuid, item in self.items.items() if item["launchId"] == launch["id"]]:
+                del self.items[item_uuid]
+        return 200, {"message": f"Launch with ID = '{launch_id}' successfully deleted."}
+
+    def _merge_launches(self, body: bytes, **_) -> tuple[int, dict]:
+        data = json.loads(body or b"{}")
+        sources = [self._launch_by_id(launch_id) for launch_id in data.get("launches", [])]
+        if not sources or None in sources:
+            return 404, {"message": "Launch not found"}
+
+        status, created = self._start_launch(body=json.dumps({"name": data.get("name")}).encode())
+        merged = self.launches[created["id"]]
+        with self._lock:
+            for item in self.items.values():
+                if item["launchId"] in {launch["id"] for launch in sources}:
+                    item["launchId"] = merged["id"]
+            for launch in sources:
+                del self.launches[launch["uuid"]]
+        merged["status"] = "PASSED"
+        return 200, merged
+
+    def _stop_launches(self, body: bytes, **_) -> tuple[int, list]:
+        if not self.bulk_endpoints:
+            return 404, {"message": "Not found"}
+
+        data = json.loads(body or b"{}")
+        return 200, [
+            self._stop_launch(launch_id, body=json.dumps(entity).encode())[1]
+            for launch_id, entity in data.get("entities", {}).items()
+        ]
+
+    def _stop_launch(self, launch_id: str, body: bytes, **_) -> tuple[int, dict]:
+        launch = self._launch_by_id(launch_id)
+        if launch is None:
+            return 404, {"message": f"Launch '{launch_id}' not found"}
+
+        data = json.loads(body or b"{}")
+        launch.update(status=data.get("status") or "STOPPED", endTime=data.get("endTime"))
+        return 200, {"message": f"Launch with ID = '{launch_id}' successfully stopped."}
+
+    def _launch_by_id(self, launch_id) -> dict | None:
+        return next((launch for launch in self.launches.values() if str(launch["id"]) == str(launch_id)), None)
+
+    def _start_item(self, body: bytes, parent_uuid: str = None, **_) -> tuple[int, dict]:
+        data = json.loads(body or b"{}")
+        launch_uuid = data.get("launchUuid")
+        if launch_uuid not in self.launches:
+            return 404, {"message": f"Launch '{launch_uuid}' not found"}
+
+        parent = self.items.get(parent_uuid) if parent_uuid else None
+        if parent_uuid and parent is None:
+            return 404, {"message": f"Item '{parent_uuid}' not found"}
+
+        item = self._new_item(launch_uuid, data, parent=parent)
+        return 201, {"id": item["uuid"]}
+
+    def _finish_item(self, item_uuid: str, body: bytes, **_) -> tuple[int, dict]:
+        item = self.items.get(item_uuid)
+        if item is None:
+            return 404, {"message": f"Item '{item_uuid}' not found"}
+
+        data = json.loads(body or b"{}")
+        item.update(status=data.get("status") or "PASSED", endTime=data.get("endTime"))
+        for key in ("description", "attributes"):
+            if data.get(key) is not None:
+                item[key] = data[key]
+        return 200, {"message": f"TestItem with ID = '{item_uuid}' successfully finished."}
+
+    def _update_item(self, item_id: str, body: bytes, **_) -> tuple[int, dict]:
+        data = json.loads(body or b"{}")
+        for item in self.items.values():
+            if str(item["id"]) == item_id:
+                item.update({key: value for key, value in data.items() if value is not None})
+                return 200, {"message": f"TestItem with ID = '{item_id}' successfully updated."}
+        return 404, {"message": f"Item '{item_id}' not found"}
+
+    def _item_info(self, uuid: str, **_) -> tuple[int, dict]:
+        item = self.items.get(uuid)
+        return (200, item) if item else (404, {"message": f"Item '{uuid}' not found"})
+
+    def _list_items(self, query: dict, **_) -> tuple[int, dict]:
+        filters = {
+            "filter.eq.launchId": "launchId",
+            "filter.eq.name": "name",
+            "filter.eq.status": "status",
+            "filter.eq.type": "type",
+        }
+        items = [item for item in self.items.values() if self._matches(item, query, filters)]
+        return 200, self._page(items, query)
+
+    def _log(self, body: bytes, headers: dict, **_) -> tuple[int, dict]:
+        if not headers.get("Content-Type", "").startswith("multipart/"):
+            with self._lock:
+                self.logs += 1
+            return 201, {"id": str(uuid_lib.uuid4())}
+
+        # Batched logs of RPClient: one JSON entry per log in the json_request_part
+        count = max(body.count(b'"launchUuid"'), 1)
+        with self._lock:
+            self.logs += count
+        return 200, {"responses": [{"id": str(uuid_lib.uuid4())} for _ in range(count)]}
+
+    def _new_item(self, launch_uuid: str, data: dict, parent: dict = None) -> dict:
+        launch = self.launches[launch_uuid]
+        with self._lock:
+            item_id = next(self._ids)
+            item_paths = parent["pathNames"]["itemPaths"] + [{"id": parent["id"], "name": parent["name"]}] if parent else []
+            item = {
+                "id": item_id,
+                "uuid": data.get("uuid") or str(uuid_lib.uuid4()),
+                "name": data.get("name"),
+                "type": (data.get("type") or "STEP").upper(),
+                "launchId": launch["id"],
+                "parent": parent["id"] if parent else None,
+                "path": f"{parent['path']}.{item_id}" if parent else str(item_id),
+                "pathNames": {
+                    "launchPathName": {"name": launch["name"], "number": launch["number"]},
+                    "itemPaths": item_paths,
+                },
+                "status": "IN_PROGRESS",
+                "startTime": data.get("startTime"),
+                "endTime": None,
+                "codeRef": data.get("codeRef"),
+                "testCaseId": data.get("testCaseId") or data.get("codeRef"),
+                "uniqueId": f"auto:{uuid_lib.uuid4().hex}",
+                "description": data.get("description"),
+                "attributes": data.get("attributes") or [],
+                "parameters": data.get("parameters") or [],
+                "hasChildren": False,
+                "hasStats": data.get("hasStats", True),
+                "retry": bool(data.get("retry")),
+                "statistics": {
+                    "executions": {"total": 1, "passed": 1},
+                    "defects": {"to_investigate": {"total": 0, "ti001": 0}},
+                },
+            }
+            self.items[item["uuid"]] = item
+            if parent:
+                parent["hasChildren"] = True
+        return item
+
+    @staticmethod
+    def _matches(entity: dict, query: dict, filters: dict) -> bool:
+        for param, field in filters.items():
+            if param in query and str(entity.get(field)) != query[param]:
+                return False
+        return True
+
+    @staticmethod
+    def _page(entities: list, query: dict) -> dict:
+        size = int(query.get("page.size", 20))
+        number = int(query.get("page.page", 1))
+        total = len(entities)
+        return {
+            "content": entities[(number - 1) * size:number * size],
+            "page": {
+                "number": number,
+                "size": size,
+                "totalElements": total,
+                "totalPages": max((total + size - 1) // size, 1),
+            },
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_stub: StubReportPortal = None
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        status, payload = self.server_stub.handle(
+            method=self.command,
+            path=parsed.path,
+            query=query,
+            body=body,
+            headers=dict(self.headers)
+        )
+
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, *_):
+        pass
@@ -1,2 +1,4 @@
 # -*- coding: utf-8 -*-
 from .report_portal import ReportPortal
+from .utils import LogPolicy
+from .log_handler import ReportPortalLogHandler
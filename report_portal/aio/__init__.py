@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+from .client import AsyncRPClientAdvanced
+from .launcher import AsyncLauncher
+from .report_portal import AsyncReportPortal
+from .step import AsyncStep
+from .suite import AsyncSuite
+from .test import AsyncTest
+from .test_item import AsyncTestItem
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from typing import Any, Iterable, Optional, Sequence
+
+import aiohttp
+from reportportal_client.aio.client import Client as AsyncClient
+from reportportal_client.core.rp_requests import AsyncHttpRequest
+from reportportal_client.helpers import root_uri_join, dict_to_payload, verify_value_length
+
+from ..client.config import Config
+from ..client.rp_client import ItemRecord
+from ..client.rp_client.records import project
+from ..utils import Cache
+from ..utils.cache import NOT_FOUND
+
+
+class AsyncRPClientAdvanced(AsyncClient):
+    """Asynchronous counterpart of RPClientAdvanced on an aiohttp session.
+
+    The client keeps no item stack: launch and item UUIDs are passed explicitly, so any
+    number of items can be reported concurrently. All requests share one connection pool
+    of ``max_connections``; calls above the limit wait for a free connection.
+
+    Lookups share the process-wide Cache namespaces with the synchronous client.
+
+    :param config: Loaded configuration.
+    :param project_name: ReportPortal project name.
+    :param max_connections: Max open connections shared by all concurrent calls.
+    """
+
+    def __init__(self, config: Config, project_name: str, max_connections: int = 50, **kwargs: Any):
+        self.config = config
+        if self.config.http_timeout is not None:
+            kwargs.setdefault('http_timeout', self.config.http_timeout)
+        super().__init__(
+            endpoint=self.config.endpoint,
+            project=project_name,
+            api_key=self.config.api_key,
+            max_pool_size=max_connections,
+            **kwargs
+        )
+        self.api_version = (self.config.api_version or "v1").lower()
+        self.base_url = root_uri_join(f"api/{self.api_version}", self.project)
+        for namespace, policy in (self.config.cache or {}).items():
+            Cache().configure(namespace, **policy)
+
+    async def send_log(
+            self,
+            message: str,
+            launch_uuid: str,
+            time: str,
+            item_uuid: str = None,
+            level="INFO",
+    ) -> Optional[dict]:
+        data = {
+            "launchUuid": launch_uuid,
+            "time": time,
+            "message": message,
+            "level": level
+        }
+        if item_uuid is not None:
+            data["itemUuid"] = item_uuid
+
+        return await self.post(url_parts="log", data=data)
+
+    async def get(self, url_parts: str, params: dict = None) -> dict | None:
+        """GET a path relative to the project API url; retries are done by the session.
+
+        :return: Response JSON or None.
+        """
+        data = await self.fetch(url_parts, params=params)
+        return None if data is NOT_FOUND else data
+
+    async def fetch(self, url_parts: str, params: dict = None) -> dict | object | None:
+        """GET a path relative to the project API url.
+
+        :return: Response JSON, NOT_FOUND if the server answered 404, or None if the call failed.
+        """
+        url = root_uri_join(self.base_url, url_parts)
+        session = await self.session()
+        # Sent without AsyncHttpRequest: its response wrapper exposes no status code to tell a 404 apart
+        try:
+            response = await session.get(url, params=params or {})
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"|ERROR| GET request failed for {url}\nError: {e}")
+            return None
+
+        async with response:
+            if response.status == 404:
+                return NOT_FOUND
+
+            if not response.ok:
+                print(f"|ERROR| GET request failed for {url}\nError: {await response.text()}")
+                return None
+
+            return await response.json()
+
+    async def post(self, url_parts: str, data: dict) -> dict | None:
+        """POST JSON to a path relative to the project API url.
+
+        :return: Response JSON or None.
+        """
+        url = root_uri_join(self.base_url, url_parts)
+        response = await AsyncHttpRequest((await self.session()).post, url=url, json=data, name="post").make()
+        if response is None:
+            return None
+
+        if not response.is_success:
+            print(f"|ERROR| Post request failed for {url}\nError: {await response.message}")
+            return None
+
+        return await response.json
+
+    async def update_test_item(
+            self,
+            item_uuid: str,
+            *,
+            attributes: Optional[list | dict] = None,
+            description: Optional[str] = None,
+            status: Optional[str] = None,
+            **kwargs: Any
+    ) -> Optional[str]:
+        """Update existing Test Item at the ReportPortal, apply the update to its cached info
+        and drop its launch's cached item listings.
+
+        :param item_uuid:   Test Item UUID returned on the item start.
+        :param attributes:  Test Item attributes: [{'key': 'k_name', 'value': 'k_value'}, ...] or dict.
+        :param description: Test Item description.
+        :param status:      Test Item status.
+        :return:            Response message, or None if the update failed or was rejected.
+        """
+        if isinstance(attributes, dict):
+            attributes = dict_to_payload(attributes)
+
+        _params = {
+            "description": description,
+            "attributes": verify_value_length(attributes) if attributes and self.truncate_attributes else attributes,
+            "status": status,
+            **kwargs
+        }
+        data = {key: value for key, value in _params.items() if value is not None}
+
+        info = await self.get_info(item_type='test_item', uuid=item_uuid)
+        item_id = info.get('id') if info else None
+        if item_id is None:
+            print(f"|ERROR| Cannot update item {item_uuid}: its ID was not found")
+            return None
+
+        url = root_uri_join(self.base_url_v1, "item", item_id, "update")
+        response = await AsyncHttpRequest((await self.session()).put, url=url, json=data, name="update_test_item").make()
+        if not response or not response.is_success:
+            # The server may have applied part of the update or none of it; the next read asks it again
+            Cache().delete(item_uuid, namespace="item_info")
+            return None
+
+        self._write_through_item_info(item_uuid=item_uuid, data=data)
+        self._invalidate_launch_listings(info.get('launchId'))
+        return await response.message
+
+    async def finish_test_item(self, launch_uuid: str, item_id: str, end_time: str, **kwargs: Any) -> Optional[str]:
+        """Finish Test Item and drop its cached info and its launch's cached item listings."""
+        message = await super().finish_test_item(launch_uuid, item_id, end_time, **kwargs)
+        Cache().delete(item_id, namespace="item_info")
+        self._invalidate_launch_listings(await self.get_id(item_type='launch', uuid=launch_uuid))
+        return message
+
+    async def finish_launch(self, launch_uuid: str, end_time: str, **kwargs: Any) -> Optional[str]:
+        """Finish launch and drop its cached info and launch listings."""
+        message = await super().finish_launch(launch_uuid, end_time, **kwargs)
+        Cache().delete(launch_uuid, namespace="launch_info")
+        Cache().invalidate_tag("launches")
+        return message
+
+    async def get_info(self, item_type: str, uuid: str, cache: bool = True, ttl: int = None) -> dict | None:
+        namespace = "launch_info" if self._get_url_parts(item_type) == "launch" else "item_info"
+        if cache:
+            hit, info = Cache().lookup(uuid, namespace=namespace)
+            if hit:
+                return info if isinstance(info, dict) else None
+
+        info = await self.fetch(f"{self._get_url_parts(item_type)}/uuid/{uuid}")
+        if info is NOT_FOUND:
+            Cache().set_negative(uuid, namespace=namespace)
+            return None
+
+        # A failed call is not cached, so the next lookup asks the server again
+        if info is not None:
+            Cache().set(uuid, info, ttl=ttl, namespace=namespace)
+        return info
+
+    async def get_id(self, item_type: str, uuid: str, cache: bool = True, ttl: int = None) -> str | None:
+        key = (f"{self.project}/{self._get_url_parts(item_type)}", uuid)
+        if cache:
+            _id = Cache().get(key, namespace="uuid_id")
+            if _id is not None:
+                return _id
+
+        info = await self.get_info(item_type=item_type, uuid=uuid, cache=cache, ttl=ttl)
+        _id = info.get('id') if info else None
+        if _id is not None:
+            Cache().set(key, _id, ttl=ttl, namespace="uuid_id")
+        return _id
+
+    def cache_infos(self, item_type: str, infos: Iterable[dict], ttl: int = None) -> int:
+        """Store already fetched launch or item entities as get_info results.
+
+        :return: Number of cached entities.
+        """
+        namespace = "launch_info" if self._get_url_parts(item_type) == "launch" else "item_info"
+        count = 0
+        for info in infos:
+            if info.get('uuid'):
+                Cache().set(info['uuid'], info, ttl=ttl, namespace=namespace)
+                if info.get('id') is not None:
+                    key = (f"{self.project}/{self._get_url_parts(item_type)}", info['uuid'])
+                    Cache().set(key, info['id'], ttl=ttl, namespace="uuid_id")
+                count += 1
+        return count
+
+    async def get_items(
+            self,
+            item_type: str,
+            launch_id: str = None,
+            filter_by_name: str = None,
+            filter_by_status: str = None,
+            filter_by_type: str = None,
+            page_size: int = 100,
+            addition_params: dict = None,
+            sort: str = None,
+            fields: Sequence[str] = None,
+            max_concurrency: int = 8
+    ) -> list[dict] | list[ItemRecord]:
+        """List launches or test items; pages after the first are fetched concurrently.
+
+        :param fields: Optional field names (or dotted paths) to keep; pages are projected into ItemRecord objects.
+        :param max_concurrency: Max pages requested at the same time.
+        :return: List of raw item dictionaries, or ItemRecord objects if fields are given.
+        """
+        params = {"page.size": page_size, **(addition_params or {})}
+        filters = {
+            "filter.eq.name": filter_by_name,
+            "filter.eq.status": filter_by_status.upper() if filter_by_status else None,
+            "filter.eq.launchId": launch_id,
+            "filter.eq.type": filter_by_type.upper() if filter_by_type else None,
+            "sort": sort
+        }
+        params.update({key: value for key, value in filters.items() if value is not None})
+        url_parts = self._get_url_parts(item_type)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_page(page: int) -> dict | None:
+            async with semaphore:
+                return await self.get(url_parts, params={**params, "page.page": page})
+
+        items = []
+        data = await get_page(1)
+        if not data:
+            return items
+
+        pages = [data]
+        total_pages = data.get("page", {}).get("totalPages", 1)
+        pages.extend(await asyncio.gather(*(get_page(page) for page in range(2, total_pages + 1))))
+
+        for data in pages:
+            if not data:
+                break
+            page_content = data.get("content", [])
+            items.extend(project(page_content, fields) if fields else page_content)
+        return items
+
+    @staticmethod
+    def _write_through_item_info(item_uuid: str, data: dict) -> None:
+        """Apply an item update to its cached info instead of dropping it."""
+        hit, cached = Cache().lookup(item_uuid, namespace="item_info")
+        if hit and isinstance(cached, dict):
+            info = dict(cached)
+            info.update(data)
+            if isinstance(info.get('attributes'), dict):
+                info['attributes'] = dict_to_payload(info['attributes'])
+            Cache().set(item_uuid, info, namespace="item_info")
+
+    @staticmethod
+    def _invalidate_launch_listings(launch_id: Optional[str | int]) -> None:
+        """Drop cached item listing pages of a launch."""
+        if launch_id is not None:
+            Cache().invalidate_tag(f"items:{launch_id}")
+
+    @staticmethod
+    def _get_url_parts(item_type: str) -> str:
+        _type = item_type.lower()
+        if _type not in ["suite", "test", "step", "test_item", "launch"]:
+            raise ValueError(f"Invalid item type: {_type}. Must be one of ['suite', 'test', 'step', 'test_item'].")
+
+        return "launch" if _type == "launch" else "item"
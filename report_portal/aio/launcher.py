@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Optional, Sequence, Union
+
+from reportportal_client.helpers import timestamp
+
+from ..client.config import Config
+from ..client.rp_client import ItemRecord
+from ..utils import LogPolicy
+from .client import AsyncRPClientAdvanced
+
+
+class AsyncLauncher:
+    """Asynchronous counterpart of Launcher.
+
+    :param config: Loaded configuration.
+    :param project_name: ReportPortal project name.
+    :param log_policy: Optional policy applied to logs of all items in the launch.
+    :param max_connections: Max open connections shared by all concurrent calls.
+    """
+
+    item_type = 'launch'
+
+    def __init__(
+        self,
+        config: Config,
+        project_name: str,
+        log_policy: Optional[LogPolicy] = None,
+        max_connections: int = 50
+    ):
+        self.log_policy = log_policy
+        self.rp_client = AsyncRPClientAdvanced(config=config, project_name=project_name, max_connections=max_connections)
+        self.__id = None
+        self.__uuid = None
+
+    @property
+    def uuid(self) -> str:
+        """Get launch UUID.
+
+        :return: Launch UUID string.
+        :raises RuntimeError: If launch is not initialized.
+        """
+        if not self.__uuid:
+            raise RuntimeError("Launch is not initialised.")
+
+        return self.__uuid
+
+    async def get_id(self) -> Union[str, int]:
+        """Get launch ID, fetching it from ReportPortal if not cached.
+
+        :return: Launch ID (string or integer).
+        """
+        if not self.__id:
+            self.__id = await self.get_launch_id_by_uuid(uuid=self.uuid)
+        return self.__id
+
+    def connect(self, launch_uuid: str) -> None:
+        """
+        Connect to an existing launch by UUID.
+
+        :param launch_uuid: Existing launch UUID to continue.
+        """
+        self.__uuid = launch_uuid
+        self.__id = None
+
+    async def start(
+        self,
+        name: str,
+        last_launch_connect: bool = False,
+        start_time: Optional[str] = None,
+        description: Optional[str] = None,
+        attributes: Optional[list | dict] = None,
+        rerun: bool = False,
+        rerun_of: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """
+        Start a new launch or connect to the last one with the same name.
+
+        :param name: Launch name.
+        :param last_launch_connect: If True, connect to the last launch with the same name instead of starting one.
+        :param start_time: Custom start time; default is current timestamp.
+        :param description: Optional description.
+        :param attributes: Optional attributes list or dict.
+        :param rerun: Rerun flag.
+        :param rerun_of: UUID of a launch to rerun.
+        :return: Launch UUID.
+        """
+        if last_launch_connect:
+            uuid = await self.get_last_launch_uuid(by_name=name)
+            if uuid:
+                self.connect(launch_uuid=uuid)
+                return uuid
+
+        _uuid = await self.rp_client.start_launch(
+            name=name,
+            start_time=start_time or timestamp(),
+            description=description,
+            attributes=attributes or {},
+            rerun=rerun,
+            rerun_of=rerun_of,
+            **kwargs
+        )
+        self.__uuid = _uuid
+        self.__id = None
+        return _uuid
+
+    async def finish(
+        self,
+        end_time: Optional[str] = None,
+        status: Optional[str] = "PASSED",
+        attributes: Optional[Union[list, dict]] = None,
+        **kwargs: Any
+    ) -> None:
+        """Finish active launch and close the HTTP session.
+
+        :param end_time: Custom end time; default is current timestamp.
+        :param status: Final launch status.
+        :param attributes: Optional attributes.
+        """
+        if self.__uuid is None:
+            raise RuntimeError("No active launch to finish.")
+
+        await self._flush_log_policy()
+        await self.rp_client.finish_launch(
+            self.__uuid,
+            end_time or timestamp(),
+            status=status,
+            attributes=attributes or {},
+            **kwargs
+        )
+        self.__id = None
+        self.__uuid = None
+        await self.rp_client.close()
+
+    async def _flush_log_policy(self) -> None:
+        """Send log policy entries still held back for the launch and its items and release their state."""
+        if self.log_policy is None:
+            return
+
+        for key, entries in self.log_policy.flush_all().items():
+            for message, level, log_time in entries:
+                await self.rp_client.send_log(
+                    message=message,
+                    launch_uuid=self.__uuid,
+                    time=log_time or timestamp(),
+                    level=level,
+                    item_uuid=None if key == self.__uuid else key
+                )
+
+    async def close(self) -> None:
+        """Close the HTTP session without finishing the launch."""
+        await self.rp_client.close()
+
+    async def get_info(self, uuid: str = None, cache: bool = True, ttl: int = None) -> dict | None:
+        """Get launch info by UUID.
+
+        :param uuid: Launch UUID; defaults to the active launch.
+        :param cache: Use cache.
+        :param ttl: Cache TTL in seconds.
+        :return: Launch info dictionary or None.
+        """
+        return await self.rp_client.get_info(item_type=self.item_type, uuid=uuid or self.uuid, cache=cache, ttl=ttl)
+
+    async def get_launch_id_by_uuid(self, uuid: str, cache: bool = True, ttl: int = None) -> str | None:
+        """Get launch ID by UUID.
+
+        :param uuid: Launch UUID.
+        :param cache: Use cache.
+        :param ttl: Cache TTL in seconds.
+        :return: Launch ID or None.
+        """
+        return await self.rp_client.get_id(item_type=self.item_type, uuid=uuid, cache=cache, ttl=ttl)
+
+    async def get_last_launch_uuid(self, by_name: str = None) -> Optional[str]:
+        """Get the UUID of the last launch, optionally filtered by name.
+
+        :param by_name: Filter by launch name.
+        :return: Launch UUID or None.
+        """
+        last_launch = await self.get_last_launch(by_name=by_name)
+        return last_launch.get('uuid') if last_launch else None
+
+    async def get_last_launch(self, by_name: str = None, status: str = None) -> dict | None:
+        """Get the last launch entity by optional filters.
+
+        :param by_name: Optional name filter.
+        :param status: Optional status filter.
+        :return: Launch dict or None.
+        """
+        launches = await self.get_launches(by_name=by_name, status=status)
+        return launches[-1] if launches else None
+
+    async def get_launches(
+            self,
+            by_name: str = None,
+            status: str = None,
+            page_size: int = 100,
+            sort: str = "start_time,desc",
+            fields: Sequence[str] = None,
+            **kwargs: Any
+    ) -> list[dict] | list[ItemRecord]:
+        """
+        List launches with optional filters.
+
+        :param by_name: Optional name filter.
+        :param status: Optional status filter.
+        :param page_size: Page size for pagination.
+        :param sort: Sort expression.
+        :param fields: Optional fields to keep; launches are returned as compact ItemRecord objects.
+        :return: List of launch dictionaries or records.
+        """
+        return await self.rp_client.get_items(
+            item_type=self.item_type,
+            page_size=page_size,
+            filter_by_name=by_name,
+            filter_by_status=status,
+            sort=sort,
+            fields=fields,
+            **kwargs
+        )
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from ..client.config import Config
+from ..utils import LogPolicy
+from .launcher import AsyncLauncher
+from .step import AsyncStep
+from .suite import AsyncSuite
+from .test import AsyncTest
+from .test_item import AsyncTestItem
+
+
+class AsyncReportPortal:
+    """
+    Asyncio facade for interacting with ReportPortal entities.
+
+    All helpers share one aiohttp connection pool, so thousands of items can be
+    reported concurrently from one event loop.
+
+    :param project_name: ReportPortal project name.
+    :param config_path: Path to JSON config file; defaults to user config.
+    :param log_policy: Optional deduplication/sampling/budget policy for item logs.
+    :param max_connections: Max open connections shared by all concurrent calls.
+    """
+
+    def __init__(
+        self,
+        project_name: str,
+        config_path: str = None,
+        log_policy: LogPolicy = None,
+        max_connections: int = 50
+    ):
+        self.project_name = project_name
+        self.config = Config(config_path=config_path)
+        self.__launcher = AsyncLauncher(
+            config=self.config,
+            project_name=self.project_name,
+            log_policy=log_policy,
+            max_connections=max_connections
+        )
+
+    async def __aenter__(self) -> "AsyncReportPortal":
+        return self
+
+    async def __aexit__(self, *_):
+        await self.__launcher.close()
+
+    @property
+    def launch(self) -> AsyncLauncher:
+        """
+        Get the launch manager instance.
+
+        :return: AsyncLauncher instance.
+        """
+        return self.__launcher
+
+    def get_test(self) -> AsyncTest:
+        """Get an AsyncTest helper bound to the current launcher.
+
+        :return: AsyncTest instance.
+        """
+        return AsyncTest(self.__launcher)
+
+    def get_suite(self) -> AsyncSuite:
+        """Get an AsyncSuite helper bound to the current launcher.
+
+        :return: AsyncSuite instance.
+        """
+        return AsyncSuite(self.__launcher)
+
+    def get_step(self) -> AsyncStep:
+        """Get an AsyncStep helper bound to the current launcher.
+
+        :return: AsyncStep instance.
+        """
+        return AsyncStep(self.__launcher)
+
+    def get_test_item(self, item_type: str = "TEST") -> AsyncTestItem:
+        """Create an AsyncTestItem helper for a specific item type.
+
+        :param item_type: Item type name like 'TEST', 'STEP', 'SUITE'.
+        :return: New AsyncTestItem instance bound to the current launcher.
+        """
+        return AsyncTestItem(self.__launcher, item_type=item_type)
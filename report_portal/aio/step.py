@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+from .launcher import AsyncLauncher
+from .test_item import AsyncTestItem
+
+
+class AsyncStep(AsyncTestItem):
+    """Represents a step item in ReportPortal."""
+
+    def __init__(self, launcher: AsyncLauncher):
+        super().__init__(launcher=launcher, item_type="STEP")
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+from .launcher import AsyncLauncher
+from .test_item import AsyncTestItem
+
+
+class AsyncTest(AsyncTestItem):
+
+    def __init__(self, launcher: AsyncLauncher):
+        super().__init__(launcher=launcher, item_type="TEST")
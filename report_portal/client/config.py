@@ -17,6 +17,16 @@ class Config:
         self.endpoint = self.__config['endpoint']
         self.api_key = self.__config['api_key']
         self.api_version = self.__config.get('api_version', None)
+        self.circuit_breaker = self.__config.get('circuit_breaker', None)
+        self.http_timeout = self._get_http_timeout()
+        self.cache = self.__config.get('cache', None)
+        self.transport = self.__config.get('transport', None)
+        self.compression = self.__config.get('compression', None)
+
+    def _get_http_timeout(self) -> float | tuple | None:
+        """Read 'http_timeout' as seconds or a [connect, read] pair."""
+        http_timeout = self.__config.get('http_timeout', None)
+        return tuple(http_timeout) if isinstance(http_timeout, list) else http_timeout
 
     def _load_config(self, json_path: str) -> Dict[str, Any]:
         """Load the configuration from a JSON file.
@@ -1,20 +1,27 @@
 # -*- coding: utf-8 -*-
-from typing import Optional, Union, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union, Any, Sequence, Iterable
 
 from reportportal_client import RPClient
-from reportportal_client.core.rp_requests import HttpRequest
-from reportportal_client.helpers import verify_value_length
+from reportportal_client.core.rp_requests import HttpRequest, ItemFinishRequest, RPRequestLog
+from reportportal_client.core.rp_issues import Issue
+from reportportal_client.helpers import verify_value_length, dict_to_payload
 
+from .circuit_breaker import BreakerSession
 from .url_parts import UrlParts
+from .records import ItemRecord, project
 from .rp_requests import ReportPortalRequests
 from ..config import Config
-from ...utils import cacheable
+from ...utils import cacheable, traced, Cache, Tracer, TracedSession
 
 
 class RPClientAdvanced(RPClient):
 
     def __init__(self, config: Config, project_name: str, launch_uuid: str = None, **kwargs):
         self.config = config
+        if self.config.http_timeout is not None:
+            kwargs.setdefault('http_timeout', self.config.http_timeout)
         super().__init__(
             endpoint=self.config.endpoint,
             project=project_name,
@@ -22,15 +29,38 @@ class RPClientAdvanced(RPClient):
             launch_uuid=launch_uuid,
             **kwargs
         )
-        self.requests = ReportPortalRequests(config=self.config, session=self.session)
+        self.requests = ReportPortalRequests(config=self.config, session=self.session, verify_ssl=self.verify_ssl)
+        # Calls made by RPClient itself (item start/finish, launch start/finish) get 'http' spans here
+        # and are counted by the circuit breaker; ReportPortalRequests keeps the plain session for its own
+        self.session = TracedSession(BreakerSession(self.session, self.requests))
+        for namespace, policy in (self.config.cache or {}).items():
+            Cache().configure(namespace, **policy)
         self.url_parts = UrlParts(project_name=self.project)
 
+    def start_test_item(self, name: str, start_time: str, item_type: str, *args: Any, **kwargs: Any) -> Optional[str]:
+        """Start Test Item, unless the circuit breaker is open.
+
+        :return: Test Item UUID, or None if the start failed or was skipped.
+        """
+        if not self.requests.allow_request("start_test_item"):
+            return None
+
+        return super().start_test_item(name, start_time, item_type, *args, **kwargs)
+
+    def _log(self, batch: Optional[list[RPRequestLog]]) -> Optional[tuple[str, ...]]:
+        """Send a batch of logs, unless the circuit breaker is open; a skipped batch is dropped."""
+        if batch and not self.requests.allow_request(f"log batch of {len(batch)} entries"):
+            return None
+
+        return super()._log(batch)
+
     def update_test_item(
         self,
         item_uuid: str,
         attributes: Optional[Union[list, dict]] = None,
         description: Optional[str] = None,
         status: Optional[str] = None,
+        deadline: Optional[float] = None,
         **kwargs: Any
     ) -> Optional[str]:
         """Update existing Test Item at the ReportPortal.
@@ -39,35 +69,156 @@ class RPClientAdvanced(RPClient):
         :param item_uuid:   Test Item UUID returned on the item start.
         :param attributes:  Test Item attributes: [{'key': 'k_name', 'value': 'k_value'}, ...].
         :param description: Test Item description.
-        :return:            Response message or None.
+        :param deadline:    Optional total seconds for the call, including the item ID lookup.
+        :return:            Response message, or None if the update failed or was rejected.
         """
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
         data = {}
 
         _params = {
             "description": description,
-            "attributes": verify_value_length(attributes) if self.truncate_attributes else attributes,
+            "attributes": verify_value_length(attributes) if attributes and self.truncate_attributes else attributes,
             "status": status,
             **kwargs
         }
 
         data.update({key: value for key, value in _params.items() if value is not None})
 
-        item_id = self.get_item_id_by_uuid(item_uuid=item_uuid)
+        item_id = self.get_item_id_by_uuid(item_uuid=item_uuid, deadline=deadline)
+        if item_id is None:
+            print(f"|ERROR| Cannot update item {item_uuid}: its ID was not found")
+            return None
+
+        timeout = self.requests.call_timeout(deadline_at) if deadline_at is not None else self.http_timeout
+        if timeout is None:
+            print(f"|WARNING| Deadline exceeded, skipping update of item {item_uuid}")
+            return None
+
+        if not self.requests.allow_request(f"update of item {item_uuid}"):
+            return None
 
         url = self.requests.uri_join(self.base_url_v1, "item", item_id, "update")
+        compression = self.requests.compression
         response = HttpRequest(
-            self.session.put,
+            compression.wrap(self.session.put, endpoint="item") if compression else self.session.put,
             url=url,
             json=data,
             verify_ssl=self.verify_ssl,
-            http_timeout=self.http_timeout,
+            http_timeout=timeout,
             name="update_test_item",
         ).make()
+        if not response or not response.is_success:
+            # The server may have applied part of the update or none of it; the next read asks it again
+            self._get_item_info.cache_delete(self, uuid=item_uuid)
+            return None
+
+        self._write_through_item_info(item_uuid=item_uuid, data=data)
+        return response.message
+
+    def finish_test_item(
+        self,
+        item_id: Any,
+        end_time: str,
+        status: Optional[str] = None,
+        issue: Optional[Issue] = None,
+        attributes: Optional[Union[list, dict]] = None,
+        description: Optional[str] = None,
+        retry: Optional[bool] = False,
+        test_case_id: Optional[str] = None,
+        retry_of: Optional[str] = None,
+        remove_current: bool = True,
+        **kwargs: Any
+    ) -> Optional[str]:
+        """Finish Test Item and drop its cached info and its launch's cached item listings.
+
+        Unlike RPClient.finish_test_item, a request the server rejects returns None
+        instead of the error message, so callers can tell it from a finished item.
+
+        :param item_id: Test Item UUID.
+        :param remove_current: Pop the client's current item on success; pass False for items
+            this client did not start, such as ones found on the server.
+        :return: Response message, or None if the finish failed or was rejected.
+        """
+        if not item_id:
+            print("|WARNING| Attempt to finish non-existent item")
+            return None
+
+        if not self.requests.allow_request(f"finish of item {item_id}"):
+            return None
+
+        url = self.requests.uri_join(self.base_url_v2, "item", item_id)
+        payload = ItemFinishRequest(
+            end_time=self._convert_time(end_time),
+            launch_uuid=self.launch_uuid,
+            status=status,
+            attributes=attributes,
+            truncate_attributes_enabled=self.truncate_attributes,
+            truncate_fields_enabled=self.truncate_fields,
+            replace_binary_characters=self.replace_binary_chars,
+            description=description,
+            is_skipped_an_issue=self.is_skipped_an_issue,
+            issue=issue,
+            retry=retry,
+            test_case_id=test_case_id,
+            retry_of=retry_of,
+        ).payload
+        response = HttpRequest(
+            self.session.put,
+            url=url,
+            json=payload,
+            verify_ssl=self.verify_ssl,
+            http_timeout=self.http_timeout,
+            name="finish_test_item",
+        ).make()
+        self._get_item_info.cache_delete(self, uuid=item_id)
+        self._invalidate_launch_listings()
         if not response:
             return None
 
+        if not response.is_success:
+            print(f"|ERROR| Failed to finish item {item_id}\nError: {response.message}")
+            return None
+
+        if remove_current:
+            self._remove_current_item()
         return response.message
 
+    def finish_launch(
+        self,
+        end_time: str,
+        status: Optional[str] = None,
+        attributes: Optional[Union[list, dict]] = None,
+        **kwargs: Any
+    ) -> Optional[str]:
+        """Finish launch and drop its cached info, its item listings and launch listings."""
+        message = super().finish_launch(end_time=end_time, status=status, attributes=attributes, **kwargs)
+        if self.launch_uuid:
+            self._invalidate_launch_listings()
+            self._get_launch_info.cache_delete(self, uuid=self.launch_uuid)
+        Cache().invalidate_tag("launches")
+        return message
+
+    def _write_through_item_info(self, item_uuid: str, data: dict) -> None:
+        """Apply an item update to its cached info instead of dropping it."""
+        cached = self._get_item_info.cache_get(self, uuid=item_uuid)
+        if cached is not None:
+            info = dict(cached)
+            info.update(data)
+            if isinstance(info.get('attributes'), dict):
+                info['attributes'] = dict_to_payload(info['attributes'])
+            self._get_item_info.cache_set(self, info, uuid=item_uuid)
+
+        self._invalidate_launch_listings()
+
+    def _invalidate_launch_listings(self) -> None:
+        """Drop cached item listing pages of the current launch."""
+        if not self.launch_uuid:
+            return
+
+        launch_id = self.get_id(item_type='launch', uuid=self.launch_uuid)
+        if launch_id is not None:
+            Cache().invalidate_tag(f"items:{launch_id}")
+
     def send_log(
             self,
             message: str,
@@ -75,6 +226,7 @@ class RPClientAdvanced(RPClient):
             time: str,
             item_uuid: str = None,
             level="INFO",
+            deadline: float = None,
     ) -> Optional[dict]:
         base_data = {
             "launchUuid": launch_uuid,
@@ -88,25 +240,66 @@ class RPClientAdvanced(RPClient):
         }
 
         base_data.update({key: value for key, value in addiction_param.items() if value is not None})
-        return self.requests.post(url_parts=self.url_parts.log, data=base_data)
+        return self.requests.post(url_parts=self.url_parts.log, data=base_data, deadline=deadline, spool=True)
 
-    def get_item_id_by_uuid(self, item_uuid: str) -> Optional[str]:
+    def get_item_id_by_uuid(self, item_uuid: str, deadline: float = None) -> Optional[str]:
         """Get Test Item ID by the given Item UUID.
 
         :param item_uuid: String UUID returned on the Item start.
+        :param deadline:  Optional total seconds for the lookup.
         :return:          Test Item ID.
         """
-        return self.get_id(item_type='test_item', uuid=item_uuid, cache=True, ttl=None)
+        return self.get_id(item_type='test_item', uuid=item_uuid, cache=True, ttl=None, deadline=deadline)
 
-    @cacheable()
-    def get_info(self, item_type: str, uuid: str, cache: bool = True, ttl: int = None) -> dict | None:
-        return self.requests.get(f"{self._get_url_parts(item_type)}/uuid/{uuid}", cache=cache, ttl=ttl)
-
-    def get_id(self, item_type: str, uuid: str, cache: bool = True, ttl: int = None) -> str | None:
-        info = self.get_info(item_type=item_type, uuid=uuid, cache=cache, ttl=ttl)
+    def get_info(
+            self,
+            item_type: str,
+            uuid: str,
+            cache: bool = True,
+            ttl: int = None,
+            deadline: float = None
+    ) -> dict | None:
+        return self._info_method(item_type)(uuid=uuid, cache=cache, ttl=ttl, deadline=deadline)
+
+    def _info_method(self, item_type: str):
+        if self._get_url_parts(item_type) == self.url_parts.launch:
+            return self._get_launch_info
+        return self._get_item_info
+
+    @cacheable(namespace="launch_info", key=lambda self, uuid, **_: uuid)
+    def _get_launch_info(self, uuid: str, cache: bool = True, ttl: int = None, deadline: float = None) -> dict | None:
+        return self.requests.fetch(f"{self.url_parts.launch}/uuid/{uuid}", deadline=deadline)
+
+    @cacheable(namespace="item_info", key=lambda self, uuid, **_: uuid)
+    def _get_item_info(self, uuid: str, cache: bool = True, ttl: int = None, deadline: float = None) -> dict | None:
+        return self.requests.fetch(f"{self.url_parts.test_item}/uuid/{uuid}", deadline=deadline)
+
+    def cache_infos(self, item_type: str, infos: Iterable[dict], ttl: int = None) -> int:
+        """Store already fetched launch or item entities as get_info results.
+
+        :param item_type: Entity type of the infos.
+        :param infos: Raw entity dictionaries, e.g. from get_items.
+        :param ttl: Cache TTL in seconds.
+        :return: Number of cached entities.
+        """
+        info_method = self._info_method(item_type)
+        count = 0
+        for info in infos:
+            if info.get('uuid'):
+                info_method.cache_set(self, info, uuid=info['uuid'], ttl=ttl)
+                if info.get('id') is not None:
+                    self.get_id.cache_set(self, info['id'], item_type=item_type, uuid=info['uuid'], ttl=ttl)
+                count += 1
+
+        return count
+
+    @cacheable(namespace="uuid_id", key=lambda self, item_type, uuid, **_: (self._get_url_parts(item_type), uuid))
+    def get_id(self, item_type: str, uuid: str, cache: bool = True, ttl: int = None, deadline: float = None) -> str | None:
+        info = self.get_info(item_type=item_type, uuid=uuid, cache=cache, ttl=ttl, deadline=deadline)
         return info.get('id') if info else None
 
 
+    @traced("get_items", lambda self, item_type, *args, **kwargs: {"item_type": item_type.upper()})
     def get_items(
             self,
             item_type: str,
@@ -120,10 +313,24 @@ class RPClientAdvanced(RPClient):
             interval: float = 0.5,
             sort: str = None,
             cache: bool = False,
-            ttl: int = None
-    ) -> list[dict]:
+            ttl: int = None,
+            fields: Sequence[str] = None,
+            max_workers: int = 1,
+            deadline: float = None
+    ) -> list[dict] | list[ItemRecord] | None:
+        """List launches or test items page by page.
+
+        :param fields: Optional field names (or dotted paths) to keep. When set, every page is
+                       projected into compact ItemRecord objects as soon as it is received,
+                       so raw JSON for the whole listing is never held in memory.
+        :param max_workers: Pages fetched concurrently once the page count is known from the first page.
+        :param deadline: Optional total seconds for the whole listing; pages left when it expires are not fetched.
+        :return: List of raw item dictionaries, or ItemRecord objects if fields are given; None if the first
+                 page could not be fetched, e.g. while the circuit breaker is open, so an empty listing can
+                 be told from a failed one.
+        """
         items = []
-        page = 1
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
 
         _params = {
             "page.size": page_size,
@@ -140,27 +347,43 @@ class RPClientAdvanced(RPClient):
 
         _params.update({ key: value for key, value in filters.items() if value is not None })
 
-        while True:
-            _params["page.page"] = page
-            data = self.requests.get(
-                url_parts=self._get_url_parts(item_type),
-                params=_params,
-                max_retries=max_retries,
-                interval=interval,
-                cache=cache,
-                ttl=ttl
-            )
-
-            if not data:
-                break
-
+        def get_page(page: int) -> dict | None:
+            with Tracer().span("get_items.page", page=page) as span:
+                data = self.requests.get(
+                    url_parts=self._get_url_parts(item_type),
+                    params={**_params, "page.page": page},
+                    max_retries=max_retries,
+                    interval=interval,
+                    cache=cache,
+                    ttl=ttl,
+                    deadline=deadline_at - time.monotonic() if deadline_at is not None else None
+                )
+                span.set("items", len(data.get("content", [])) if data else 0)
+                return data
+
+        def add_page(data: dict) -> None:
             page_content = data.get("content", [])
-            items.extend(page_content)
+            items.extend(project(page_content, fields) if fields else page_content)
 
-            if page > data.get("page", {}).get("totalPages", 1):
-                break
+        data = get_page(1)
+        if not data:
+            return None
+
+        add_page(data)
+        pages = range(2, data.get("page", {}).get("totalPages", 1) + 1)
 
-            page += 1
+        if max_workers > 1 and len(pages) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for data in executor.map(Tracer().wrap(get_page), pages):
+                    if not data:
+                        break
+                    add_page(data)
+        else:
+            for page in pages:
+                data = get_page(page)
+                if not data:
+                    break
+                add_page(data)
 
         return items
 
@@ -1,2 +1,4 @@
 # -*- coding: utf-8 -*-
 from .RPClient_advanced import RPClientAdvanced
+from .records import ItemRecord, record_type
+from .transport import Transport, RequestsTransport, Http2Transport, TransportError
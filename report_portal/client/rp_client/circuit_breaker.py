@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class CircuitBreaker:
+    """Track ReportPortal health and stop calling it while it is failing.
+
+    The breaker opens after ``failure_threshold`` consecutive failures, where a call
+    slower than ``latency_threshold`` also counts as a failure. While open, calls are
+    rejected without touching the network. After ``reset_timeout`` seconds a single
+    probe call is let through: success closes the breaker, failure opens it again.
+
+    Calls made through ReportPortalRequests are guarded, and so are item start, finish,
+    update and batched logs of RPClientAdvanced. Launch start and finish are never
+    skipped, but their outcome is still counted.
+
+    :param failure_threshold: Consecutive failures that open the breaker.
+    :param latency_threshold: Optional call duration in seconds treated as a failure.
+    :param reset_timeout: Seconds to stay open before probing.
+    :param spool_size: Max write calls kept while open and replayed on close.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+            self,
+            failure_threshold: int = 5,
+            latency_threshold: Optional[float] = None,
+            reset_timeout: float = 30.0,
+            spool_size: int = 1000,
+    ):
+        self.failure_threshold = failure_threshold
+        self.latency_threshold = latency_threshold
+        self.reset_timeout = reset_timeout
+        self.spool_size = spool_size
+        self.state = self.CLOSED
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a call may be sent now.
+
+        :return: True if the call may go to the server.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self, latency: float = 0.0) -> bool:
+        """Register a completed call.
+
+        :param latency: Call duration in seconds.
+        :return: True if this call closed the breaker.
+        """
+        if self.latency_threshold is not None and latency > self.latency_threshold:
+            self.record_failure()
+            return False
+
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                print("|INFO| ReportPortal is reachable again, circuit breaker closed")
+                return True
+
+            return False
+
+    def record_failure(self) -> None:
+        """Register a failed or too slow call."""
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+                if self.state == self.CLOSED:
+                    print(
+                        f"|WARNING| ReportPortal failed {self.failures} times in a row, "
+                        f"circuit breaker opened for {self.reset_timeout}s"
+                    )
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class BreakerSession:
+    """Proxy of a requests-style session that reports the outcome of every call to the circuit breaker.
+
+    Calls are not skipped here; RPClientAdvanced checks the breaker before the calls it may skip.
+    Connection errors, including retries exhausted on 5xx or 429, count as failures.
+
+    :param session: Session with get, post and put methods, e.g. the RPClient one.
+    :param requests: ReportPortalRequests holding the circuit breaker.
+    """
+
+    def __init__(self, session: Any, requests: Any):
+        self.session = session
+        self.requests = requests
+
+    def get(self, url, **kwargs):
+        return self._send(self.session.get, url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._send(self.session.post, url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._send(self.session.put, url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def _send(self, send: Callable, url, **kwargs):
+        started = time.monotonic()
+        try:
+            response = send(url, **kwargs)
+        except IOError:
+            self.requests.record_outcome(None, latency=time.monotonic() - started)
+            raise
+
+        self.requests.record_outcome(response, latency=time.monotonic() - started)
+        return response
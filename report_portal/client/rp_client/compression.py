@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import threading
+import zlib
+from typing import Any, Callable, Optional, Union
+
+
+def endpoint_name(url_parts: str) -> str:
+    """Endpoint name of a path relative to the API base url, e.g. 'project/log' -> 'log'."""
+    parts = url_parts.strip("/").split("/")
+    return parts[1] if len(parts) > 1 else parts[0]
+
+
+class RequestCompression:
+    """Opt-in gzip/deflate compression of JSON request bodies.
+
+    Bodies smaller than ``min_size`` bytes are sent as is. If the server answers
+    415 Unsupported Media Type to a compressed body, the request is resent
+    uncompressed and compression stays off for that endpoint.
+
+    :param encoding: 'gzip' or 'deflate'.
+    :param min_size: Min serialized body size in bytes to compress.
+    :param level: Compression level 1-9.
+    :param endpoints: Optional per-endpoint settings, e.g. {"log": True, "item": {"min_size": 4096}};
+                      when given, only listed endpoints are compressed.
+    """
+
+    encodings = {
+        "gzip": lambda body, level: gzip.compress(body, compresslevel=level, mtime=0),
+        "deflate": lambda body, level: zlib.compress(body, level),
+    }
+
+    def __init__(
+            self,
+            encoding: str = "gzip",
+            min_size: int = 1024,
+            level: int = 6,
+            endpoints: Optional[dict[str, Union[bool, dict]]] = None
+    ):
+        self.default = self._settings(encoding=encoding, min_size=min_size, level=level)
+        self.endpoints = {
+            name: self._settings(**{**self.default, **settings}) if isinstance(settings, dict) else settings
+            for name, settings in (endpoints or {}).items()
+        }
+        self.restricted = endpoints is not None
+        self.stats: dict[str, dict] = {}
+        self._rejected = set()
+        self._lock = threading.Lock()
+
+    def encode(self, endpoint: str, payload: Any) -> tuple[bytes, dict]:
+        """Serialize a JSON payload and compress it if the endpoint settings allow.
+
+        :param endpoint: Endpoint name, e.g. 'log' or 'item'.
+        :param payload: JSON-serializable payload.
+        :return: (body, headers) with Content-Type and, if compressed, Content-Encoding.
+        """
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        size = len(body)
+
+        settings = self._endpoint_settings(endpoint)
+        if settings and size >= settings['min_size']:
+            body = self.encodings[settings['encoding']](body, settings['level'])
+            headers["Content-Encoding"] = settings['encoding']
+
+        self._record(endpoint, size, len(body), compressed="Content-Encoding" in headers)
+        return body, headers
+
+    def reject(self, endpoint: str) -> None:
+        """Turn compression off for an endpoint that does not accept compressed bodies."""
+        with self._lock:
+            if endpoint in self._rejected:
+                return
+            self._rejected.add(endpoint)
+        print(f"|WARNING| Server rejected compressed body for '{endpoint}', sending it uncompressed")
+
+    def wrap(self, send: Callable, endpoint: str) -> Callable:
+        """Wrap a ``requests``-style method (session.put, session.post) to send compressed JSON.
+
+        :param send: Method called as send(url, json=..., **kwargs).
+        :param endpoint: Endpoint name used for settings and stats.
+        :return: Method with the same signature.
+        """
+        def _send(url, json: Any = None, headers: Optional[dict] = None, data: Any = None, **kwargs):
+            if json is None:
+                return send(url, data=data, headers=headers, **kwargs)
+
+            body, _headers = self.encode(endpoint, json)
+            response = send(url, data=body, headers={**(headers or {}), **_headers}, **kwargs)
+            if response.status_code == 415 and "Content-Encoding" in _headers:
+                self.reject(endpoint)
+                response = send(url, json=json, headers=headers, **kwargs)
+            return response
+
+        return _send
+
+    def summary(self) -> dict:
+        """Payload bytes before and after compression per endpoint."""
+        with self._lock:
+            return {
+                endpoint: {
+                    **stats,
+                    "ratio": round(stats['bytes_after'] / stats['bytes_before'], 3) if stats['bytes_before'] else None
+                }
+                for endpoint, stats in self.stats.items()
+            }
+
+    def _endpoint_settings(self, endpoint: str) -> Optional[dict]:
+        if endpoint in self._rejected:
+            return None
+
+        settings = self.endpoints.get(endpoint, not self.restricted)
+        if settings is True:
+            return self.default
+        return settings or None
+
+    def _record(self, endpoint: str, before: int, after: int, compressed: bool) -> None:
+        with self._lock:
+            stats = self.stats.setdefault(
+                endpoint, {"requests": 0, "compressed": 0, "bytes_before": 0, "bytes_after": 0}
+            )
+            stats['requests'] += 1
+            stats['compressed'] += int(compressed)
+            stats['bytes_before'] += before
+            stats['bytes_after'] += after
+
+    def _settings(self, encoding: str, min_size: int, level: int) -> dict:
+        _encoding = encoding.lower()
+        if _encoding not in self.encodings:
+            raise ValueError(f"Invalid compression encoding: {_encoding}. Must be one of {list(self.encodings)}.")
+
+        return {"encoding": _encoding, "min_size": min_size, "level": level}
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
+
+
+class ItemRecord:
+    """Compact read-only record built from a projected ReportPortal entity.
+
+    Concrete record types are generated by :func:`record_type` with one slot per
+    requested field, so instances carry no per-object ``__dict__``. Dotted field
+    paths (``statistics.executions.total``) are stored under the attribute name
+    with dots replaced by underscores. Dict-style ``record['field']`` and
+    ``record.get('field')`` access is kept for compatibility with raw JSON items.
+    """
+
+    __slots__ = ()
+    _fields: tuple = ()
+    _paths: tuple = ()
+
+    def __init__(self, *values: Any):
+        for name, value in zip(self._fields, values):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ItemRecord":
+        """Build a record from a raw JSON entity, dropping unrequested fields.
+
+        :param data: Raw entity dictionary returned by ReportPortal.
+        :return: Record instance with the projected fields.
+        """
+        return cls(*(_extract(data, path) for path in cls._paths))
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key.replace('.', '_'))
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key.replace('.', '_'), default)
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __iter__(self):
+        return (getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ItemRecord):
+            return NotImplemented
+        return self._fields == other._fields and tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash((self._fields, tuple(self)))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        return _rebuild, (self._paths, tuple(self))
+
+
+@lru_cache(maxsize=None)
+def _record_type(paths: tuple) -> type:
+    fields = tuple(path.replace('.', '_') for path in paths)
+    if len(set(fields)) != len(fields):
+        raise ValueError(f"Duplicate record fields: {paths}")
+
+    return type(
+        "ItemRecord",
+        (ItemRecord,),
+        {"__slots__": fields, "_fields": fields, "_paths": paths}
+    )
+
+
+def record_type(fields: Iterable[str]) -> type:
+    """Return the cached record class for the given field projection.
+
+    :param fields: Field names or dotted paths to keep, e.g. ('id', 'uuid', 'statistics.executions.total').
+    :return: ItemRecord subclass with one slot per field.
+    """
+    return _record_type(tuple(fields))
+
+
+def project(items: Iterable[dict], fields: Sequence[str]) -> list[ItemRecord]:
+    """Convert raw JSON entities into compact records holding only the given fields.
+
+    :param items: Raw entity dictionaries.
+    :param fields: Field names or dotted paths to keep.
+    :return: List of records.
+    """
+    from_dict = record_type(fields).from_dict
+    return [from_dict(item) for item in items]
+
+
+def _extract(data: dict, path: str) -> Any:
+    if '.' not in path:
+        return data.get(path)
+
+    value = data
+    for part in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+
+    return value
+
+
+def _rebuild(paths: tuple, values: tuple) -> ItemRecord:
+    return _record_type(paths)(*values)
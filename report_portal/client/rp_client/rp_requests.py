@@ -1,26 +1,67 @@
 # -*- coding: utf-8 -*-
+import threading
 import time
 import requests
 
-from typing import Optional
+from collections import deque
+from typing import Optional, Any, Union, Callable
 
+from .circuit_breaker import CircuitBreaker
+from .compression import RequestCompression, endpoint_name
+from .transport import Transport, TransportError, create_transport
 from ..config import Config
-from ...utils import singleton, cacheable
+from ...utils import singleton, cacheable, Tracer
+from ...utils.cache import NOT_FOUND
+from ...utils.decorators import _freeze
+from ...utils.tracing import record_request, record_response
+
+
+def listing_tags(_, url_parts: str, params: dict = None, *args, **kwargs) -> tuple:
+    """Cache tags for listing pages: 'items:<launch id>' for item pages, 'launches' for launch pages."""
+    launch_id = (params or {}).get("filter.eq.launchId")
+    if launch_id is not None:
+        return (f"items:{launch_id}",)
+
+    if url_parts.rstrip("/").endswith("/launch"):
+        return ("launches",)
+
+    return ()
+
+
+def listing_key(_, url_parts: str, params: dict = None, *args, **kwargs) -> tuple:
+    """Cache key of a listing page: the path and query only, not retry or deadline settings."""
+    return "get", url_parts, _freeze(params or {})
 
 
 @singleton
 class ReportPortalRequests:
 
-    def __init__(self, config: Config, session: Optional[requests.Session] = None):
+    def __init__(
+            self,
+            config: Config,
+            session: Optional[requests.Session] = None,
+            transport: Optional[Transport] = None,
+            verify_ssl: Union[bool, str] = True
+    ):
         self.session = session or requests.Session()
         self.config = config
+        self.verify_ssl = verify_ssl
+        self.transport = transport or self._create_transport()
         self.__api_key = config.api_key
         self.__endpoint = config.endpoint
         self.api_version = self._validate_api_version(version=self.config.api_version or "v1")
         self.headers = self._get_headers()
         self.base_url = self._get_base_url()
+        self.http_timeout = self.config.http_timeout or (10, 10)
+        self.circuit_breaker = CircuitBreaker(**config.circuit_breaker) if config.circuit_breaker else None
+        self.spool = deque(maxlen=self.circuit_breaker.spool_size if self.circuit_breaker else None)
+        self.spool_dropped = 0
+        self._spool_lock = threading.Lock()
+        self._replay_thread = None
+        self._replay_lock = threading.Lock()
+        self.compression = RequestCompression(**config.compression) if config.compression else None
 
-    @cacheable()
+    @cacheable(namespace="listing", tags=listing_tags, key=listing_key)
     def get(
             self,
             url_parts: str,
@@ -28,25 +69,55 @@ class ReportPortalRequests:
             max_retries: int = 3,
             interval: float = 0.5,
             cache: bool = False,
-            ttl: int = None
+            ttl: int = None,
+            deadline: float = None
     ) -> dict | None:
-        f"""|INFO| Parameters {cache} and {ttl} for cacheable decorator"""
+        f"""|INFO| Parameters {cache} and {ttl} for cacheable decorator.
+
+        :param deadline: Optional total seconds for the call, including all retries and sleeps.
+        """
+        return self.fetch(url_parts, params=params, max_retries=max_retries, interval=interval, deadline=deadline)
+
+    def fetch(
+            self,
+            url_parts: str,
+            params: dict = None,
+            max_retries: int = 3,
+            interval: float = 0.5,
+            deadline: float = None
+    ) -> dict | object | None:
+        """GET without caching.
 
+        A 404 is not retried.
+
+        :param deadline: Optional total seconds for the call, including all retries and sleeps.
+        :return: Response JSON, NOT_FOUND if the server answered 404, or None if the call failed.
+        """
         _url = f"{self.base_url}/{url_parts}"
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
 
         for attempt in range(max_retries):
-            response = self.session.request(method="GET", url=_url, params=params or {}, headers=self.headers)
+            if not self._allow_request():
+                print(f"|WARNING| Circuit breaker is open, skipping GET {_url}")
+                return None
 
-            if response.status_code == 200:
+            response = self._request(method="GET", url=_url, deadline_at=deadline_at, params=params or {})
+
+            if response is not None and response.status_code == 200:
                 return response.json()
-            else:
+            elif response is not None and response.status_code == 404:
+                return NOT_FOUND
+            elif response is not None:
                 print(
                     f"|ERROR| Attempt {attempt + 1} failed for {_url}\n"
                     f"Status code: {response.status_code}\nError: {response.text}"
                 )
 
-                if attempt < max_retries - 1:
-                    time.sleep(interval)
+            if attempt < max_retries - 1:
+                remaining = self._remaining(deadline_at)
+                if remaining is not None and remaining <= interval:
+                    break
+                time.sleep(interval)
 
         return None
 
@@ -54,15 +125,294 @@ class ReportPortalRequests:
             self,
             url_parts: str,
             data: dict,
+            deadline: float = None,
+            spool: bool = False
     ) -> dict | None:
+        """Post JSON data.
+
+        :param url_parts: Path relative to the API base url.
+        :param data: JSON payload.
+        :param deadline: Optional total seconds for the call.
+        :param spool: Keep the post while the circuit breaker is open, or if it fails with a connection
+                      error, 5xx or 429, and replay it later; only for writes safe to send late, such as logs.
+                      Needs a configured circuit breaker.
+        :return: Response JSON or None.
+        """
+        spool = spool and self.circuit_breaker is not None
+        if not self._allow_request():
+            if spool:
+                self._spool(url_parts, data)
+            else:
+                print(f"|WARNING| Circuit breaker is open, skipping POST {url_parts}")
+            return None
+
         _url = f"{self.base_url}/{url_parts}"
-        response = self.session.request(method="POST", url=_url, json=data, headers=self.headers)
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        response = self._send_json(method="POST", url=_url, url_parts=url_parts, data=data, deadline_at=deadline_at)
+        if spool and self._failed(response):
+            self._spool(url_parts, data)
+            return None
+
+        if response is None:
+            return None
+
         if response.status_code == 200 or response.status_code == 201:
             return response.json()
         else:
             print(f"|ERROR| Post request failed for {_url}\nError: {response.text}\nStatus code: {response.status_code}")
             return None
 
+    def put(
+            self,
+            url_parts: str,
+            data: dict,
+            deadline: float = None
+    ) -> dict | list | None:
+        """Put JSON data.
+
+        :param url_parts: Path relative to the API base url.
+        :param data: JSON payload.
+        :param deadline: Optional total seconds for the call.
+        :return: Response JSON or None.
+        """
+        if not self._allow_request():
+            print(f"|WARNING| Circuit breaker is open, skipping PUT {url_parts}")
+            return None
+
+        _url = f"{self.base_url}/{url_parts}"
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        response = self._send_json(method="PUT", url=_url, url_parts=url_parts, data=data, deadline_at=deadline_at)
+        return self._json_or_none(method="PUT", url=_url, response=response)
+
+    def delete(
+            self,
+            url_parts: str,
+            params: dict = None,
+            data: dict = None,
+            deadline: float = None
+    ) -> dict | list | None:
+        """Send a DELETE request.
+
+        :param url_parts: Path relative to the API base url.
+        :param params: Optional query parameters.
+        :param data: Optional JSON payload, e.g. {"ids": [...]} for the bulk launch delete.
+        :param deadline: Optional total seconds for the call.
+        :return: Response JSON or None.
+        """
+        if not self._allow_request():
+            print(f"|WARNING| Circuit breaker is open, skipping DELETE {url_parts}")
+            return None
+
+        _url = f"{self.base_url}/{url_parts}"
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        response = self._request(method="DELETE", url=_url, deadline_at=deadline_at, params=params or {}, json=data)
+        return self._json_or_none(method="DELETE", url=_url, response=response)
+
+    @staticmethod
+    def _json_or_none(method: str, url: str, response: Any | None) -> dict | list | None:
+        if response is None:
+            return None
+
+        if response.status_code == 200 or response.status_code == 201:
+            return response.json()
+
+        print(f"|ERROR| {method} request failed for {url}\nError: {response.text}\nStatus code: {response.status_code}")
+        return None
+
+    def _send_json(self, method: str, url: str, url_parts: str, data: Any, deadline_at: float = None) -> Any | None:
+        """Send a JSON body, compressed when request compression is configured for the endpoint.
+
+        A compressed body rejected with 415 is resent uncompressed.
+        """
+        if self.compression is None:
+            return self._request(method=method, url=url, deadline_at=deadline_at, json=data)
+
+        endpoint = endpoint_name(url_parts)
+        body, headers = self.compression.encode(endpoint, data)
+        response = self._request(method=method, url=url, deadline_at=deadline_at, data=body, headers=headers)
+        if response is not None and response.status_code == 415 and "Content-Encoding" in headers:
+            self.compression.reject(endpoint)
+            response = self._request(method=method, url=url, deadline_at=deadline_at, json=data)
+        return response
+
+    def allow_request(self, name: str) -> bool:
+        """Check the circuit breaker before a call sent outside this class, e.g. by RPClient.
+
+        :param name: Call name for the warning printed when the call is skipped.
+        :return: True if the call may go to the server.
+        """
+        if self._allow_request():
+            return True
+
+        print(f"|WARNING| Circuit breaker is open, skipping {name}")
+        return False
+
+    def _allow_request(self) -> bool:
+        return self.circuit_breaker is None or self.circuit_breaker.allow()
+
+    def record_outcome(self, response: Any | None, latency: float) -> None:
+        """Report a call to the circuit breaker and replay the spool once calls succeed again.
+
+        :param response: Response of the call, or None on connection error.
+        :param latency: Call duration in seconds.
+        """
+        if self.circuit_breaker is None:
+            return
+
+        if self._failed(response):
+            self.circuit_breaker.record_failure()
+        elif self.circuit_breaker.record_success(latency=latency) or self.spool:
+            self._start_replay()
+
+    @staticmethod
+    def _failed(response: Any | None) -> bool:
+        return response is None or response.status_code >= 500 or response.status_code == 429
+
+    def _request(
+            self,
+            method: str,
+            url: str,
+            deadline_at: float = None,
+            headers: Optional[dict] = None,
+            **kwargs
+    ) -> Any | None:
+        """Send a request and report its outcome to the circuit breaker.
+
+        Connection errors, 5xx and 429 responses count as failures; other responses as successes.
+
+        :param deadline_at: Optional monotonic time the call must finish by; clips the socket timeout.
+        :param headers: Extra headers on top of the authorization header.
+        :return: Response or None on connection error or expired deadline.
+        """
+        timeout = self.call_timeout(deadline_at)
+        if timeout is None:
+            print(f"|WARNING| Deadline exceeded, skipping {method} {url}")
+            return None
+
+        started = time.monotonic()
+        with Tracer().span("http", method=method, url=url) as span:
+            record_request(span, **kwargs)
+            try:
+                response = self.transport.request(
+                    method=method,
+                    url=url,
+                    headers={**self.headers, **headers} if headers else self.headers,
+                    timeout=timeout,
+                    **kwargs
+                )
+            except TransportError as e:
+                span.set("error", str(e))
+                print(f"|ERROR| {method} request failed for {url}\nError: {e}")
+                self.record_outcome(None, latency=time.monotonic() - started)
+                return None
+            record_response(span, response)
+
+        self.record_outcome(response, latency=time.monotonic() - started)
+        return response
+
+    def call_timeout(self, deadline_at: float = None) -> float | tuple | None:
+        """Socket timeout for a call that must finish by a monotonic deadline.
+
+        :return: Timeout clipped to the remaining time, or None if the deadline has passed.
+        """
+        return self._timeout(self._remaining(deadline_at))
+
+    def _timeout(self, remaining: float | None) -> float | tuple | None:
+        """Clip the configured (connect, read) timeout to the remaining deadline time.
+
+        :return: Timeout for the request, or None if the deadline has passed.
+        """
+        if remaining is None:
+            return self.http_timeout
+
+        if remaining <= 0:
+            return None
+
+        if isinstance(self.http_timeout, (tuple, list)):
+            return tuple(min(value, remaining) for value in self.http_timeout)
+
+        return min(self.http_timeout, remaining)
+
+    @staticmethod
+    def _remaining(deadline_at: float | None) -> float | None:
+        return deadline_at - time.monotonic() if deadline_at is not None else None
+
+    def flush_spool(self, timeout: float = 30.0) -> bool:
+        """Wait for a running spool replay to finish.
+
+        :param timeout: Max seconds to wait.
+        :return: True if no replay is running anymore.
+        """
+        thread = self._replay_thread
+        if thread is None:
+            return True
+
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _start_replay(self) -> None:
+        """Replay the spool on a background thread, so the call that closed the breaker is not held up."""
+        with self._replay_lock:
+            if not self.spool or (self._replay_thread is not None and self._replay_thread.is_alive()):
+                return
+
+            self._replay_thread = threading.Thread(target=self._replay_spool, name="rp-spool-replay", daemon=True)
+            self._replay_thread.start()
+
+    def _replay_spool(self) -> None:
+        """Send write calls spooled while the circuit breaker was open, oldest first.
+
+        Replay stops, keeping the rest of the spool, when the breaker opens again or a call fails.
+        Calls rejected with a 4xx status are dropped and counted in ``spool_dropped``.
+        """
+        while self.spool:
+            try:
+                url_parts, data = self.spool.popleft()
+            except IndexError:
+                return
+
+            if not self._allow_request():
+                self._spool(url_parts, data, oldest=True)
+                return
+
+            response = self._send_json(method="POST", url=f"{self.base_url}/{url_parts}", url_parts=url_parts, data=data)
+            if self._failed(response):
+                self._spool(url_parts, data, oldest=True)
+                return
+
+            if response.status_code >= 400:
+                with self._spool_lock:
+                    self.spool_dropped += 1
+                print(
+                    f"|WARNING| Spooled POST {url_parts} rejected, dropping it\n"
+                    f"Status code: {response.status_code}\nError: {response.text}"
+                )
+
+    def _spool(self, url_parts: str, data: Any, oldest: bool = False) -> None:
+        """Keep a post for replay; a full spool evicts its entry at the other end, counted in ``spool_dropped``.
+
+        :param oldest: Put the post back at the front, as the next one to replay.
+        """
+        with self._spool_lock:
+            if self.spool.maxlen is not None and len(self.spool) >= self.spool.maxlen:
+                self.spool_dropped += 1
+            if oldest:
+                self.spool.appendleft((url_parts, data))
+            else:
+                self.spool.append((url_parts, data))
+
+    def _create_transport(self) -> Transport:
+        """Create the transport from the 'transport' config entry: a name or {"name": ..., **options}."""
+        options = self.config.transport
+        if isinstance(options, dict):
+            options = dict(options)
+            name = options.pop('name', None)
+        else:
+            name, options = options, {}
+
+        options.setdefault('verify_ssl', self.verify_ssl)
+        return create_transport(name, session=self.session, **options)
+
     def _get_base_url(self) -> str:
         return f"{self.__endpoint}/api/{self.api_version}"
 
@@ -79,6 +429,7 @@ class ReportPortalRequests:
 
         return _api_version
 
+    @staticmethod
     def uri_join(*uri_parts: str) -> str:
         """Join uri parts.
 
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Optional, Union
+
+import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class TransportError(IOError):
+    """Connection-level failure raised by a transport (refused, reset, timed out, ...)."""
+
+
+class Transport:
+    """HTTP backend used by ReportPortalRequests.
+
+    ``request`` returns an object with ``status_code``, ``text`` and ``json()``
+    and raises TransportError on connection-level failures.
+    """
+
+    name = None
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            headers: Optional[dict] = None,
+            params: Optional[dict] = None,
+            json: Optional[Any] = None,
+            data: Optional[bytes] = None,
+            timeout: Union[float, tuple, None] = None,
+    ) -> Any:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """HTTP/1.1 transport on a ``requests.Session``.
+
+    The session may also be the RPClient ``ClientSession`` wrapper, which only
+    exposes per-method calls (get, post, put); other methods go through a plain session.
+
+    :param session: Optional existing session, e.g. the RPClient one.
+    :param verify_ssl: SSL verification flag or CA bundle path.
+    """
+
+    name = "requests"
+
+    def __init__(self, session: Optional[requests.Session] = None, verify_ssl: Union[bool, str] = True):
+        self.session = session or requests.Session()
+        self.verify_ssl = verify_ssl
+        self._fallback_session = None
+
+    def request(self, method, url, headers=None, params=None, json=None, data=None, timeout=None):
+        try:
+            return self._send_method(method)(
+                url,
+                headers=headers,
+                params=params,
+                json=json,
+                data=data,
+                verify=self.verify_ssl,
+                timeout=timeout
+            )
+        except requests.RequestException as e:
+            raise TransportError(str(e)) from e
+
+    def close(self) -> None:
+        self.session.close()
+        if self._fallback_session is not None:
+            self._fallback_session.close()
+
+    def _send_method(self, method: str):
+        send = getattr(self.session, method.lower(), None)
+        if send is not None:
+            return send
+
+        if self._fallback_session is None:
+            self._fallback_session = requests.Session()
+        return getattr(self._fallback_session, method.lower())
+
+
+class Http2Transport(Transport):
+    """HTTP/2 transport on an ``httpx.Client``; concurrent calls are multiplexed over few connections.
+
+    Requires the optional ``httpx[http2]`` dependency.
+
+    :param max_connections: Max open connections.
+    :param verify_ssl: SSL verification flag or CA bundle path.
+    """
+
+    name = "http2"
+
+    def __init__(self, max_connections: int = 4, verify_ssl: Union[bool, str] = True):
+        if httpx is None:
+            raise RuntimeError("HTTP/2 transport requires 'httpx[http2]'. Install it with: pip install 'httpx[http2]'")
+
+        try:
+            self.client = httpx.Client(
+                http2=True,
+                verify=verify_ssl,
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+            )
+        except ImportError as e:
+            raise RuntimeError(f"HTTP/2 transport requires 'httpx[http2]': {e}")
+
+    def request(self, method, url, headers=None, params=None, json=None, data=None, timeout=None):
+        try:
+            return self.client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=json,
+                content=data,
+                timeout=self._timeout(timeout)
+            )
+        except httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+
+    def close(self) -> None:
+        self.client.close()
+
+    @staticmethod
+    def _timeout(timeout: Union[float, tuple, None]):
+        if isinstance(timeout, (tuple, list)):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return timeout
+
+
+def create_transport(
+        name: Optional[str],
+        session: Optional[requests.Session] = None,
+        verify_ssl: Union[bool, str] = True,
+        **options: Any
+) -> Transport:
+    """Create a transport by config name.
+
+    :param name: 'requests' (default) or 'http2'.
+    :param session: Session reused by the requests transport.
+    :param verify_ssl: SSL verification flag or CA bundle path.
+    :param options: Backend options, e.g. max_connections for 'http2'.
+    :return: Transport instance.
+    """
+    _name = (name or RequestsTransport.name).lower()
+    if _name == RequestsTransport.name:
+        return RequestsTransport(session=session, verify_ssl=verify_ssl)
+
+    if _name == Http2Transport.name:
+        return Http2Transport(verify_ssl=verify_ssl, **options)
+
+    raise ValueError(f"Invalid transport: {_name}. Must be one of ['requests', 'http2'].")
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+import threading
+from collections import defaultdict
+from typing import Optional, Sequence
+
+from .client.rp_client import ItemRecord, record_type
+
+
+IndexEntry = record_type(("id", "uuid", "name", "type", "codeRef", "testCaseId", "parentUuid", "path"))
+
+
+class LaunchItemIndex:
+    """In-memory index of a launch's test items.
+
+    Filled once from the server with :meth:`load` and kept current by :meth:`add`
+    for items started through ``TestItem.start``. Answers lookups by name, code
+    reference, test case id, parent UUID and parent path without server calls.
+    ``path`` is the tuple of ancestor names, outermost first.
+    """
+
+    load_fields = ("id", "uuid", "name", "type", "codeRef", "testCaseId", "parent", "pathNames.itemPaths")
+
+    def __init__(self):
+        self.loaded = False
+        self._by_uuid: dict[str, ItemRecord] = {}
+        self._by_name = defaultdict(list)
+        self._by_code_ref = defaultdict(list)
+        self._by_test_case_id = defaultdict(list)
+        self._by_parent = defaultdict(list)
+        self._by_path = defaultdict(list)
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_uuid)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._by_uuid
+
+    def load(self, rp_client, launch_id: str | int, page_size: int = 300, if_needed: bool = False) -> None:
+        """Load all items of a launch in one paginated pass.
+
+        Concurrent loads are serialized, so with ``if_needed`` only the first caller
+        fetches the items and the others wait for its result.
+
+        :param rp_client: RPClientAdvanced instance.
+        :param launch_id: Launch ID.
+        :param page_size: Page size for pagination.
+        :param if_needed: Skip the load if the index is already loaded.
+        """
+        with self._load_lock:
+            if if_needed and self.loaded:
+                return
+
+            records = rp_client.get_items(
+                item_type="test_item",
+                launch_id=launch_id,
+                page_size=page_size,
+                fields=self.load_fields
+            )
+            if records is None:
+                print(f"|WARNING| Failed to load items of launch {launch_id}, the index stays unloaded")
+                return
+
+            self.populate(records)
+
+    def populate(self, records: list[ItemRecord]) -> None:
+        """Fill the index with all items of a launch.
+
+        :param records: Items projected to ``load_fields``.
+        """
+        uuid_by_id = {record.id: record.uuid for record in records}
+
+        with self._lock:
+            for record in records:
+                if record.uuid in self._by_uuid:
+                    continue
+
+                path = tuple(part.get('name') for part in record.pathNames_itemPaths or [])
+                self._insert(IndexEntry(
+                    record.id,
+                    record.uuid,
+                    record.name,
+                    record.type,
+                    record.codeRef,
+                    record.testCaseId,
+                    uuid_by_id.get(record.parent),
+                    path
+                ))
+            self.loaded = True
+
+    def add(
+            self,
+            uuid: str,
+            name: str,
+            item_type: str,
+            code_ref: Optional[str] = None,
+            test_case_id: Optional[str] = None,
+            parent_uuid: Optional[str] = None,
+    ) -> ItemRecord:
+        """Register an item started in this process.
+
+        :return: Created index entry.
+        """
+        with self._lock:
+            parent = self._by_uuid.get(parent_uuid) if parent_uuid else None
+            path = parent.path + (parent.name,) if parent else ()
+            entry = IndexEntry(None, uuid, name, item_type, code_ref, test_case_id, parent_uuid, path)
+            self._insert(entry)
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self.loaded = False
+            for mapping in (
+                    self._by_uuid, self._by_name, self._by_code_ref,
+                    self._by_test_case_id, self._by_parent, self._by_path
+            ):
+                mapping.clear()
+
+    def get(self, uuid: str) -> Optional[ItemRecord]:
+        return self._by_uuid.get(uuid)
+
+    def by_name(self, name: str) -> list[ItemRecord]:
+        return list(self._by_name.get(name, ()))
+
+    def by_code_ref(self, code_ref: str) -> list[ItemRecord]:
+        return list(self._by_code_ref.get(code_ref, ()))
+
+    def by_test_case_id(self, test_case_id: str) -> list[ItemRecord]:
+        return list(self._by_test_case_id.get(test_case_id, ()))
+
+    def children(self, parent_uuid: str) -> list[ItemRecord]:
+        return list(self._by_parent.get(parent_uuid, ()))
+
+    def by_path(self, path: tuple) -> list[ItemRecord]:
+        """Find items whose ancestor names equal the given path.
+
+        :param path: Ancestor names, outermost first.
+        """
+        return list(self._by_path.get(tuple(path), ()))
+
+    def find(
+            self,
+            name: Optional[str] = None,
+            code_ref: Optional[str] = None,
+            test_case_id: Optional[str] = None,
+            parent_uuid: Optional[str] = None,
+            item_type: Optional[str] = None,
+            path: Optional[Sequence[str]] = None,
+    ) -> list[ItemRecord]:
+        """Find items matching all given criteria.
+
+        :param path: Ancestor names, outermost first; () matches top-level items.
+        :return: Matching entries in insertion order.
+        """
+        path = tuple(path) if path is not None else None
+        candidates = None
+        for mapping, key in (
+                (self._by_test_case_id, test_case_id),
+                (self._by_code_ref, code_ref),
+                (self._by_name, name),
+                (self._by_parent, parent_uuid),
+                (self._by_path, path),
+        ):
+            if key is not None:
+                candidates = mapping.get(key, ())
+                break
+
+        if candidates is None:
+            candidates = self._by_uuid.values()
+
+        return [
+            entry for entry in candidates
+            if (name is None or entry.name == name)
+            and (code_ref is None or entry.codeRef == code_ref)
+            and (test_case_id is None or entry.testCaseId == test_case_id)
+            and (parent_uuid is None or entry.parentUuid == parent_uuid)
+            and (path is None or entry.path == path)
+            and (item_type is None or (entry.type or "").upper() == item_type.upper())
+        ]
+
+    def _insert(self, entry: ItemRecord) -> None:
+        self._by_uuid[entry.uuid] = entry
+        self._by_name[entry.name].append(entry)
+        if entry.codeRef:
+            self._by_code_ref[entry.codeRef].append(entry)
+        if entry.testCaseId:
+            self._by_test_case_id[entry.testCaseId].append(entry)
+        if entry.parentUuid:
+            self._by_parent[entry.parentUuid].append(entry)
+        self._by_path[entry.path].append(entry)
@@ -1,25 +1,49 @@
 # -*- coding: utf-8 -*-
-from reportportal_client.helpers import timestamp
-from typing import  Any, Optional, Union
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from reportportal_client.helpers import timestamp, dict_to_payload
+from reportportal_client.core.rp_issues import Issue
+from typing import  Any, Callable, Iterable, Optional, Union, Sequence
 
 from .client import Client
-from .client.rp_client import RPClientAdvanced
+from .client.rp_client import RPClientAdvanced, ItemRecord
+from .client.rp_client.records import project
+from .launch_index import LaunchItemIndex
+from .utils import LogPolicy, ReportingBudget, BulkOperation, Cache, Tracer, traced
 
 
 class Launcher:
     """High-level API for managing ReportPortal launches.
 
     :param client: Configured client wrapper used to build RP client.
+    :param log_policy: Optional policy applied to logs of all items in the launch.
+    :param reporting_budget: Optional max seconds spent on reporting calls per launch.
+    :param item_reporting_budget: Optional max seconds spent on reporting calls per test item.
     """
 
     item_type = 'launch'
 
-    def __init__(self, client: Client):
+    def __init__(
+        self,
+        client: Client,
+        log_policy: Optional[LogPolicy] = None,
+        reporting_budget: Optional[float] = None,
+        item_reporting_budget: Optional[float] = None
+    ):
         """Initialize launcher instance.
 
         :param client: Configured client wrapper used to build RP client.
+        :param log_policy: Optional policy applied to logs of all items in the launch.
+        :param reporting_budget: Optional max seconds spent on reporting calls per launch.
+        :param item_reporting_budget: Optional max seconds spent on reporting calls per test item.
         """
         self.client = client
+        self.log_policy = log_policy
+        self.reporting_budget = ReportingBudget(limit=reporting_budget)
+        self.item_reporting_budget = item_reporting_budget
+        self.item_index = LaunchItemIndex()
+        self.log_handlers: list = []
         self.__RPClient = None
         self.__id = None
         self.__uuid = None
@@ -68,15 +92,58 @@ class Launcher:
         """
         self.__RPClient = self.client.create_rpclient(launch_uuid=launch_uuid)
 
-    def connect(self, launch_uuid: str) -> None:
+    def connect(
+        self,
+        launch_uuid: str,
+        prefetch: bool = False,
+        max_workers: int = 8,
+        page_size: int = 300,
+        ttl: int = None
+    ) -> None:
         """
         Connect to an existing launch by UUID.
 
         :param launch_uuid: Existing launch UUID to continue.
+        :param prefetch: Resolve the launch ID and load all launch items into the info cache
+                         and the item index in one concurrent paginated pass.
+        :param max_workers: Pages fetched concurrently during prefetch.
+        :param page_size: Page size for prefetch.
+        :param ttl: Cache TTL in seconds for prefetched infos.
         """
         self.create_client(launch_uuid=launch_uuid)
+        self.item_index.clear()
         self.__launch_connected = True
 
+        if prefetch:
+            self.prefetch(launch_uuid=launch_uuid, max_workers=max_workers, page_size=page_size, ttl=ttl)
+
+    @traced("launch.prefetch")
+    def prefetch(self, launch_uuid: str, max_workers: int = 8, page_size: int = 300, ttl: int = None) -> int:
+        """Warm up caches for an existing launch.
+
+        :param launch_uuid: Launch UUID.
+        :param max_workers: Pages fetched concurrently.
+        :param page_size: Page size.
+        :param ttl: Cache TTL in seconds for prefetched infos.
+        :return: Number of cached items.
+        """
+        self.__id = self.get_launch_id_by_uuid(uuid=launch_uuid, ttl=ttl)
+        if not self.__id:
+            return 0
+
+        items = self.rp_client.get_items(
+            item_type='test_item',
+            launch_id=self.__id,
+            page_size=page_size,
+            max_workers=max_workers
+        )
+        if items is None:
+            return 0
+
+        self.item_index.populate(project(items, self.item_index.load_fields))
+        return self.rp_client.cache_infos(item_type='test_item', infos=items, ttl=ttl)
+
+    @traced("launch.start", lambda self, name, *args, **kwargs: {"name": name})
     def start(
         self,
         name: str,
@@ -102,6 +169,7 @@ class Launcher:
         """
         start_time = start_time or timestamp()
         attributes = attributes or {}
+        self.reporting_budget.reset()
 
         if not self.__launch_connected:
             uuid = self.get_last_launch_uuid(by_name=name) if last_launch_connect else None
@@ -117,13 +185,34 @@ class Launcher:
             **kwargs
         )
         self.__uuid = _uuid
+
+        if not self.__launch_connected:
+            self.item_index.clear()
+            # A freshly created launch has no items yet, so the index is complete without loading
+            self.item_index.loaded = self.rp_client.use_own_launch and not rerun
+
         return _uuid
 
+    def load_item_index(self, page_size: int = 300, if_needed: bool = False) -> LaunchItemIndex:
+        """Load all items of the active launch into the in-memory item index.
+
+        :param page_size: Page size for pagination.
+        :param if_needed: Skip the load if the index is already loaded.
+        :return: Loaded LaunchItemIndex.
+        """
+        self.item_index.load(rp_client=self.rp_client, launch_id=self.id, page_size=page_size, if_needed=if_needed)
+        return self.item_index
+
+    @traced("launch.finish")
     def finish(
         self,
         end_time: Optional[str] = None,
         status: Optional[str] = "PASSED",
         attributes: Optional[Union[list, dict]] = None,
+        finish_items: bool = False,
+        items_status: str = "INTERRUPTED",
+        items_issue: Optional[Issue] = None,
+        max_workers: int = 8,
         **kwargs: Any
     ):
         """Finish active launch and terminate client session.
@@ -131,13 +220,26 @@ class Launcher:
         :param end_time: Custom end time; default is current timestamp.
         :param status: Final launch status.
         :param attributes: Optional attributes.
+        :param finish_items: Force-finish items left IN_PROGRESS before finishing the launch.
+        :param items_status: Status for force-finished items.
+        :param items_issue: Optional issue for force-finished items.
+        :param max_workers: Max concurrent finish requests for force-finished items.
         """
         if self.__uuid is None:
             raise RuntimeError("No active launch to finish.")
 
+        if finish_items:
+            self.finish_unfinished_items(status=items_status, issue=items_issue, max_workers=max_workers)
+
         end_time = end_time or timestamp()
         attributes = attributes or {}
 
+        # Records queued in log handlers and spooled logs still being replayed belong to this launch
+        for handler in list(self.log_handlers):
+            handler.flush()
+        self._flush_log_policy()
+        self.rp_client.requests.flush_spool()
+
         self.rp_client.finish_launch(
             end_time=end_time,
             status=status,
@@ -148,50 +250,164 @@ class Launcher:
         self.__uuid = None
         self.__launch_connected = False
         self.rp_client.terminate()
+        self._print_reporting_summary()
 
-    def get_launch_id_by_uuid(self, uuid: str, cache: bool = True, ttl: int = None) -> str | None:
+    def finish_unfinished_items(
+        self,
+        status: str = "INTERRUPTED",
+        issue: Optional[Issue] = None,
+        max_workers: int = 8,
+        page_size: int = 300
+    ) -> int:
+        """Finish all items of the active launch that are still IN_PROGRESS.
+
+        Items are finished level by level, deepest first, so children are always
+        closed before their parents; each level is finished concurrently.
+
+        :param status: Status for finished items.
+        :param issue: Optional issue for finished items.
+        :param max_workers: Max concurrent finish requests.
+        :param page_size: Page size for discovering unfinished items.
+        :return: Number of items finished.
+        """
+        items = self.rp_client.get_items(
+            item_type='test_item',
+            launch_id=self.id,
+            filter_by_status="IN_PROGRESS",
+            page_size=page_size,
+            fields=("uuid", "path")
+        )
+        if items is None:
+            print("|ERROR| Cannot finish unfinished items: failed to list them")
+            return 0
+
+        levels = defaultdict(list)
+        for item in items:
+            levels[str(item.path or "").count(".")].append(item.uuid)
+
+        end_time = timestamp()
+
+        def _finish(item_uuid: str) -> None:
+            self.rp_client.finish_test_item(
+                item_id=item_uuid, end_time=end_time, status=status, issue=issue, remove_current=False
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for depth in sorted(levels, reverse=True):
+                list(executor.map(Tracer().wrap(_finish), levels[depth]))
+
+        if items:
+            print(f"|INFO| Force-finished {len(items)} unfinished items with status {status}")
+        return len(items)
+
+    def _flush_log_policy(self) -> None:
+        """Send log policy entries still held back for the launch and its items and release their state."""
+        if self.log_policy is None:
+            return
+
+        for key, entries in self.log_policy.flush_all().items():
+            for message, level, log_time in entries:
+                self.rp_client.send_log(
+                    message=message,
+                    launch_uuid=self.__uuid,
+                    time=log_time or timestamp(),
+                    level=level,
+                    item_uuid=None if key == self.__uuid else key
+                )
+
+    def _print_reporting_summary(self) -> None:
+        """Print reporting budget usage if any calls were dropped because of it, spool losses and compression stats."""
+        summary = self.reporting_budget.summary()
+        if summary['dropped']:
+            print(
+                f"|WARNING| Reporting budget exhausted, dropped calls: {summary['dropped']}; "
+                f"reporting time: {summary['spent']}s"
+            )
+
+        requests = self.rp_client.requests
+        if requests.spool_dropped or requests.spool:
+            print(
+                f"|WARNING| Spooled posts: {requests.spool_dropped} dropped (rejected by the server or "
+                f"evicted from the full spool), {len(requests.spool)} not sent"
+            )
+
+        compression = self.rp_client.requests.compression
+        if compression is not None and compression.stats:
+            print(f"|INFO| Request compression: {compression.summary()}")
+
+    def get_launch_id_by_uuid(
+            self,
+            uuid: str,
+            cache: bool = True,
+            ttl: int = None,
+            deadline: float = None
+    ) -> str | None:
         """Get launch ID by UUID.
 
         :param uuid: Launch UUID.
         :param cache: Use cache.
         :param ttl: Cache TTL in seconds.
+        :param deadline: Optional total seconds for the lookup.
         :return: Launch ID or None.
         """
-        return self.rp_client.get_id(item_type=self.item_type, uuid=uuid, cache=cache, ttl=ttl)
+        return self.rp_client.get_id(item_type=self.item_type, uuid=uuid, cache=cache, ttl=ttl, deadline=deadline)
 
-    def get_last_launch_uuid(self, by_name: str = None, cache: bool = True, ttl: int = None) -> Optional[str]:
+    def get_last_launch_uuid(
+            self,
+            by_name: str = None,
+            cache: bool = True,
+            ttl: int = None,
+            deadline: float = None
+    ) -> Optional[str]:
         """Get the UUID of the last launch, optionally filtered by name.
 
         :param by_name: Filter by launch name.
         :param cache: Use cache.
         :param ttl: Cache TTL in seconds.
+        :param deadline: Optional total seconds for the listing.
         :return: Launch UUID or None.
         """
-        last_launch = self.get_last_launch(by_name=by_name, cache=cache, ttl=ttl)
+        last_launch = self.get_last_launch(by_name=by_name, cache=cache, ttl=ttl, deadline=deadline)
         return last_launch.get('uuid') if last_launch else None
 
-    def get_uuids_by_name(self, launch_name: str, status: str = None, cache: bool = False, ttl: int = None) -> list[str]:
+    def get_uuids_by_name(
+            self,
+            launch_name: str,
+            status: str = None,
+            cache: bool = False,
+            ttl: int = None,
+            deadline: float = None
+    ) -> list[str]:
         """Get all launch UUIDs by name and optional status.
 
         :param launch_name: Launch name to filter by.
         :param status: Optional status filter.
         :param cache: Use cache.
         :param ttl: Cache TTL in seconds.
+        :param deadline: Optional total seconds for the listing.
         :return: List of UUID strings.
         """
-        launches = self.get_launches(by_name=launch_name, status=status, cache=cache, ttl=ttl)
-        return [launch.get('uuid') for launch in launches]
+        launches = self.get_launches(by_name=launch_name, status=status, cache=cache, ttl=ttl, deadline=deadline)
+        return [launch.get('uuid') for launch in launches or []]
 
-    def get_last_launch(self, by_name: str = None, status: str = None, cache: bool = True, ttl: int = None):
+    def get_last_launch(
+            self,
+            by_name: str = None,
+            status: str = None,
+            cache: bool = True,
+            ttl: int = None,
+            deadline: float = None
+    ):
         """Get the last launch entity by optional filters.
 
         :param by_name: Optional name filter.
         :param status: Optional status filter.
         :param cache: Use cache.
         :param ttl: Cache TTL in seconds.
+        :param deadline: Optional total seconds for the listing.
         :return: Launch dict or None.
         """
-        launches = self.get_launches(by_name=by_name, status=status, cache=cache, ttl=ttl)
+        launches = self.get_launches(by_name=by_name, status=status, cache=cache, ttl=ttl, deadline=deadline)
         return launches[-1] if launches else None
 
     def get_launches(
@@ -202,8 +418,9 @@ class Launcher:
             cache: bool = False,
             ttl: int = None,
             sort: str = "start_time,desc",
+            fields: Sequence[str] = None,
             **kwargs: Any
-    ) -> list[dict]:
+    ) -> list[dict] | list[ItemRecord]:
         """
         List launches with optional filters.
 
@@ -213,7 +430,9 @@ class Launcher:
         :param cache: Use cache.
         :param ttl: Cache TTL in seconds.
         :param sort: Sort expression.
-        :return: List of launch dictionaries.
+        :param fields: Optional fields to keep; launches are returned as compact ItemRecord objects.
+        :param deadline: Optional total seconds for the listing, passed as a keyword argument.
+        :return: List of launch dictionaries or records, or None if the listing could not be fetched.
         """
         return self.rp_client.get_items(
             item_type=self.item_type,
@@ -223,5 +442,196 @@ class Launcher:
             sort=sort,
             cache=cache,
             ttl=ttl,
+            fields=fields,
             **kwargs
         )
+
+    def delete_launches(
+            self,
+            ids: Optional[Iterable[int]] = None,
+            by_name: str = None,
+            status: str = None,
+            before: Optional[Union[datetime, int]] = None,
+            addition_params: dict = None,
+            batch_size: int = 100,
+            max_workers: int = 8,
+            progress: Optional[Callable[[int, int], None]] = None,
+            state_path: Optional[str] = None
+    ) -> dict:
+        """Delete launches given by ids or matching filters.
+
+        Launches are deleted with the bulk endpoint in batches sent concurrently;
+        batches the bulk endpoint fails for are deleted launch by launch.
+
+        :param ids: Launch IDs; if not given, launches matching the filters are deleted.
+        :param by_name: Optional launch name filter.
+        :param status: Optional status filter.
+        :param before: Only launches started before this datetime or epoch milliseconds.
+        :param addition_params: Extra listing filters, e.g. {"filter.has.compositeAttribute": "env:ci"}.
+        :param batch_size: Launch IDs per bulk request.
+        :param max_workers: Max concurrent requests.
+        :param progress: Optional callback called as progress(done, total).
+        :param state_path: Optional state file to resume an interrupted run.
+        :return: Summary with total, done, resumed and failed launch IDs.
+        """
+        ids = self._bulk_launch_ids(ids, by_name, status, before, addition_params)
+        url_parts = self.rp_client.url_parts.launch
+        operation = BulkOperation("delete", ids, state_path=state_path, progress=progress)
+
+        def bulk_delete(batch: list) -> list:
+            response = self.rp_client.requests.delete(url_parts=url_parts, data={"ids": batch})
+            if response is None:
+                return []
+
+            succeeded = set(response.get('successfullyRemoved', [])) | set(response.get('notFound', []))
+            operation.fail(_id for _id in batch if _id not in succeeded)
+            return list(succeeded)
+
+        def delete(batch: list) -> list:
+            if self.rp_client.requests.delete(url_parts=f"{url_parts}/{batch[0]}") is None:
+                operation.fail(batch)
+                return []
+            return batch
+
+        return self._run_bulk_launch_operation(operation, bulk_delete, delete, batch_size, max_workers)
+
+    def stop_launches(
+            self,
+            ids: Optional[Iterable[int]] = None,
+            by_name: str = None,
+            before: Optional[Union[datetime, int]] = None,
+            status: str = "STOPPED",
+            addition_params: dict = None,
+            batch_size: int = 100,
+            max_workers: int = 8,
+            progress: Optional[Callable[[int, int], None]] = None,
+            state_path: Optional[str] = None
+    ) -> dict:
+        """Force-stop stuck launches given by ids or IN_PROGRESS launches matching filters.
+
+        :param ids: Launch IDs; if not given, IN_PROGRESS launches matching the filters are stopped.
+        :param by_name: Optional launch name filter.
+        :param before: Only launches started before this datetime or epoch milliseconds.
+        :param status: Final status of stopped launches.
+        :param addition_params: Extra listing filters.
+        :param batch_size: Launch IDs per bulk request.
+        :param max_workers: Max concurrent requests.
+        :param progress: Optional callback called as progress(done, total).
+        :param state_path: Optional state file to resume an interrupted run.
+        :return: Summary with total, done, resumed and failed launch IDs.
+        """
+        ids = self._bulk_launch_ids(ids, by_name, "IN_PROGRESS", before, addition_params)
+        url_parts = self.rp_client.url_parts.launch
+        operation = BulkOperation("stop", ids, state_path=state_path, progress=progress)
+        end_time = timestamp()
+
+        def bulk_stop(batch: list) -> list:
+            entities = {str(_id): {"endTime": end_time, "status": status} for _id in batch}
+            response = self.rp_client.requests.put(url_parts=f"{url_parts}/stop", data={"entities": entities})
+            if not isinstance(response, list) or len(response) != len(batch):
+                return []
+
+            # One result per entity, in request order; errors leave the launch for the one-by-one pass
+            return [
+                _id for _id, result in zip(batch, response)
+                if "successfully" in str((result or {}).get('message', ''))
+            ]
+
+        def stop(batch: list) -> list:
+            data = {"endTime": end_time, "status": status}
+            if self.rp_client.requests.put(url_parts=f"{url_parts}/{batch[0]}/stop", data=data) is None:
+                operation.fail(batch)
+                return []
+            return batch
+
+        return self._run_bulk_launch_operation(operation, bulk_stop, stop, batch_size, max_workers)
+
+    def merge_launches(
+            self,
+            ids: Sequence[int],
+            name: str,
+            merge_type: str = "BASIC",
+            description: Optional[str] = None,
+            attributes: Optional[Union[list, dict]] = None,
+            extend_suites_description: bool = True,
+            mode: str = "DEFAULT"
+    ) -> Optional[dict]:
+        """Merge launches into a new one with a single server call.
+
+        :param ids: Launch IDs to merge.
+        :param name: Name of the merged launch.
+        :param merge_type: 'BASIC' keeps suites side by side, 'DEEP' merges items with equal names.
+        :param description: Optional description of the merged launch.
+        :param attributes: Optional attributes list or dict.
+        :param extend_suites_description: Add source launch names to suite descriptions.
+        :param mode: Launch mode.
+        :return: Merged launch entity or None.
+        """
+        _merge_type = merge_type.upper()
+        if _merge_type not in ["BASIC", "DEEP"]:
+            raise ValueError(f"Invalid merge type: {_merge_type}. Must be one of ['BASIC', 'DEEP'].")
+
+        data = {
+            "launches": list(ids),
+            "name": name,
+            "mergeType": _merge_type,
+            "description": description,
+            "attributes": dict_to_payload(attributes) if isinstance(attributes, dict) else attributes,
+            "extendSuitesDescription": extend_suites_description,
+            "mode": mode,
+        }
+        merged = self.rp_client.requests.post(
+            url_parts=f"{self.rp_client.url_parts.launch}/merge",
+            data={key: value for key, value in data.items() if value is not None}
+        )
+        Cache().invalidate_tag("launches")
+        if merged is not None:
+            print(f"|INFO| Merged {len(data['launches'])} launches into launch {merged.get('id')}")
+        return merged
+
+    def _bulk_launch_ids(
+            self,
+            ids: Optional[Iterable[int]],
+            by_name: Optional[str],
+            status: Optional[str],
+            before: Optional[Union[datetime, int]],
+            addition_params: Optional[dict]
+    ) -> list:
+        """Launch IDs to process: the given ones, or those matching the filters except the active launch."""
+        if ids is not None:
+            return list(ids)
+
+        params = dict(addition_params or {})
+        if before is not None:
+            params["filter.lt.startTime"] = int(before.timestamp() * 1000) if isinstance(before, datetime) else before
+
+        launches = self.get_launches(
+            by_name=by_name,
+            status=status,
+            page_size=300,
+            sort="startTime,asc",
+            fields=("id", "uuid"),
+            addition_params=params
+        )
+        if launches is None:
+            print("|ERROR| Failed to list launches matching the filters")
+            return []
+
+        return [launch.id for launch in launches if launch.uuid != self.__uuid]
+
+    @staticmethod
+    def _run_bulk_launch_operation(
+            operation: BulkOperation,
+            bulk_action: Callable[[list], list],
+            single_action: Callable[[list], list],
+            batch_size: int,
+            max_workers: int
+    ) -> dict:
+        remaining = operation.run(bulk_action, operation.pending, batch_size=batch_size, max_workers=max_workers)
+        if remaining:
+            print(f"|WARNING| Bulk {operation.name} failed for {len(remaining)} launches, processing them one by one")
+            operation.run(single_action, remaining, batch_size=1, max_workers=max_workers)
+
+        Cache().invalidate_tag("launches")
+        Cache().clear(namespace="launch_info")
+        return operation.finish()
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from .launcher import Launcher
+from .utils.log_policy import rp_level_name
+
+
+class ReportPortalLogHandler(logging.Handler):
+    """Route Python ``logging`` records into ReportPortal items.
+
+    Records are attached at emit time to the item given in ``extra={'rp_item_uuid': ...}``
+    or to the current item of the launch client, otherwise to the launch itself.
+    They are put into a bounded queue drained by a background shipper thread,
+    so application threads never wait on the ReportPortal server.
+    The handler registers itself with the launcher, which flushes it before finishing the launch.
+
+    :param launcher: Launch controller whose active launch receives the logs.
+    :param level: Minimal logging level handled.
+    :param max_queue_size: Queue capacity in records.
+    :param backpressure: What to do when the queue is full:
+                         'block' - wait up to block_timeout, then drop the record;
+                         'drop_oldest' - discard the oldest queued record;
+                         'spill' - append the record to a JSON-lines file drained when the queue empties;
+                                   records keep their order, newer ones follow the spilled ones into the file.
+    :param block_timeout: Max seconds an application thread waits in 'block' mode.
+    :param spill_path: Spill file path for 'spill' mode; a temp file is used by default.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    SPILL = "spill"
+    backpressure_policies = [BLOCK, DROP_OLDEST, SPILL]
+
+    ignored_loggers = ("report_portal", "reportportal_client", "urllib3", "requests")
+
+    def __init__(
+            self,
+            launcher: Launcher,
+            level: int = logging.NOTSET,
+            max_queue_size: int = 10000,
+            backpressure: str = BLOCK,
+            block_timeout: float = 1.0,
+            spill_path: Optional[str] = None,
+    ):
+        super().__init__(level=level)
+        if backpressure not in self.backpressure_policies:
+            raise ValueError(f"Invalid backpressure policy: {backpressure}. Must be one of {self.backpressure_policies}.")
+
+        self.launcher = launcher
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.spill_path = spill_path or os.path.join(
+            tempfile.gettempdir(), f"report_portal_spill_{os.getpid()}_{id(self)}.jsonl"
+        )
+        self.sent = 0
+        self.dropped = 0
+        self.spilled = 0
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._spill_lock = threading.Lock()
+        self._spill_pending = False
+        self._stopped = threading.Event()
+        self._shipper = threading.Thread(target=self._ship, daemon=True, name="RP-Log-Shipper")
+        self._shipper.start()
+        launcher.log_handlers.append(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.name.startswith(self.ignored_loggers) or threading.current_thread() is self._shipper:
+            return
+
+        try:
+            launch_uuid = self.launcher.uuid
+        except RuntimeError:
+            return
+
+        try:
+            item_uuid = getattr(record, 'rp_item_uuid', None) or self.launcher.rp_client.current_item()
+            level = rp_level_name(record.levelno)
+            log_time = str(int(record.created * 1000))
+            message = self.format(record)
+
+            entries = [(message, level, log_time)]
+            if self.launcher.log_policy is not None:
+                entries = self.launcher.log_policy.apply(item_uuid or launch_uuid, message, level, log_time)
+
+            for _message, _level, _time in entries:
+                self._enqueue((launch_uuid, item_uuid, _time, _level, _message))
+
+        except Exception:
+            self.handleError(record)
+
+    def flush(self, timeout: float = 10.0) -> None:
+        """Wait until queued and spilled records are shipped.
+
+        :param timeout: Max seconds to wait.
+        """
+        deadline = time.monotonic() + timeout
+        while (self._queue.unfinished_tasks or self._spill_pending) and time.monotonic() < deadline:
+            if not self._shipper.is_alive():
+                break
+            time.sleep(0.05)
+
+    def close(self) -> None:
+        self.flush()
+        self._stopped.set()
+        self._shipper.join(timeout=5)
+        if self in self.launcher.log_handlers:
+            self.launcher.log_handlers.remove(self)
+        super().close()
+
+    def _enqueue(self, entry: tuple) -> None:
+        if self.backpressure == self.BLOCK:
+            try:
+                self._queue.put(entry, timeout=self.block_timeout)
+            except queue.Full:
+                self.dropped += 1
+            return
+
+        if self.backpressure == self.SPILL:
+            self._spill(entry)
+            return
+
+        try:
+            self._queue.put_nowait(entry)
+            return
+        except queue.Full:
+            pass
+
+        while True:
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(entry)
+                return
+            except queue.Full:
+                continue
+
+    def _spill(self, entry: tuple) -> None:
+        with self._spill_lock:
+            # While the spill file has records, newer ones go after them rather than into the queue
+            if not self._spill_pending:
+                try:
+                    self._queue.put_nowait(entry)
+                    return
+                except queue.Full:
+                    pass
+
+            with open(self.spill_path, "a", encoding="utf-8") as spill_file:
+                spill_file.write(json.dumps(entry) + "\n")
+            self._spill_pending = True
+            self.spilled += 1
+
+    def _drain_spill(self) -> None:
+        draining_path = f"{self.spill_path}.draining"
+        with self._spill_lock:
+            if not self._spill_pending:
+                return
+            os.replace(self.spill_path, draining_path)
+
+        with open(draining_path, "r", encoding="utf-8") as spill_file:
+            for line in spill_file:
+                self._send(tuple(json.loads(line)))
+        os.remove(draining_path)
+
+        with self._spill_lock:
+            self._spill_pending = os.path.exists(self.spill_path)
+
+    def _ship(self) -> None:
+        while True:
+            try:
+                # Spilled records are newer than all queued ones, so drain them as soon as the queue empties
+                entry = self._queue.get_nowait() if self._spill_pending else self._queue.get(timeout=0.2)
+            except queue.Empty:
+                if self._spill_pending:
+                    self._drain_spill()
+                elif self._stopped.is_set():
+                    return
+                continue
+
+            try:
+                self._send(entry)
+            finally:
+                self._queue.task_done()
+
+    def _send(self, entry: tuple) -> None:
+        launch_uuid, item_uuid, log_time, level, message = entry
+        try:
+            self.launcher.rp_client.send_log(
+                message=message,
+                launch_uuid=launch_uuid,
+                time=log_time,
+                item_uuid=item_uuid,
+                level=level
+            )
+            self.sent += 1
+        except Exception as e:
+            self.dropped += 1
+            print(f"|ERROR| Failed to ship log record to ReportPortal: {e}")
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 from .client import Client
 from .launcher import Launcher
+from .log_handler import ReportPortalLogHandler
 from .step import Step
 
 from .suite import Suite
 from .test import Test
 from .test_item import TestItem
+from .utils import LogPolicy
 
 
 class ReportPortal:
@@ -14,12 +16,27 @@ class ReportPortal:
 
     :param project_name: ReportPortal project name.
     :param config_path: Path to JSON config file; defaults to user config.
+    :param log_policy: Optional deduplication/sampling/budget policy for item logs.
+    :param reporting_budget: Optional max seconds spent on reporting calls per launch.
+    :param item_reporting_budget: Optional max seconds spent on reporting calls per test item.
     """
 
-    def __init__(self, project_name: str, config_path: str = None):
+    def __init__(
+        self,
+        project_name: str,
+        config_path: str = None,
+        log_policy: LogPolicy = None,
+        reporting_budget: float = None,
+        item_reporting_budget: float = None
+    ):
         self.project_name = project_name
         self.client = Client(config_path=config_path, project_name=self.project_name)
-        self.__launcher = Launcher(client=self.client)
+        self.__launcher = Launcher(
+            client=self.client,
+            log_policy=log_policy,
+            reporting_budget=reporting_budget,
+            item_reporting_budget=item_reporting_budget
+        )
 
     @property
     def launch(self) -> Launcher:
@@ -30,46 +47,58 @@ class ReportPortal:
         """
         return self.__launcher
 
-    def get_test(self) -> Test:
+    def get_test(self, defer_updates: bool = False) -> Test:
         """Get a Test helper instance for managing test items.
 
         Creates a Test helper bound to the current launcher that provides
         convenient methods for starting and finishing test cases.
 
+        :param defer_updates: Send updates of open items with their finish request.
         :return: Test instance bound to the current launcher.
         """
-        return Test(self.__launcher)
+        return Test(self.__launcher, defer_updates=defer_updates)
 
-    def get_suite(self) -> Suite:
+    def get_suite(self, defer_updates: bool = False) -> Suite:
         """Get a Suite helper instance for managing test suites.
 
         Creates a Suite helper bound to the current launcher that provides
         convenient methods for starting and finishing test suites.
 
+        :param defer_updates: Send updates of open items with their finish request.
         :return: Suite instance bound to the current launcher.
         """
-        return Suite(self.__launcher)
+        return Suite(self.__launcher, defer_updates=defer_updates)
 
-    def get_step(self) -> Step:
+    def get_step(self, defer_updates: bool = False) -> Step:
         """Get a Step helper instance for managing test steps.
 
         Creates a Step helper bound to the current launcher that provides
         convenient methods for starting and finishing test steps.
 
+        :param defer_updates: Send updates of open items with their finish request.
         :return: Step instance bound to the current launcher.
         """
-        return Step(self.__launcher)
+        return Step(self.__launcher, defer_updates=defer_updates)
 
-    def get_test_item(self, item_type: str = "TEST") -> TestItem:
+    def get_log_handler(self, **kwargs) -> ReportPortalLogHandler:
+        """Create a logging handler that ships log records into the current launch.
+
+        :param kwargs: ReportPortalLogHandler options (level, max_queue_size, backpressure, ...).
+        :return: New ReportPortalLogHandler bound to the current launcher.
+        """
+        return ReportPortalLogHandler(self.__launcher, **kwargs)
+
+    def get_test_item(self, item_type: str = "TEST", defer_updates: bool = False) -> TestItem:
         """Create a TestItem helper for a specific item type.
 
         Provides a flexible way to create test item helpers for any supported
         ReportPortal item type (TEST, STEP, SUITE, etc.).
 
         :param item_type: Item type name like 'TEST', 'STEP', 'SUITE'.
+        :param defer_updates: Send updates of open items with their finish request.
         :return: New TestItem instance bound to the current launcher.
         """
-        return TestItem(self.__launcher, item_type=item_type)
+        return TestItem(self.__launcher, item_type=item_type, defer_updates=defer_updates)
 
     # Deprecated aliases for backward compatibility
     def get_launch_test(self) -> Test:
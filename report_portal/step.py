@@ -6,5 +6,5 @@ from .test_item import TestItem
 class Step(TestItem):
     """Represents a step item in ReportPortal."""
 
-    def __init__(self,  launcher: Launcher):
-        super().__init__(launcher=launcher, item_type="STEP")
+    def __init__(self, launcher: Launcher, defer_updates: bool = False):
+        super().__init__(launcher=launcher, item_type="STEP", defer_updates=defer_updates)
@@ -6,8 +6,8 @@ from .test_item import TestItem
 class Suite(TestItem):
     """Represents a test suite entity in ReportPortal."""
 
-    def __init__(self, launcher: Launcher):
-        super().__init__(launcher=launcher, item_type="SUITE")
+    def __init__(self, launcher: Launcher, defer_updates: bool = False):
+        super().__init__(launcher=launcher, item_type="SUITE", defer_updates=defer_updates)
 
     def create(self, name: str, parent_item_id: str = None, return_code: int = 0, **kwargs) -> str:
         """Convenience method to start and immediately finish a suite.
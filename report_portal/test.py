@@ -5,5 +5,5 @@ from .test_item import TestItem
 
 class Test(TestItem):
 
-    def __init__(self, launcher: Launcher):
-        super().__init__(launcher=launcher, item_type="TEST")
+    def __init__(self, launcher: Launcher, defer_updates: bool = False):
+        super().__init__(launcher=launcher, item_type="TEST", defer_updates=defer_updates)
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
-from reportportal_client.helpers import timestamp
+from time import monotonic
+
+from reportportal_client.helpers import timestamp, dict_to_payload
 from reportportal_client.core.rp_issues import Issue
-from typing import Optional, Dict, Union, Any, Tuple
+from typing import Optional, Dict, Union, Any, Tuple, Sequence
 
+from .client.rp_client import ItemRecord
 from .launcher import Launcher
+from .utils import ReportingBudget, Tracer, traced
 
 
 
@@ -12,20 +16,29 @@ class TestItem:
 
     :param launcher: Active launch controller.
     :param item_type: One of 'TEST', 'STEP', 'SUITE'; case-insensitive.
+    :param defer_updates: Keep updates of items still open in this instance locally and send
+                          them with the finish request instead of a separate PUT each.
+
+    Reporting time of the item is tracked in ``budget``. Once the item or launch
+    reporting budget is exhausted, logs and updates are dropped and counted;
+    start and finish are always sent.
     """
     valid_statuses = ["PASSED", "FAILED", "SKIPPED", "IN_PROGRESS"]
 
-    def __init__(self, launcher: Launcher, item_type: str = "TEST"):
+    def __init__(self, launcher: Launcher, item_type: str = "TEST", defer_updates: bool = False):
         self.item_type = item_type.upper()
         self.launcher = launcher
+        self.defer_updates = defer_updates
+        self._pending_updates: dict[str, dict] = {}
         self.__item_uuid = None
         self.__item_id = None
         self.request = launcher.client.rp_client.requests
+        self.budget = ReportingBudget(limit=launcher.item_reporting_budget, parent=launcher.reporting_budget)
 
     @property
     def id(self):
         if self.__item_id is None:
-            self.__item_id = self.request.get_id(uuid=self.uuid)
+            self.__item_id = self.get_id(uuid=self.uuid)
         return self.__item_id
 
     @property
@@ -34,6 +47,7 @@ class TestItem:
             raise RuntimeError(f"{self.item_type.lower()} item has not been started. Cannot finish the suite.")
         return self.__item_uuid
 
+    @traced("item.start", lambda self, name, *args, **kwargs: {"item_type": self.item_type, "name": name})
     def start(
             self,
             name: str,
@@ -64,28 +78,43 @@ class TestItem:
         :param uuid: Predefined UUID to use.
         :return: New item UUID.
         """
+        self.budget.reset()
         try:
-            self.__item_uuid = self.launcher.rp_client.start_test_item(
-                name=name,
-                start_time=timestamp(),
-                item_type=self.item_type,
-                description=description,
-                attributes=attributes,
-                parameters=parameters,
-                parent_item_id=parent_item_id,
-                has_stats=has_stats,
-                code_ref=code_ref,
-                retry=retry,
-                test_case_id=test_case_id,
-                retry_of=retry_of,
-                uuid=uuid,
-                **kwargs
-            )
+            with self.budget.measure():
+                self.__item_uuid = self.launcher.rp_client.start_test_item(
+                    name=name,
+                    start_time=timestamp(),
+                    item_type=self.item_type,
+                    description=description,
+                    attributes=attributes,
+                    parameters=parameters,
+                    parent_item_id=parent_item_id,
+                    has_stats=has_stats,
+                    code_ref=code_ref,
+                    retry=retry,
+                    test_case_id=test_case_id,
+                    retry_of=retry_of,
+                    uuid=uuid,
+                    **kwargs
+                )
+
+            if self.__item_uuid:
+                if self.defer_updates:
+                    self._pending_updates[self.__item_uuid] = {}
+                self.launcher.item_index.add(
+                    uuid=self.__item_uuid,
+                    name=name,
+                    item_type=self.item_type,
+                    code_ref=code_ref,
+                    test_case_id=test_case_id,
+                    parent_uuid=parent_item_id
+                )
             return self.__item_uuid
 
         except Exception as e:
             raise RuntimeError(f"Failed to start item '{name}': {e}")
 
+    @traced("item.finish", lambda self, *args, **kwargs: {"item_type": self.item_type})
     def finish(
             self,
             return_code: int,
@@ -110,36 +139,59 @@ class TestItem:
         :param retry: Retry flag.
         :param test_case_id: External test case id.
         :param retry_of: UUID of item this is retry of.
+
+        Deferred updates of the item are merged in: explicit status and description
+        take precedence over pending ones, attributes are merged by key. They are
+        kept if the finish request fails.
         """
-        status = status or ("PASSED" if return_code == 0 else "FAILED")
         item_id = item_id or self.uuid
 
         if not item_id:
             raise RuntimeError("Test item has not been started. Cannot finish the test.")
 
+        pending = self._pending_updates.get(item_id) or {}
+        pending_status = pending.get('status') if pending.get('status') != "IN_PROGRESS" else None
+        status = status or pending_status or ("PASSED" if return_code == 0 else "FAILED")
+        description = description if description is not None else pending.get('description')
+        if pending.get('attributes'):
+            attributes = self._merge_attributes(pending['attributes'], attributes)
+
+        self._flush_log_policy(item_id)
+
         try:
-            self.launcher.rp_client.finish_test_item(
-                item_id=item_id,
-                end_time=timestamp(),
-                status=status,
-                issue=issue,
-                attributes=attributes,
-                description=description,
-                retry=retry,
-                test_case_id=test_case_id,
-                retry_of=retry_of,
-                **kwargs
-            )
+            with self.budget.measure():
+                message = self.launcher.rp_client.finish_test_item(
+                    item_id=item_id,
+                    end_time=timestamp(),
+                    status=status,
+                    issue=issue,
+                    attributes=attributes,
+                    description=description,
+                    retry=retry,
+                    test_case_id=test_case_id,
+                    retry_of=retry_of,
+                    **kwargs
+                )
+
+            # The item is still open after a failed finish; its deferred updates go with the next finish call
+            if message is None:
+                if pending:
+                    print(f"|WARNING| Failed to finish item '{item_id}', keeping its deferred updates")
+                return
+
+            self._pending_updates.pop(item_id, None)
 
         except Exception as e:
             raise RuntimeError(f"Failed to finish test with item ID '{self.id}' in ReportPortal: {str(e)}")
 
+    @traced("item.update", lambda self, *args, **kwargs: {"item_type": self.item_type})
     def update(
             self,
             item_uuid: str,
             attributes: Optional[Union[list, dict]] = None,
             description: Optional[str] = None,
             status: Optional[str] = None,
+            deadline: Optional[float] = None,
             **kwargs: Any
     ) -> Optional[str]:
         """Update a test item with partial data.
@@ -148,7 +200,8 @@ class TestItem:
         :param attributes: Optional attributes list or dict.
         :param description: Optional description.
         :param status: Optional status to set.
-        :return: Response message or None.
+        :param deadline: Optional total seconds for the call; clipped to the remaining reporting budget.
+        :return: Response message or None; None also when the update is deferred to finish.
         """
 
         _status = status.upper() if status else None
@@ -156,14 +209,61 @@ class TestItem:
         if _status is not None and _status not in self.valid_statuses:
             raise ValueError(f"Invalid status: {_status}. Must be one of {self.valid_statuses}.")
 
-        return self.launcher.rp_client.update_test_item(
-            item_uuid=item_uuid,
-            attributes=attributes,
-            description=description,
-            status=_status,
-            **kwargs
-        )
+        # Fields other than attributes, description and status are not part of the finish payload
+        if item_uuid in self._pending_updates and not kwargs:
+            self._defer_update(item_uuid, attributes=attributes, description=description, status=_status)
+            Tracer.annotate(deferred=True)
+            return None
+
+        if self.budget.exhausted:
+            self.budget.record_drop('update')
+            Tracer.annotate(dropped=True)
+            return None
 
+        with self.budget.measure():
+            return self.launcher.rp_client.update_test_item(
+                item_uuid=item_uuid,
+                attributes=attributes,
+                description=description,
+                status=_status,
+                deadline=self.budget.clip(deadline),
+                **kwargs
+            )
+
+    def _defer_update(
+            self,
+            item_uuid: str,
+            attributes: Optional[Union[list, dict]] = None,
+            description: Optional[str] = None,
+            status: Optional[str] = None
+    ) -> None:
+        pending = self._pending_updates[item_uuid]
+        if attributes:
+            pending['attributes'] = self._merge_attributes(pending.get('attributes'), attributes)
+        if description is not None:
+            pending['description'] = description
+        if status is not None:
+            pending['status'] = status
+
+    @staticmethod
+    def _merge_attributes(
+            current: Optional[Union[list, dict]],
+            new: Optional[Union[list, dict]]
+    ) -> list[dict]:
+        """Merge attribute lists; a later attribute replaces an earlier one with the same key.
+
+        :return: Attributes payload list.
+        """
+        merged = {}
+        for attributes in (current, new):
+            if isinstance(attributes, dict):
+                attributes = dict_to_payload(attributes)
+            for attribute in attributes or []:
+                key = attribute.get('key')
+                merged[key if key is not None else ('value', attribute.get('value'))] = attribute
+        return list(merged.values())
+
+    @traced("item.send_log")
     def send_log(
             self,
             message: str,
@@ -172,6 +272,7 @@ class TestItem:
             print_output: bool = False,
             time: Optional[str] = None,
             attachment: Optional[dict] = None,
+            deadline: Optional[float] = None,
     ) -> Optional[Tuple[str, ...]]:
         """Send a log entry for the current or specified item.
 
@@ -181,6 +282,7 @@ class TestItem:
         :param print_output: Also print to stdout.
         :param time: Optional explicit time.
         :param attachment: Optional attachment payload.
+        :param deadline: Optional total seconds for the call; clipped to the remaining reporting budget.
         :return: Transport response tuple or None.
         """
 
@@ -196,62 +298,110 @@ class TestItem:
         if print_output:
             print(f"[{level}] {message}")
 
-        return self.launcher.rp_client.send_log(
+        if self.budget.exhausted:
+            self.budget.record_drop('log')
+            Tracer.annotate(dropped=True)
+            return None
+
+        if self.launcher.log_policy is None:
+            return self._send_log(message=message, item_uuid=item_uuid, level=level, time=time, deadline=deadline)
+
+        response = None
+        for _message, _level, _time in self.launcher.log_policy.apply(item_uuid, message, level, time or timestamp()):
+            response = self._send_log(message=_message, item_uuid=item_uuid, level=_level, time=_time, deadline=deadline)
+        return response
+
+    def _send_log(
+            self,
+            message: str,
+            item_uuid: str,
+            level: Union[int, str],
+            time: Optional[str] = None,
+            deadline: Optional[float] = None
+    ):
+        with self.budget.measure():
+            return self.launcher.rp_client.send_log(
                 message=message,
                 launch_uuid=self.launcher.uuid,
                 time=time or timestamp(),
                 level=level,
-                item_uuid=item_uuid
+                item_uuid=item_uuid,
+                deadline=self.budget.clip(deadline)
             )
 
-    def get_info(self, uuid: str = None, cache: bool = True, ttl: int = None):
+    def _flush_log_policy(self, item_uuid: str) -> None:
+        if self.launcher.log_policy is None:
+            return
+
+        for message, level, time in self.launcher.log_policy.flush(item_uuid):
+            if self.budget.exhausted:
+                self.budget.record_drop('log')
+                continue
+            self._send_log(message=message, item_uuid=item_uuid, level=level, time=time)
+
+    def get_info(self, uuid: str = None, cache: bool = True, ttl: int = None, deadline: float = None):
         """Get item info by UUID with optional cache.
 
         :param uuid: Item UUID.
         :param cache: Use cache.
         :param ttl: Cache TTL in seconds.
+        :param deadline: Optional total seconds for the lookup.
         :return: Item info dictionary or None.
         """
         return self.launcher.rp_client.get_info(
             item_type=self.item_type,
             uuid=uuid or self.uuid,
             cache=cache,
-            ttl=ttl
+            ttl=ttl,
+            deadline=deadline
         )
 
-    def get_id(self, uuid: str = None, cache: bool = True, ttl: int = None):
+    def get_id(self, uuid: str = None, cache: bool = True, ttl: int = None, deadline: float = None):
         """Get item ID by UUID with optional cache.
 
         :param uuid: Item UUID.
         :param cache: Use cache.
         :param ttl: Cache TTL in seconds.
+        :param deadline: Optional total seconds for the lookup.
         :return: Item ID or None.
         """
         return self.launcher.rp_client.get_id(
             item_type=self.item_type,
             uuid=uuid or self.uuid,
             cache=cache,
-            ttl=ttl
+            ttl=ttl,
+            deadline=deadline
         )
 
-    def get_items(self, launch_id: str = None, **kwargs: any) -> list[dict]:
+    def get_items(self, launch_id: str = None, **kwargs: any) -> list[dict] | None:
         """List items for the current launch, optionally specifying launch id.
 
+        Pass ``fields=(...)`` to receive compact ItemRecord objects instead of dictionaries,
+        and ``deadline=`` to bound the whole listing in seconds, including the launch ID lookup.
+
         :param launch_id: Optional launch id; defaults to current.
-        :return: List of item dictionaries.
+        :return: List of item dictionaries or records, or None if the listing could not be fetched.
         """
+        deadline = kwargs.get('deadline')
+        if launch_id is None and deadline is not None:
+            started = monotonic()
+            launch_id = self.launcher.get_launch_id_by_uuid(uuid=self.launcher.uuid, deadline=deadline)
+            if launch_id is None:
+                return None
+            kwargs['deadline'] = max(deadline - (monotonic() - started), 0)
+
         return self.launcher.rp_client.get_items(
             item_type=self.item_type,
             launch_id=launch_id or self.launcher.id,
             **kwargs
         )
 
-    def get_items_by_type(self, name: str = None, launch_id: str | int = None, **kwargs: any) -> list[dict]:
+    def get_items_by_type(self, name: str = None, launch_id: str | int = None, **kwargs: any) -> list[dict] | None:
         """List items filtered by this instance's type and optional name.
 
         :param name: Optional item name filter.
         :param launch_id: Optional launch id.
-        :return: List of item dictionaries.
+        :return: List of item dictionaries, or None if the listing could not be fetched.
         """
         return self.get_items(
             launch_id=launch_id,
@@ -259,3 +409,37 @@ class TestItem:
             filter_by_type=self.item_type,
             **kwargs
         )
+
+    def find_items(
+            self,
+            name: str = None,
+            code_ref: str = None,
+            test_case_id: str = None,
+            parent_uuid: str = None,
+            path: Sequence[str] = None,
+            any_type: bool = False
+    ) -> list[ItemRecord]:
+        """Find items of the active launch in the launcher's item index.
+
+        The index is loaded from the server on first use unless it is already complete,
+        so repeated lookups (e.g. for retry_of on reruns) cost no requests.
+
+        :param name: Optional item name.
+        :param code_ref: Optional code reference.
+        :param test_case_id: Optional test case id.
+        :param parent_uuid: Optional parent item UUID.
+        :param path: Optional ancestor names, outermost first, e.g. ("Suite", "Test").
+        :param any_type: Match items of any type instead of this instance's type.
+        :return: List of index entries with id, uuid, name, type, codeRef, testCaseId, parentUuid and path.
+        """
+        if not self.launcher.item_index.loaded:
+            self.launcher.load_item_index(if_needed=True)
+
+        return self.launcher.item_index.find(
+            name=name,
+            code_ref=code_ref,
+            test_case_id=test_case_id,
+            parent_uuid=parent_uuid,
+            item_type=None if any_type else self.item_type,
+            path=path
+        )
@@ -1,5 +1,12 @@
 # -*- coding: utf-8 -*-
-from .cache import Cache
-from .decorators import singleton, cacheable
+from .cache import Cache, CachePolicy
+from .decorators import singleton, cacheable, traced
+from .log_policy import LogPolicy
+from .budget import ReportingBudget
+from .bulk_operation import BulkOperation
+from .tracing import Tracer, Span, SpanSink, InMemorySink, JsonLinesSink, OpenTelemetrySink, TracedSession
 
-__all__ = [Cache, singleton, cacheable]
+__all__ = [
+    Cache, CachePolicy, singleton, cacheable, traced, LogPolicy, ReportingBudget, BulkOperation,
+    Tracer, Span, SpanSink, InMemorySink, JsonLinesSink, OpenTelemetrySink, TracedSession
+]
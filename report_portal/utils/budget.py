@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Optional
+
+
+class ReportingBudget:
+    """Track time spent on reporting calls against an optional limit.
+
+    Time and drops charged to a budget are also charged to its parent, so an item
+    budget rolls up into the launch budget.
+
+    :param limit: Max seconds of reporting time; None means unlimited.
+    :param parent: Optional enclosing budget.
+    """
+
+    def __init__(self, limit: Optional[float] = None, parent: Optional["ReportingBudget"] = None):
+        self.limit = limit
+        self.parent = parent
+        self.spent = 0.0
+        self.dropped = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether this budget or any enclosing one is used up."""
+        if self.limit is not None and self.spent >= self.limit:
+            return True
+
+        return self.parent.exhausted if self.parent else False
+
+    def charge(self, seconds: float) -> None:
+        with self._lock:
+            self.spent += seconds
+
+        if self.parent:
+            self.parent.charge(seconds)
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Seconds left in this budget or the tightest enclosing one; None if all are unlimited."""
+        remaining = self.limit - self.spent if self.limit is not None else None
+        parent = self.parent.remaining if self.parent else None
+        if remaining is None or (parent is not None and parent < remaining):
+            remaining = parent
+
+        return max(remaining, 0.0) if remaining is not None else None
+
+    def clip(self, deadline: Optional[float] = None) -> Optional[float]:
+        """Limit a per-call deadline to the remaining budget.
+
+        :param deadline: Optional seconds the caller allows for the call.
+        :return: The smaller of deadline and the remaining budget, or None if neither is set.
+        """
+        remaining = self.remaining
+        if deadline is None or (remaining is not None and remaining < deadline):
+            return remaining
+        return deadline
+
+    def record_drop(self, kind: str) -> None:
+        """Count a call skipped because the budget is exhausted.
+
+        :param kind: Call kind, e.g. 'log' or 'update'.
+        """
+        with self._lock:
+            self.dropped[kind] += 1
+
+        if self.parent:
+            self.parent.record_drop(kind)
+
+    @contextmanager
+    def measure(self):
+        """Charge the duration of the enclosed block."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.charge(time.monotonic() - started)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spent = 0.0
+            self.dropped.clear()
+
+    def summary(self) -> dict:
+        return {
+            "limit": self.limit,
+            "spent": round(self.spent, 3),
+            "exhausted": self.exhausted,
+            "dropped": dict(self.dropped),
+        }
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, Sequence
+
+
+class BulkOperation:
+    """Progress of an operation over many entity ids, optionally persisted for resuming.
+
+    With ``state_path`` the ids already processed are written to a JSON file after
+    every step; running the same operation again with that file skips them. The file
+    is removed once every id has succeeded.
+
+    :param name: Operation name stored in the state file, e.g. 'delete'.
+    :param ids: Entity ids to process.
+    :param state_path: Optional path of the resume state file.
+    :param progress: Optional callback called as progress(done, total) after every step.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            ids: Iterable,
+            state_path: Optional[str] = None,
+            progress: Optional[Callable[[int, int], None]] = None
+    ):
+        self.name = name
+        self.ids = list(dict.fromkeys(ids))
+        self.state_path = state_path
+        self.progress = progress
+        self.done = set()
+        self.failed = set()
+        self.resumed = 0
+        self._lock = threading.Lock()
+        self._load_state()
+
+    @property
+    def pending(self) -> list:
+        return [_id for _id in self.ids if _id not in self.done]
+
+    def run(self, action: Callable[[list], Sequence], ids: Iterable, batch_size: int, max_workers: int) -> list:
+        """Call ``action`` for batches of ids concurrently.
+
+        :param action: Called with a batch; returns the ids of the batch that succeeded.
+        :param ids: Ids to process.
+        :param batch_size: Ids per call.
+        :param max_workers: Max concurrent calls.
+        :return: Ids that did not succeed.
+        """
+        ids = list(ids)
+        batches = [ids[index:index + batch_size] for index in range(0, len(ids), batch_size)]
+        remaining = []
+
+        def _run(batch: list) -> None:
+            succeeded = set(action(batch) or ())
+            self.complete([_id for _id in batch if _id in succeeded])
+            remaining.extend(_id for _id in batch if _id not in succeeded and _id not in self.failed)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_run, batches))
+
+        return remaining
+
+    def complete(self, ids: Iterable) -> None:
+        with self._lock:
+            self.done.update(ids)
+            self.failed.difference_update(self.done)
+            self._save_state()
+            done = len(self.done)
+
+        if self.progress:
+            self.progress(done, len(self.ids))
+
+    def fail(self, ids: Iterable) -> None:
+        with self._lock:
+            self.failed.update(_id for _id in ids if _id not in self.done)
+
+    def finish(self) -> dict:
+        """Drop the state file if everything succeeded and print a summary.
+
+        :return: Summary with total, done, resumed and failed ids.
+        """
+        if not self.failed and self.state_path and os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+        summary = self.summary()
+        message = f"|INFO| Bulk {self.name}: {summary['done']}/{summary['total']} done"
+        if summary['resumed']:
+            message += f", {summary['resumed']} from a previous run"
+        if summary['failed']:
+            message += f", {len(summary['failed'])} failed"
+        print(message)
+        return summary
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "total": len(self.ids),
+                "done": len(self.done),
+                "resumed": self.resumed,
+                "failed": [_id for _id in self.ids if _id in self.failed],
+            }
+
+    def _load_state(self) -> None:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+
+        with open(self.state_path, "r") as state_file:
+            state = json.load(state_file)
+
+        if state.get('operation') != self.name:
+            raise RuntimeError(
+                f"State file {self.state_path} belongs to operation '{state.get('operation')}', not '{self.name}'"
+            )
+
+        done = set(state.get('done', []))
+        self.done = {_id for _id in self.ids if _id in done}
+        self.resumed = len(self.done)
+
+    def _save_state(self) -> None:
+        if not self.state_path:
+            return
+
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w") as state_file:
+            json.dump({"operation": self.name, "done": sorted(self.done, key=str)}, state_file)
+        os.replace(tmp_path, self.state_path)
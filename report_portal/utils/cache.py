@@ -1,34 +1,173 @@
 # -*- coding: utf-8 -*-
+import threading
 import time
-from typing import Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable, Optional
 from .decorators import singleton
 
 
+NEGATIVE = object()
+"""Stored in place of a None result by negative caching."""
+
+NOT_FOUND = object()
+"""Returned by a request for an entity the server answered 404 to, as opposed to None for a failed call."""
+
+
+@dataclass
+class CachePolicy:
+    """Cache settings of one namespace.
+
+    :param ttl: Default entry TTL in seconds; None keeps entries until invalidated.
+    :param max_size: Max entries; least recently used entries are evicted. None is unbounded.
+    :param negative_ttl: TTL for cached None results; None disables negative caching.
+    """
+    ttl: Optional[int] = None
+    max_size: Optional[int] = None
+    negative_ttl: Optional[int] = None
+
+
+class _Namespace:
+    __slots__ = ("policy", "store")
+
+    def __init__(self, policy: CachePolicy):
+        self.policy = policy
+        self.store = OrderedDict()
+
+
 @singleton
 class Cache:
+    """Process-wide cache split into namespaces with their own policies.
+
+    Known namespaces: 'launch_info', 'item_info', 'uuid_id', 'listing' and 'default'.
+    Unknown namespaces are created with the default policy on first use.
+    Entries keep their tags, so a tag only references entries still in the cache.
+    """
+
+    namespaces = ("default", "launch_info", "item_info", "uuid_id", "listing")
 
     def __init__(self):
-        self._store = {}
+        self._namespaces = {name: _Namespace(CachePolicy()) for name in self.namespaces}
+        self._tags: dict[str, set] = {}
+        self._lock = threading.RLock()
+
+    def configure(self, namespace: str, **policy: Any) -> CachePolicy:
+        """Set policy fields (ttl, max_size, negative_ttl) of a namespace.
+
+        :return: Resulting namespace policy.
+        """
+        with self._lock:
+            _namespace = self._namespace(namespace)
+            for field, value in policy.items():
+                if not hasattr(_namespace.policy, field):
+                    raise ValueError(f"Invalid cache policy field: {field}. Must be one of ['ttl', 'max_size', 'negative_ttl'].")
+                setattr(_namespace.policy, field, value)
+            self._evict(namespace, _namespace)
+            return _namespace.policy
 
-    def get(self, key: str) -> Any | None:
-        entry = self._store.get(key)
+    def policy(self, namespace: str = "default") -> CachePolicy:
+        return self._namespace(namespace).policy
 
-        if entry is None:
-            return None
+    def lookup(self, key: Hashable, namespace: str = "default") -> tuple[bool, Any]:
+        """Look up an entry.
 
-        value, expire_time = entry
-        if expire_time and time.time() > expire_time:
-            del self._store[key]
-            return None
+        :return: (hit, value); value is NEGATIVE for a cached None result.
+        """
+        _namespace = self._namespace(namespace)
+        with self._lock:
+            entry = _namespace.store.get(key)
+            if entry is None:
+                return False, None
 
-        return value
+            value, expire_time, tags = entry
+            if expire_time and time.time() > expire_time:
+                del _namespace.store[key]
+                self._untag(namespace, key, tags)
+                return False, None
 
-    def set(self, key: str, value: any, ttl=None):
+            if _namespace.policy.max_size is not None:
+                _namespace.store.move_to_end(key)
+
+            return True, value
+
+    def get(self, key: Hashable, namespace: str = "default") -> Any | None:
+        hit, value = self.lookup(key, namespace=namespace)
+        return None if not hit or value is NEGATIVE else value
+
+    def set(self, key: Hashable, value: any, ttl=None, tags: Iterable[str] = (), namespace: str = "default"):
+        _namespace = self._namespace(namespace)
+        ttl = ttl if ttl is not None else _namespace.policy.ttl
         expire_time = time.time() + ttl if ttl else None
-        self._store[key] = (value, expire_time)
+        tags = tuple(tags)
+        with self._lock:
+            previous = _namespace.store.get(key)
+            if previous is not None:
+                self._untag(namespace, key, previous[2])
+
+            _namespace.store[key] = (value, expire_time, tags)
+            _namespace.store.move_to_end(key)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add((namespace, key))
+            self._evict(namespace, _namespace)
+
+    def set_negative(self, key: Hashable, tags: Iterable[str] = (), namespace: str = "default") -> bool:
+        """Remember a None result if the namespace enables negative caching.
+
+        :return: True if the entry was stored.
+        """
+        negative_ttl = self._namespace(namespace).policy.negative_ttl
+        if not negative_ttl:
+            return False
+
+        self.set(key, NEGATIVE, ttl=negative_ttl, tags=tags, namespace=namespace)
+        return True
+
+    def invalidate_tag(self, tag: str):
+        """Delete all entries stored with the given tag."""
+        with self._lock:
+            for namespace, key in self._tags.pop(tag, ()):
+                self._pop(namespace, key)
+
+    def clear(self, namespace: str = None):
+        with self._lock:
+            if namespace is None:
+                for _namespace in self._namespaces.values():
+                    _namespace.store.clear()
+                self._tags.clear()
+            else:
+                for key in list(self._namespace(namespace).store):
+                    self._pop(namespace, key)
+
+    def delete(self, key, namespace: str = "default"):
+        with self._lock:
+            self._pop(namespace, key)
+
+    def _namespace(self, namespace: str) -> _Namespace:
+        _namespace = self._namespaces.get(namespace)
+        if _namespace is None:
+            with self._lock:
+                _namespace = self._namespaces.setdefault(namespace, _Namespace(CachePolicy()))
+        return _namespace
+
+    def _pop(self, namespace: str, key: Hashable) -> None:
+        entry = self._namespace(namespace).store.pop(key, None)
+        if entry is not None:
+            self._untag(namespace, key, entry[2])
+
+    def _untag(self, namespace: str, key: Hashable, tags: tuple) -> None:
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is None:
+                continue
+            keys.discard((namespace, key))
+            if not keys:
+                del self._tags[tag]
 
-    def clear(self):
-        self._store.clear()
+    def _evict(self, namespace: str, _namespace: _Namespace) -> None:
+        max_size = _namespace.policy.max_size
+        if max_size is None:
+            return
 
-    def delete(self, key):
-        self._store.pop(key, None)
\ No newline at end of file
+        while len(_namespace.store) > max_size:
+            key, (_, _, tags) = _namespace.store.popitem(last=False)
+            self._untag(namespace, key, tags)
@@ -3,38 +3,118 @@ from functools import wraps
 
 
 
-def cacheable(default_ttl: int = None):
-    from .cache import Cache
+def cacheable(default_ttl: int = None, tags=None, namespace: str = "default", key=None):
+    """Cache method results in a Cache namespace.
+
+    A NOT_FOUND result is returned as None and cached only if the namespace policy sets
+    negative_ttl. A None result means the call failed and is never cached.
+
+    :param default_ttl: TTL in seconds used when the call passes no ttl; falls back to the namespace TTL.
+    :param tags: Optional callable (self, *args, **kwargs) -> tags stored with the entry,
+                 used for group invalidation through Cache.invalidate_tag.
+    :param namespace: Cache namespace whose policy applies.
+    :param key: Optional callable (self, *args, **kwargs) -> hashable key; by default the
+                method name with positional and sorted keyword arguments.
+    """
+    from .cache import Cache, NEGATIVE, NOT_FOUND
+    from .tracing import Tracer
 
     def decorator(func):
+        def cache_key(instance, args: tuple, kwargs: dict):
+            if key is not None:
+                return key(instance, *args, **kwargs)
+            return func.__name__, _freeze(args), _freeze(kwargs)
+
+        def method_cache(instance) -> Cache:
+            if not hasattr(instance, '__method_cache'):
+                instance.__method_cache = Cache()
+            return instance.__method_cache
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            if not hasattr(self, '__method_cache'):
-                self.__method_cache = Cache()
-
             cache_kwargs = kwargs.copy()
 
             use_cache = cache_kwargs.pop('cache', True)
             ttl = cache_kwargs.pop('ttl', default_ttl)
 
             if not use_cache:
-                return func(self, *args, **kwargs)
+                result = func(self, *args, **kwargs)
+                return None if result is NOT_FOUND else result
+
+            _cache = method_cache(self)
+            _key = cache_key(self, args, cache_kwargs)
+
+            with Tracer().span(f"cache.{namespace}", function=func.__name__) as span:
+                hit, cached = _cache.lookup(_key, namespace=namespace)
+                span.set("cache", "hit" if hit else "miss")
+                if hit:
+                    return None if cached is NEGATIVE else cached
+
+                result = func(self, *args, **kwargs)
+                if result is None:
+                    return None
+
+                entry_tags = tags(self, *args, **cache_kwargs) if tags else ()
+                if result is NOT_FOUND:
+                    _cache.set_negative(_key, tags=entry_tags, namespace=namespace)
+                    return None
+
+                _cache.set(_key, result, ttl=ttl, tags=entry_tags, namespace=namespace)
+                return result
+
+        def cache_get(instance, *args, **kwargs):
+            """Return the cached result of a call with the given arguments or None."""
+            return method_cache(instance).get(cache_key(instance, args, kwargs), namespace=namespace)
+
+        def cache_set(instance, value, *args, ttl: int = default_ttl, **kwargs) -> None:
+            """Store a value as the cached result of a call with the given arguments."""
+            method_cache(instance).set(cache_key(instance, args, kwargs), value, ttl=ttl, namespace=namespace)
+
+        def cache_delete(instance, *args, **kwargs) -> None:
+            """Drop the cached result of a call with the given arguments."""
+            method_cache(instance).delete(cache_key(instance, args, kwargs), namespace=namespace)
+
+        wrapper.cache_get = cache_get
+        wrapper.cache_set = cache_set
+        wrapper.cache_delete = cache_delete
+        return wrapper
+    return decorator
 
-            cache_key = f"{func.__name__}:{args}:{str(cache_kwargs)}"
 
-            cached = self.__method_cache.get(cache_key)
-            if cached is not None:
-                return cached
+def traced(name: str, attributes=None):
+    """Open a tracing span around every method call.
 
-            result = func(self, *args, **kwargs)
-            if result is not None:
-                self.__method_cache.set(cache_key, result, ttl=ttl)
-            return result
+    Without registered sinks the method is called directly.
+
+    :param name: Span name, e.g. 'item.start'.
+    :param attributes: Optional callable (self, *args, **kwargs) -> dict of initial span attributes.
+    """
+    from .tracing import Tracer
+    tracer = Tracer()
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not tracer.sinks:
+                return func(self, *args, **kwargs)
 
+            with tracer.span(name, **(attributes(self, *args, **kwargs) if attributes else {})):
+                return func(self, *args, **kwargs)
         return wrapper
     return decorator
 
 
+def _freeze(value):
+    """Turn call arguments into a hashable key part."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
 def singleton(class_):
     __instances = {}
 
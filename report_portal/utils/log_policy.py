@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+from typing import Iterable, Optional, Union
+
+
+class LogPolicy:
+    """Deduplication, sampling and budget rules applied before logs are sent.
+
+    State is tracked per item UUID. WARN/ERROR entries (``protected_levels``) are
+    never sampled or dropped by the budget; identical consecutive messages of any
+    level are still collapsed, since the repeat count keeps the information.
+    With ``collapse_repeats`` the last kept entry is held back until a different
+    message arrives or the item is flushed, so a run is sent as one entry carrying
+    its repeat count and the time of its first occurrence.
+
+    :param collapse_repeats: Collapse consecutive identical messages into one entry with a repeat count.
+    :param sampled_levels: Levels subject to rate sampling.
+    :param sample_rate: Max sampled-level entries per second per item; None disables sampling.
+    :param max_logs_per_item: Max non-protected entries per item; None disables the budget.
+    :param protected_levels: Levels that are always kept.
+    """
+
+    def __init__(
+            self,
+            collapse_repeats: bool = True,
+            sampled_levels: Iterable[str] = ("DEBUG", "TRACE"),
+            sample_rate: Optional[float] = None,
+            max_logs_per_item: Optional[int] = None,
+            protected_levels: Iterable[str] = ("WARN", "ERROR"),
+    ):
+        self.collapse_repeats = collapse_repeats
+        self.sampled_levels = frozenset(sampled_levels)
+        self.sample_rate = sample_rate
+        self.max_logs_per_item = max_logs_per_item
+        self.protected_levels = frozenset(protected_levels)
+        self._states: dict[str, _ItemLogState] = {}
+        self._lock = threading.Lock()
+
+    def apply(
+            self,
+            item_uuid: str,
+            message: str,
+            level: Union[int, str],
+            time: Optional[str] = None
+    ) -> list[tuple[str, Union[int, str], Optional[str]]]:
+        """Pass a log entry through the policy.
+
+        :param item_uuid: Item the entry belongs to.
+        :param message: Log message.
+        :param level: Log level.
+        :param time: Log time, kept with a held-back entry.
+        :return: Entries (message, level, time) to send now, possibly empty.
+        """
+        level_name = rp_level_name(level)
+        with self._lock:
+            state = self._states.get(item_uuid)
+            if state is None:
+                state = self._states[item_uuid] = _ItemLogState()
+
+            if self.collapse_repeats and state.last == (message, level):
+                state.repeats += 1
+                return []
+
+            entries = self._pop_held(state)
+
+            if level_name not in self.protected_levels:
+                if self._sampled_out(state, level_name):
+                    state.sampled += 1
+                    return entries
+
+                if self.max_logs_per_item is not None and state.sent >= self.max_logs_per_item:
+                    state.over_budget += 1
+                    return entries
+
+                state.sent += 1
+
+            if self.collapse_repeats:
+                state.last, state.time = (message, level), time
+            else:
+                entries.append((message, level, time))
+            return entries
+
+    def flush(self, item_uuid: str) -> list[tuple[str, Union[int, str], Optional[str]]]:
+        """Release state of a finished item.
+
+        :param item_uuid: Finished item UUID.
+        :return: Held-back and drop summary entries to send.
+        """
+        with self._lock:
+            state = self._states.pop(item_uuid, None)
+
+        if state is None:
+            return []
+
+        entries = self._pop_held(state)
+        if state.sampled or state.over_budget:
+            entries.append((
+                f"Log policy dropped {state.sampled + state.over_budget} entries "
+                f"(sampled: {state.sampled}, over budget: {state.over_budget})",
+                "INFO",
+                None
+            ))
+        return entries
+
+    def flush_all(self) -> dict[str, list[tuple[str, Union[int, str], Optional[str]]]]:
+        """Release state of every item, e.g. when the launch finishes with items left unflushed.
+
+        :return: Held-back and drop summary entries to send, by item UUID.
+        """
+        with self._lock:
+            item_uuids = list(self._states)
+
+        flushed = {}
+        for item_uuid in item_uuids:
+            entries = self.flush(item_uuid)
+            if entries:
+                flushed[item_uuid] = entries
+        return flushed
+
+    def _sampled_out(self, state: "_ItemLogState", level_name: str) -> bool:
+        if self.sample_rate is None or level_name not in self.sampled_levels:
+            return False
+
+        now = time.monotonic()
+        state.tokens = min(max(self.sample_rate, 1.0), state.tokens + (now - state.refilled) * self.sample_rate)
+        state.refilled = now
+        if state.tokens < 1:
+            return True
+
+        state.tokens -= 1
+        return False
+
+    @staticmethod
+    def _pop_held(state: "_ItemLogState") -> list:
+        if state.last is None:
+            return []
+
+        message, level = state.last
+        if state.repeats:
+            message = f"{message}\n[message repeated {state.repeats + 1} times]"
+        entry = (message, level, state.time)
+        state.last, state.time, state.repeats = None, None, 0
+        return [entry]
+
+
+def rp_level_name(level: Union[int, str]) -> str:
+    """Map a Python logging level number to a ReportPortal level name.
+
+    :param level: Logging level number or ReportPortal level name.
+    :return: ReportPortal level name.
+    """
+    if isinstance(level, str):
+        return level
+
+    if level >= logging.ERROR:
+        return "ERROR"
+    if level >= logging.WARNING:
+        return "WARN"
+    if level >= logging.INFO:
+        return "INFO"
+    return "DEBUG" if level >= logging.DEBUG else "TRACE"
+
+
+class _ItemLogState:
+    __slots__ = ("last", "time", "repeats", "sent", "sampled", "over_budget", "tokens", "refilled")
+
+    def __init__(self):
+        self.last = None
+        self.time = None
+        self.repeats = 0
+        self.sent = 0
+        self.sampled = 0
+        self.over_budget = 0
+        self.tokens = float("inf")
+        self.refilled = time.monotonic()
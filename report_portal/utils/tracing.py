@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from .decorators import singleton
+
+try:
+    from opentelemetry import trace as otel_trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:
+    otel_trace = None
+
+
+_json_dumps = json.dumps
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("report_portal_span", default=None)
+
+
+class Span:
+    """One traced operation; used as a context manager that makes it the parent of spans opened inside.
+
+    :param name: Operation name, e.g. 'item.start' or 'http'.
+    :param parent: Enclosing span or None for a root span.
+    :param attributes: Initial attributes.
+    """
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "start_time_ns", "duration",
+        "attributes", "error", "_sinks", "_started", "_token"
+    )
+
+    recording = True
+
+    def __init__(self, name: str, parent: Optional["Span"], sinks: tuple, attributes: dict):
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.start_time_ns = None
+        self.duration = None
+        self.error = None
+        self._sinks = sinks
+        self._started = None
+        self._token = None
+
+    @property
+    def end_time_ns(self) -> Optional[int]:
+        if self.duration is None:
+            return None
+        return self.start_time_ns + int(self.duration * 1e9)
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start_time_ns / 1e9,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def __enter__(self) -> "Span":
+        self.start_time_ns = time.time_ns()
+        self._started = time.perf_counter()
+        self._token = _current_span.set(self)
+        for sink in self._sinks:
+            sink.on_start(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration = time.perf_counter() - self._started
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        for sink in self._sinks:
+            sink.on_end(self)
+
+
+class _NoopSpan:
+    """Returned while no sink is registered; records nothing."""
+    __slots__ = ()
+
+    recording = False
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+@singleton
+class Tracer:
+    """Process-wide span emitter.
+
+    Spans are only created while at least one sink is registered; otherwise ``span``
+    returns a shared no-op object, so instrumented calls cost a single check.
+    """
+
+    def __init__(self):
+        self.sinks: tuple = ()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.sinks)
+
+    def add_sink(self, sink: "SpanSink") -> "SpanSink":
+        """Register a sink; spans finished from now on are passed to it.
+
+        :return: The sink.
+        """
+        with self._lock:
+            if sink not in self.sinks:
+                self.sinks = self.sinks + (sink,)
+        return sink
+
+    def remove_sink(self, sink: "SpanSink") -> None:
+        with self._lock:
+            self.sinks = tuple(_sink for _sink in self.sinks if _sink is not sink)
+
+    def span(self, name: str, /, **attributes: Any) -> Span | _NoopSpan:
+        """Open a span as a child of the current one.
+
+        :param name: Operation name.
+        :param attributes: Initial span attributes.
+        :return: Span context manager, or a no-op one when tracing is disabled.
+        """
+        sinks = self.sinks
+        if not sinks:
+            return NOOP_SPAN
+        return Span(name, parent=_current_span.get(), sinks=sinks, attributes=attributes)
+
+    @staticmethod
+    def current() -> Optional[Span]:
+        return _current_span.get()
+
+    @staticmethod
+    def annotate(**attributes: Any) -> None:
+        """Set attributes on the current span, if any."""
+        span = _current_span.get()
+        if span is not None:
+            span.attributes.update(attributes)
+
+    def wrap(self, func: Callable) -> Callable:
+        """Bind a function to the current span, so spans it opens in another thread keep their parent."""
+        parent = _current_span.get()
+        if parent is None:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            token = _current_span.set(parent)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _current_span.reset(token)
+
+        return wrapper
+
+
+class SpanSink:
+    """Receiver of spans; ``on_start`` is called when a span opens and ``on_end`` when it closes."""
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+
+class InMemorySink(SpanSink):
+    """Keep finished spans in memory.
+
+    :param max_spans: Max spans kept; oldest are dropped first. None is unbounded.
+    """
+
+    def __init__(self, max_spans: Optional[int] = None):
+        self.spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def find(self, name: str) -> list[Span]:
+        with self._lock:
+            return [span for span in self.spans if span.name == name]
+
+    def children(self, span: Span) -> list[Span]:
+        with self._lock:
+            return [child for child in self.spans if child.parent_id == span.span_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+    def summary(self) -> dict:
+        """Count, total, average and max duration in seconds per span name, slowest total first."""
+        stats = {}
+        with self._lock:
+            for span in self.spans:
+                entry = stats.setdefault(span.name, {"count": 0, "total": 0.0, "max": 0.0, "errors": 0})
+                entry['count'] += 1
+                entry['total'] += span.duration
+                entry['max'] = max(entry['max'], span.duration)
+                entry['errors'] += int(span.error is not None)
+
+        for entry in stats.values():
+            entry['avg'] = entry['total'] / entry['count']
+        return dict(sorted(stats.items(), key=lambda item: item[1]['total'], reverse=True))
+
+
+class JsonLinesSink(SpanSink):
+    """Append finished spans to a file, one JSON object per line.
+
+    :param path: Output file path.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class OpenTelemetrySink(SpanSink):
+    """Mirror spans as OpenTelemetry spans, keeping their parent/child relationships.
+
+    Requires the optional ``opentelemetry-api`` dependency; root spans become children
+    of the OpenTelemetry span active in the caller, if any.
+
+    :param tracer: Optional OpenTelemetry tracer; defaults to the global provider's one.
+    """
+
+    def __init__(self, tracer: Any = None):
+        if otel_trace is None:
+            raise RuntimeError(
+                "OpenTelemetry sink requires 'opentelemetry-api'. Install it with: pip install opentelemetry-sdk"
+            )
+
+        self.tracer = tracer or otel_trace.get_tracer("report_portal")
+        self._spans = {}
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span) -> None:
+        with self._lock:
+            parent = self._spans.get(span.parent_id)
+        context = otel_trace.set_span_in_context(parent) if parent is not None else None
+        otel_span = self.tracer.start_span(span.name, context=context, start_time=span.start_time_ns)
+        with self._lock:
+            self._spans[span.span_id] = otel_span
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            otel_span = self._spans.pop(span.span_id, None)
+        if otel_span is None:
+            return
+
+        otel_span.set_attributes({
+            key: value for key, value in span.attributes.items()
+            if isinstance(value, (str, bool, int, float))
+        })
+        if span.error is not None:
+            otel_span.set_status(Status(StatusCode.ERROR, span.error))
+        otel_span.end(end_time=span.end_time_ns)
+
+
+class TracedSession:
+    """Proxy of a requests-style session that opens an 'http' span for every call.
+
+    :param session: Session with get, post and put methods, e.g. the RPClient one.
+    """
+
+    def __init__(self, session: Any):
+        self.session = session
+
+    def get(self, url, **kwargs):
+        return self._send("GET", self.session.get, url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._send("POST", self.session.post, url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._send("PUT", self.session.put, url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    @staticmethod
+    def _send(method: str, send: Callable, url, **kwargs):
+        with Tracer().span("http", method=method, url=str(url)) as span:
+            record_request(span, **kwargs)
+            response = send(url, **kwargs)
+            record_response(span, response)
+            return response
+
+
+def record_request(span: Span | _NoopSpan, json: Any = None, data: Any = None, files: Any = None, **_) -> None:
+    """Set the request payload size in bytes on a recording span."""
+    if not span.recording:
+        return
+
+    size = 0
+    if json is not None:
+        size += len(_json_dumps(json, separators=(",", ":"), default=str).encode("utf-8"))
+    if isinstance(data, (bytes, bytearray, str)):
+        size += len(data)
+    for file in (files.values() if isinstance(files, dict) else files or ()):
+        content = file[1][1] if isinstance(file, tuple) and isinstance(file[1], tuple) else None
+        if isinstance(content, (bytes, bytearray, str)):
+            size += len(content)
+    span.set("request_bytes", size)
+
+
+def record_response(span: Span | _NoopSpan, response: Any) -> None:
+    """Set the status code and response size in bytes on a recording span."""
+    if not span.recording or response is None:
+        return
+
+    span.set("status_code", getattr(response, "status_code", None))
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        span.set("response_bytes", len(content))
+
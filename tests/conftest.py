@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+import reportportal_client.client
+
+os.environ.setdefault("AGENT_NO_ANALYTICS", "1")
+
+from benchmarks.stub_server import StubReportPortal
+from report_portal import ReportPortal
+from report_portal.utils import Cache
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    """One stub per session: ReportPortalRequests is a singleton bound to the first endpoint."""
+    with StubReportPortal(project="tests") as server:
+        yield server
+
+
+@pytest.fixture
+def stub(stub_server):
+    yield stub_server
+    stub_server.failures.clear()
+    stub_server.latency = 0.0
+    stub_server.error_rate = 0.0
+
+
+@pytest.fixture(scope="session")
+def config_path(stub_server, tmp_path_factory):
+    path = tmp_path_factory.mktemp("report_portal") / "config.json"
+    path.write_text(json.dumps({"endpoint": stub_server.endpoint, "api_key": "test"}))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def no_finish_delay(monkeypatch):
+    """RPClient.finish_launch sleeps 3 seconds for its log batcher; the stub needs no grace period."""
+    monkeypatch.setattr(reportportal_client.client, "sleep", lambda _: None)
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    Cache().clear()
+    yield
+    Cache().clear()
+
+
+@pytest.fixture
+def rp(stub, config_path):
+    """ReportPortal facade with a started launch, finished after the test if still active."""
+    report_portal = ReportPortal(project_name=stub.project, config_path=config_path)
+    report_portal.launch.start(name="tests")
+    yield report_portal
+    try:
+        report_portal.launch.uuid
+    except RuntimeError:
+        return
+    report_portal.launch.finish()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from report_portal.aio import AsyncReportPortal
+from report_portal.utils import Cache
+
+
+def run_with_step(stub, config_path, scenario):
+    """Run scenario(client, step, item_uuid) inside a started launch and item."""
+    async def main():
+        async with AsyncReportPortal(project_name=stub.project, config_path=config_path) as rp:
+            await rp.launch.start(name="aio tests")
+            step = rp.get_step()
+            item_uuid = await step.start(name="aio step")
+            try:
+                return await scenario(rp.launch.rp_client, step, item_uuid)
+            finally:
+                await step.finish(return_code=0)
+                await rp.launch.finish()
+
+    return asyncio.run(main())
+
+
+def test_update_of_unknown_item_sends_nothing(stub, config_path):
+    async def scenario(client, step, item_uuid):
+        return await client.update_test_item("no-such-uuid", description="lost")
+
+    updates = stub.requests["_update_item"]
+    assert run_with_step(stub, config_path, scenario) is None
+    assert stub.requests["_update_item"] == updates
+
+
+def test_update_writes_through_item_info(stub, config_path):
+    async def scenario(client, step, item_uuid):
+        await client.get_info(item_type="test_item", uuid=item_uuid)
+        await client.update_test_item(item_uuid, description="updated")
+        return Cache().get(item_uuid, namespace="item_info")
+
+    assert run_with_step(stub, config_path, scenario)["description"] == "updated"
+
+
+def test_rejected_update_drops_item_info(stub, config_path):
+    async def scenario(client, step, item_uuid):
+        await client.get_info(item_type="test_item", uuid=item_uuid)
+        stub.failures["_update_item"] = 400
+        message = await client.update_test_item(item_uuid, description="REJECTED")
+        stub.failures.clear()
+        return message, Cache().lookup(item_uuid, namespace="item_info")
+
+    message, (hit, _) = run_with_step(stub, config_path, scenario)
+    assert message is None
+    assert not hit
+
+
+def test_get_info_caches_only_not_found(stub, config_path):
+    async def scenario(client, step, item_uuid):
+        Cache().configure("item_info", negative_ttl=60)
+        try:
+            missing = await client.get_info(item_type="test_item", uuid="no-such-uuid")
+            stub.failures["_item_info"] = 503
+            failed = await client.get_info(item_type="test_item", uuid=item_uuid)
+            stub.failures.clear()
+            return missing, failed, Cache().lookup("no-such-uuid", namespace="item_info"), \
+                Cache().lookup(item_uuid, namespace="item_info")
+        finally:
+            Cache().configure("item_info", negative_ttl=None)
+
+    missing, failed, (missing_hit, _), (failed_hit, _) = run_with_step(stub, config_path, scenario)
+    assert missing is None and failed is None
+    assert missing_hit
+    assert not failed_hit
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from report_portal.utils.bulk_operation import BulkOperation
+
+
+def _stuck_launch(stub) -> int:
+    _, response = stub._start_launch(body=json.dumps({"name": "stuck", "startTime": "0"}).encode())
+    return stub.launches[response["id"]]["id"]
+
+
+def test_resume_skips_done_ids(tmp_path):
+    state_path = str(tmp_path / "state.json")
+    operation = BulkOperation("delete", [1, 2, 3, 4], state_path=state_path)
+    remaining = operation.run(lambda batch: [_id for _id in batch if _id != 3], operation.pending, 2, 2)
+    assert remaining == [3]
+    operation.fail(remaining)
+    assert operation.finish()["failed"] == [3]
+
+    resumed = BulkOperation("delete", [1, 2, 3, 4], state_path=state_path)
+    assert resumed.pending == [3]
+    assert resumed.resumed == 3
+
+    resumed.run(lambda batch: batch, resumed.pending, 2, 2)
+    assert resumed.finish() == {"total": 4, "done": 4, "resumed": 3, "failed": []}
+    assert not (tmp_path / "state.json").exists()
+
+
+def test_state_of_another_operation_is_rejected(tmp_path):
+    state_path = str(tmp_path / "state.json")
+    operation = BulkOperation("stop", [1], state_path=state_path)
+    operation.complete([1])
+
+    with pytest.raises(RuntimeError):
+        BulkOperation("delete", [1], state_path=state_path)
+
+
+def test_progress_is_reported(tmp_path):
+    calls = []
+    operation = BulkOperation("stop", [1, 2, 3], progress=lambda done, total: calls.append((done, total)))
+    operation.run(lambda batch: batch, operation.pending, 3, 1)
+    assert calls == [(3, 3)]
+
+
+def test_stop_leaves_rejected_launches_pending(rp, stub, tmp_path):
+    stuck = _stuck_launch(stub)
+    missing = 10 ** 9
+    state_path = tmp_path / "stop.json"
+
+    summary = rp.launch.stop_launches(ids=[stuck, missing], state_path=str(state_path))
+
+    assert summary["done"] == 1
+    assert summary["failed"] == [missing]
+    assert json.loads(state_path.read_text())["done"] == [stuck]
+    assert stub.requests["_stop_launch"] == 1
+
+
+def test_delete_leaves_rejected_launches_pending(rp, stub, tmp_path):
+    stuck = _stuck_launch(stub)
+    state_path = tmp_path / "delete.json"
+
+    summary = rp.launch.delete_launches(ids=[stuck], state_path=str(state_path))
+
+    assert summary["failed"] == [stuck]
+    assert json.loads(state_path.read_text())["done"] == []
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from report_portal.client.rp_client.rp_requests import listing_key, listing_tags
+from report_portal.utils import Cache, cacheable
+from report_portal.utils import cache as cache_module
+from report_portal.utils.cache import NEGATIVE, NOT_FOUND
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock.time)
+    return clock
+
+
+class Source:
+    """Counts calls of a cached lookup; namespaces are unique to this module, so policies don't leak."""
+
+    def __init__(self, results: dict):
+        self.results = results
+        self.calls = 0
+
+    @cacheable(namespace="test_source")
+    def lookup(self, uuid: str, cache: bool = True, ttl: int = None, deadline: float = None):
+        self.calls += 1
+        return self.results.get(uuid)
+
+    @cacheable(namespace="test_keyed", key=lambda _, uuid, **__: uuid, tags=lambda _, uuid, **__: (f"tag:{uuid}",))
+    def keyed(self, uuid: str, cache: bool = True, ttl: int = None, deadline: float = None):
+        self.calls += 1
+        return self.results.get(uuid)
+
+
+@pytest.fixture
+def source():
+    yield Source({"a": {"id": 1}, "missing": NOT_FOUND})
+    for namespace in ("test_source", "test_keyed"):
+        Cache().configure(namespace, ttl=None, max_size=None, negative_ttl=None)
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = Cache()
+    cache.configure("test_ttl", ttl=10)
+    cache.set("key", "value", namespace="test_ttl")
+    cache.set("forever", "value", ttl=0, namespace="test_ttl")
+
+    clock.now += 10
+    assert cache.get("key", namespace="test_ttl") == "value"
+    clock.now += 1
+    assert cache.lookup("key", namespace="test_ttl") == (False, None)
+    assert cache.get("forever", namespace="test_ttl") == "value"
+
+
+def test_max_size_evicts_least_recently_used():
+    cache = Cache()
+    cache.configure("test_lru", max_size=2)
+    cache.set("a", 1, namespace="test_lru")
+    cache.set("b", 2, namespace="test_lru")
+    cache.get("a", namespace="test_lru")
+    cache.set("c", 3, namespace="test_lru")
+
+    assert cache.get("b", namespace="test_lru") is None
+    assert cache.get("a", namespace="test_lru") == 1
+
+    cache.configure("test_lru", max_size=1)
+    assert cache.get("c", namespace="test_lru") is None
+    assert cache.get("a", namespace="test_lru") == 1
+
+
+def test_configure_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        Cache().configure("test_invalid", size=1)
+
+
+def test_negative_entries_need_negative_ttl():
+    cache = Cache()
+    assert not cache.set_negative("key", namespace="test_negative")
+
+    cache.configure("test_negative", negative_ttl=5)
+    assert cache.set_negative("key", namespace="test_negative")
+    assert cache.lookup("key", namespace="test_negative") == (True, NEGATIVE)
+    assert cache.get("key", namespace="test_negative") is None
+
+
+def test_tags_invalidate_and_are_pruned_with_their_entries():
+    cache = Cache()
+    cache.configure("test_tags", max_size=1)
+    cache.set("a", 1, tags=("group",), namespace="test_tags")
+    cache.set("b", 2, tags=("group", "other"), namespace="test_tags")
+    cache.set("a", 1, tags=("group",))
+
+    # The evicted entry no longer holds its tag
+    assert cache._tags["group"] == {("test_tags", "b"), ("default", "a")}
+
+    cache.invalidate_tag("group")
+    assert cache.get("a") is None
+    assert cache.get("b", namespace="test_tags") is None
+    assert cache._tags == {}
+
+
+def test_cacheable_caches_results_by_arguments(source):
+    assert source.lookup("a") == {"id": 1}
+    assert source.lookup("a") == {"id": 1}
+    assert source.lookup(uuid="a") == {"id": 1}
+    assert source.calls == 2
+
+    assert source.lookup("a", cache=False) == {"id": 1}
+    assert source.calls == 3
+
+
+def test_failed_calls_are_never_cached(source):
+    assert source.lookup("failed") is None
+    assert source.lookup("failed") is None
+    assert source.calls == 2
+
+
+def test_not_found_is_cached_only_with_negative_ttl(source):
+    assert source.lookup("missing") is None
+    assert source.lookup("missing") is None
+    assert source.calls == 2
+
+    Cache().configure("test_source", negative_ttl=60)
+    assert source.lookup("missing") is None
+    assert source.lookup("missing") is None
+    assert source.calls == 3
+
+
+def test_custom_key_ignores_call_settings(source):
+    source.keyed("a", deadline=1)
+    source.keyed("a", deadline=2)
+    assert source.calls == 1
+
+    Source.keyed.cache_set(source, {"id": 2}, "a")
+    assert source.keyed("a") == {"id": 2}
+    assert Source.keyed.cache_get(source, "a") == {"id": 2}
+
+    Source.keyed.cache_delete(source, "a")
+    assert source.keyed("a") == {"id": 1}
+    assert source.calls == 2
+
+    Cache().invalidate_tag("tag:a")
+    source.keyed("a")
+    assert source.calls == 3
+
+
+def test_listing_key_and_tags():
+    params = {"filter.eq.launchId": 5, "page.page": 1}
+
+    assert listing_key(None, "tests/item", params, max_retries=1) == listing_key(None, "tests/item", dict(params))
+    assert listing_tags(None, "tests/item", params) == ("items:5",)
+    assert listing_tags(None, "tests/launch", {}) == ("launches",)
+    assert listing_tags(None, "tests/item", {}) == ()
+
+
+def test_item_info_caches_not_found_with_negative_ttl(rp, stub):
+    client = rp.launch.rp_client
+    Cache().configure("item_info", negative_ttl=60)
+    try:
+        lookups = stub.requests["_item_info"]
+        assert client.get_info(item_type="test_item", uuid="missing") is None
+        assert client.get_info(item_type="test_item", uuid="missing") is None
+        assert stub.requests["_item_info"] == lookups + 1
+    finally:
+        Cache().configure("item_info", negative_ttl=None)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+
+import pytest
+
+from report_portal.client.rp_client import circuit_breaker as circuit_breaker_module
+from report_portal.client.rp_client.circuit_breaker import CircuitBreaker
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+@pytest.fixture
+def breaker(rp, monkeypatch):
+    """Circuit breaker installed on the ReportPortalRequests singleton for one test."""
+    requests = rp.launch.rp_client.requests
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60, spool_size=3)
+    monkeypatch.setattr(requests, "circuit_breaker", breaker)
+    monkeypatch.setattr(requests, "spool", deque(maxlen=breaker.spool_size))
+    monkeypatch.setattr(requests, "spool_dropped", 0)
+    return breaker
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+
+
+def test_half_open_lets_one_probe_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    _trip(breaker)
+
+    clock.now = 29
+    assert not breaker.allow()
+
+    clock.now = 30
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    assert breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_opens_again(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    _trip(breaker)
+
+    clock.now = 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 59
+    assert not breaker.allow()
+
+
+def test_slow_call_counts_as_failure():
+    breaker = CircuitBreaker(failure_threshold=1, latency_threshold=1.0)
+
+    assert not breaker.record_success(latency=2.0)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_item_calls_are_skipped_while_open(rp, stub, breaker):
+    step = rp.get_step()
+    uuid = step.start(name="before")
+    client = rp.launch.rp_client
+    requests = dict(stub.requests)
+    _trip(breaker)
+
+    assert client.start_test_item(name="skipped", start_time="0", item_type="STEP") is None
+    assert client.update_test_item(uuid, description="skipped") is None
+    assert client.finish_test_item(item_id=uuid, end_time="0") is None
+    assert client.get_items(item_type="test_item", launch_id=rp.launch.id) is None
+
+    for handler in ("_start_item", "_update_item", "_finish_item", "_list_items"):
+        assert stub.requests[handler] == requests.get(handler, 0)
+
+
+def test_item_call_failures_trip_the_breaker(rp, stub, breaker):
+    stub.failures["_start_item"] = 503
+    started = stub.requests["_start_item"]
+
+    step = rp.get_step()
+    assert step.start(name="first") is None
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert step.start(name="second") is None
+    assert breaker.state == CircuitBreaker.OPEN
+
+    assert step.start(name="skipped") is None
+    assert stub.requests["_start_item"] == started + 2
+
+
+def test_failed_log_posts_are_spooled_and_replayed(rp, stub, breaker):
+    step = rp.get_step()
+    uuid = step.start(name="logs")
+    requests = rp.launch.rp_client.requests
+    logs = stub.logs
+
+    stub.failures["_log"] = 503
+    step.send_log("m0", item_uuid=uuid)
+    assert breaker.state == CircuitBreaker.CLOSED
+    step.send_log("m1", item_uuid=uuid)
+    assert breaker.state == CircuitBreaker.OPEN
+    step.send_log("m2", item_uuid=uuid)
+    assert [data["message"] for _, data in requests.spool] == ["m0", "m1", "m2"]
+
+    stub.failures.clear()
+    breaker.state = CircuitBreaker.CLOSED
+    step.finish(return_code=0)
+    assert requests.flush_spool()
+    assert not requests.spool
+    assert stub.logs == logs + 3
+
+
+def test_full_spool_counts_evicted_posts(rp, breaker):
+    requests = rp.launch.rp_client.requests
+    _trip(breaker)
+
+    for index in range(5):
+        requests.post(url_parts="log", data={"message": f"m{index}"}, spool=True)
+
+    assert [data["message"] for _, data in requests.spool] == ["m2", "m3", "m4"]
+    assert requests.spool_dropped == 2
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import zlib
+
+import pytest
+
+from report_portal.client.rp_client.compression import RequestCompression, endpoint_name
+
+LARGE = {"message": "x" * 2048}
+
+
+def test_small_bodies_are_sent_as_is():
+    body, headers = RequestCompression(min_size=1024).encode("log", {"message": "short"})
+
+    assert json.loads(body) == {"message": "short"}
+    assert "Content-Encoding" not in headers
+
+
+@pytest.mark.parametrize("encoding, decompress", [("gzip", gzip.decompress), ("deflate", zlib.decompress)])
+def test_large_bodies_are_compressed(encoding, decompress):
+    compression = RequestCompression(encoding=encoding)
+    body, headers = compression.encode("log", LARGE)
+
+    assert headers["Content-Encoding"] == encoding
+    assert json.loads(decompress(body)) == LARGE
+    assert compression.summary()["log"]["compressed"] == 1
+    assert compression.summary()["log"]["ratio"] < 0.1
+
+
+def test_endpoints_restrict_and_override_settings():
+    compression = RequestCompression(endpoints={"log": True, "item": {"min_size": 4096, "encoding": "deflate"}})
+
+    assert "Content-Encoding" in compression.encode("log", LARGE)[1]
+    assert "Content-Encoding" not in compression.encode("item", LARGE)[1]
+    assert "Content-Encoding" not in compression.encode("launch", LARGE)[1]
+    assert compression.encode("item", {"message": "x" * 5000})[1]["Content-Encoding"] == "deflate"
+
+
+def test_rejected_endpoint_stays_uncompressed():
+    compression = RequestCompression()
+    compression.reject("log")
+
+    assert "Content-Encoding" not in compression.encode("log", LARGE)[1]
+
+
+def test_invalid_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        RequestCompression(encoding="br")
+
+
+def test_endpoint_name():
+    assert endpoint_name("project/log") == "log"
+    assert endpoint_name("project/launch/stop") == "launch"
+    assert endpoint_name("log") == "log"
+
+
+def test_unsupported_encoding_falls_back_to_plain_bodies(rp, stub, monkeypatch):
+    requests = rp.launch.rp_client.requests
+    monkeypatch.setattr(requests, "compression", RequestCompression(encoding="deflate", min_size=0))
+    monkeypatch.setattr(stub, "accept_encodings", ("gzip",))
+    step = rp.get_step()
+    uuid = step.start(name="compressed")
+    logs = stub.logs
+
+    step.send_log("first", item_uuid=uuid)
+    step.send_log("second", item_uuid=uuid)
+
+    assert stub.logs == logs + 2
+    assert requests.compression.summary()["log"]["compressed"] == 1
+
+
+def test_item_updates_are_sent_compressed(rp, stub, monkeypatch):
+    requests = rp.launch.rp_client.requests
+    monkeypatch.setattr(requests, "compression", RequestCompression(min_size=0, endpoints={"item": True}))
+    step = rp.get_step()
+    uuid = step.start(name="compressed update")
+
+    step.update(uuid, description="compressed")
+
+    assert stub.items[uuid]["description"] == "compressed"
+    assert requests.compression.summary()["item"]["compressed"] == 1
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+
+def test_deferred_updates_are_sent_with_finish(rp, stub):
+    step = rp.get_step(defer_updates=True)
+    uuid = step.start(name="deferred")
+    updates = stub.requests["_update_item"]
+
+    step.update(uuid, attributes={"os": "linux"}, description="deferred")
+    step.finish(return_code=0)
+
+    assert stub.requests["_update_item"] == updates
+    assert stub.items[uuid]["description"] == "deferred"
+    assert {"key": "os", "value": "linux"} in stub.items[uuid]["attributes"]
+
+
+def test_rejected_finish_keeps_deferred_updates(rp, stub):
+    step = rp.get_step(defer_updates=True)
+    uuid = step.start(name="rejected finish")
+    step.update(uuid, description="deferred")
+
+    stub.failures["_finish_item"] = 400
+    step.finish(return_code=0)
+    stub.failures.clear()
+    assert uuid in step._pending_updates
+
+    step.finish(return_code=0, item_id=uuid)
+    assert uuid not in step._pending_updates
+    assert stub.items[uuid]["description"] == "deferred"
+    assert stub.items[uuid]["status"] == "PASSED"
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+
+
+def test_sweep_keeps_current_item(rp, stub):
+    step = rp.get_step()
+    uuid = step.start(name="current")
+    seeded = stub.seed_items(rp.launch.uuid, count=6, children=2)
+    stack_size = rp.launch.rp_client._item_stack.qsize()
+
+    finished = rp.launch.finish_unfinished_items()
+
+    assert finished == len(seeded) + 1
+    assert rp.launch.rp_client.current_item() == uuid
+    assert rp.launch.rp_client._item_stack.qsize() == stack_size
+    assert all(stub.items[item]["status"] == "INTERRUPTED" for item in seeded)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+
+def test_update_writes_through_item_info(rp, stub):
+    step = rp.get_step()
+    uuid = step.start(name="write-through")
+    client = rp.launch.rp_client
+    client.get_info(item_type="test_item", uuid=uuid)
+    lookups = stub.requests["_item_info"]
+
+    assert client.update_test_item(uuid, description="updated") is not None
+    assert client.get_info(item_type="test_item", uuid=uuid)["description"] == "updated"
+    assert stub.requests["_item_info"] == lookups
+
+
+def test_rejected_update_drops_item_info(rp, stub):
+    step = rp.get_step()
+    uuid = step.start(name="rejected")
+    client = rp.launch.rp_client
+    client.update_test_item(uuid, description="orig")
+    assert client.get_info(item_type="test_item", uuid=uuid)["description"] == "orig"
+
+    stub.failures["_update_item"] = 400
+    assert client.update_test_item(uuid, description="REJECTED") is None
+    stub.failures.clear()
+
+    assert client.get_info(item_type="test_item", uuid=uuid)["description"] == "orig"
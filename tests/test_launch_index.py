@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from report_portal.launch_index import LaunchItemIndex
+
+
+def _index() -> LaunchItemIndex:
+    index = LaunchItemIndex()
+    index.add("suite", "Suite", "SUITE")
+    index.add("test", "Test", "TEST", parent_uuid="suite")
+    index.add("step-1", "test_login", "STEP", code_ref="tests.test_login", parent_uuid="test")
+    index.add("step-2", "test_login", "STEP", code_ref="tests.other.test_login", test_case_id="tc-2")
+    return index
+
+
+def test_find_combines_criteria():
+    index = _index()
+
+    assert [entry.uuid for entry in index.find(name="test_login")] == ["step-1", "step-2"]
+    assert [entry.uuid for entry in index.find(name="test_login", parent_uuid="test")] == ["step-1"]
+    assert [entry.uuid for entry in index.find(test_case_id="tc-2", name="test_login")] == ["step-2"]
+    assert index.find(code_ref="tests.test_login", item_type="suite") == []
+    assert [entry.uuid for entry in index.find(item_type="step")] == ["step-1", "step-2"]
+
+
+def test_find_by_path():
+    index = _index()
+
+    assert index.get("step-1").path == ("Suite", "Test")
+    assert [entry.uuid for entry in index.find(name="test_login", path=["Suite", "Test"])] == ["step-1"]
+    assert [entry.uuid for entry in index.find(path=())] == ["suite", "step-2"]
+    assert index.find(path=("Test",)) == []
+
+
+def test_clear_unloads():
+    index = _index()
+    index.loaded = True
+
+    index.clear()
+
+    assert not index.loaded
+    assert len(index) == 0 and "suite" not in index
+
+
+def test_failed_load_stays_unloaded():
+    class FailingClient:
+        @staticmethod
+        def get_items(**_):
+            return None
+
+    index = LaunchItemIndex()
+    index.load(FailingClient(), launch_id=1)
+
+    assert not index.loaded
+
+
+def test_find_items_loads_the_index_once(rp, stub):
+    seeded = stub.seed_items(rp.launch.uuid, count=6, children=2)
+    suite = stub.items[seeded[0]]
+    rp.launch.item_index.clear()
+    listings = stub.requests["_list_items"]
+
+    step = rp.get_step()
+    found = step.find_items(path=(suite["name"],))
+    again = step.find_items(name=stub.items[seeded[1]]["name"])
+
+    assert [entry.uuid for entry in found] == seeded[1:3]
+    assert [entry.uuid for entry in again] == [seeded[1]]
+    assert found[0].id == stub.items[seeded[1]]["id"]
+    assert stub.requests["_list_items"] == listings + 1
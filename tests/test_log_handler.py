@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+
+import pytest
+
+from report_portal.log_handler import ReportPortalLogHandler
+
+
+class Shipped:
+    """Messages shipped by log handlers, with a gate to hold the shipper inside send_log."""
+
+    def __init__(self):
+        self.messages = []
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+
+
+@pytest.fixture
+def shipped(rp, monkeypatch):
+    shipped = Shipped()
+    send_log = rp.launch.rp_client.send_log
+
+    def _send_log(**kwargs):
+        shipped.entered.set()
+        shipped.gate.wait(5)
+        shipped.messages.append((kwargs["message"], kwargs.get("item_uuid")))
+        return send_log(**kwargs)
+
+    monkeypatch.setattr(rp.launch.rp_client, "send_log", _send_log)
+    return shipped
+
+
+def _logger(handler: ReportPortalLogHandler) -> logging.Logger:
+    logger = logging.getLogger(f"tests.log_handler.{id(handler)}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def test_invalid_backpressure_is_rejected(rp):
+    with pytest.raises(ValueError):
+        ReportPortalLogHandler(rp.launch, backpressure="wait")
+
+
+def test_records_go_to_the_current_item_and_are_flushed_on_finish(rp, shipped):
+    handler = ReportPortalLogHandler(rp.launch)
+    logger = _logger(handler)
+    step = rp.get_step()
+    uuid = step.start(name="logged")
+
+    logger.info("to the item")
+    logger.info("to another item", extra={"rp_item_uuid": "other"})
+    step.finish(return_code=0)
+    logger.info("to the launch")
+    rp.launch.finish()
+
+    assert shipped.messages == [("to the item", uuid), ("to another item", "other"), ("to the launch", None)]
+    assert handler.sent == 3
+    handler.close()
+
+
+def test_spill_keeps_record_order(rp, shipped, tmp_path):
+    handler = ReportPortalLogHandler(
+        rp.launch, max_queue_size=1, backpressure="spill", spill_path=str(tmp_path / "spill.jsonl")
+    )
+    logger = _logger(handler)
+    shipped.gate.clear()
+
+    logger.info("m0")
+    shipped.entered.wait(5)
+    for index in range(1, 6):
+        logger.info(f"m{index}")
+    shipped.gate.set()
+    handler.flush()
+
+    assert [message for message, _ in shipped.messages] == [f"m{index}" for index in range(6)]
+    assert handler.spilled == 4
+    handler.close()
+
+
+def test_drop_oldest_keeps_newest_records(rp, shipped):
+    handler = ReportPortalLogHandler(rp.launch, max_queue_size=1, backpressure="drop_oldest")
+    logger = _logger(handler)
+    shipped.gate.clear()
+
+    logger.info("m0")
+    shipped.entered.wait(5)
+    for index in range(1, 4):
+        logger.info(f"m{index}")
+    shipped.gate.set()
+    handler.flush()
+
+    assert [message for message, _ in shipped.messages] == ["m0", "m3"]
+    assert handler.dropped == 2
+    handler.close()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import logging
+
+from report_portal import ReportPortal
+from report_portal.utils import LogPolicy
+from report_portal.utils.log_policy import rp_level_name
+
+
+def test_repeats_are_held_and_collapsed():
+    policy = LogPolicy()
+
+    assert policy.apply("item", "a", "INFO", "1") == []
+    assert policy.apply("item", "a", "INFO", "2") == []
+    assert policy.apply("item", "b", "INFO", "3") == [("a\n[message repeated 2 times]", "INFO", "1")]
+    assert policy.flush("item") == [("b", "INFO", "3")]
+    assert policy.flush("item") == []
+
+
+def test_without_collapse_entries_pass_through():
+    policy = LogPolicy(collapse_repeats=False)
+
+    assert policy.apply("item", "a", "INFO", "1") == [("a", "INFO", "1")]
+    assert policy.apply("item", "a", "INFO", "2") == [("a", "INFO", "2")]
+
+
+def test_budget_spares_protected_levels():
+    policy = LogPolicy(collapse_repeats=False, max_logs_per_item=1)
+
+    assert policy.apply("item", "kept", "INFO") == [("kept", "INFO", None)]
+    assert policy.apply("item", "dropped", "INFO") == []
+    assert policy.apply("item", "error", "ERROR") == [("error", "ERROR", None)]
+    assert policy.flush("item") == [("Log policy dropped 1 entries (sampled: 0, over budget: 1)", "INFO", None)]
+
+
+def test_sampling_applies_to_sampled_levels_only():
+    policy = LogPolicy(collapse_repeats=False, sample_rate=1)
+
+    assert policy.apply("item", "first", "DEBUG") == [("first", "DEBUG", None)]
+    assert policy.apply("item", "second", "DEBUG") == []
+    assert policy.apply("item", "info", "INFO") == [("info", "INFO", None)]
+    assert "sampled: 1" in policy.flush("item")[0][0]
+
+
+def test_flush_all_releases_every_item():
+    policy = LogPolicy()
+    policy.apply("launch", "launch log", "INFO", "1")
+    policy.apply("item", "item log", "WARN", "2")
+    policy.apply("empty", "x", "INFO")
+    policy.flush("empty")
+
+    assert policy.flush_all() == {
+        "launch": [("launch log", "INFO", "1")],
+        "item": [("item log", "WARN", "2")],
+    }
+    assert policy.flush_all() == {}
+
+
+def test_rp_level_name():
+    assert rp_level_name(logging.ERROR) == "ERROR"
+    assert rp_level_name(logging.WARNING) == "WARN"
+    assert rp_level_name(logging.INFO) == "INFO"
+    assert rp_level_name(logging.DEBUG) == "DEBUG"
+    assert rp_level_name(5) == "TRACE"
+    assert rp_level_name("FATAL") == "FATAL"
+
+
+def test_launch_finish_sends_held_logs_of_unfinished_items(stub, config_path, monkeypatch):
+    report_portal = ReportPortal(project_name=stub.project, config_path=config_path, log_policy=LogPolicy())
+    launch_uuid = report_portal.launch.start(name="log policy")
+    step = report_portal.get_step()
+    item_uuid = step.start(name="never finished")
+
+    sent = []
+    send_log = report_portal.launch.rp_client.send_log
+
+    def _record(**kwargs):
+        sent.append((kwargs["message"], kwargs.get("item_uuid")))
+        return send_log(**kwargs)
+
+    monkeypatch.setattr(report_portal.launch.rp_client, "send_log", _record)
+    step.send_log("item log", item_uuid=item_uuid)
+    # Launch-level records of the logging handler are tracked under the launch UUID
+    report_portal.launch.log_policy.apply(launch_uuid, "launch log", "INFO")
+    assert sent == []
+
+    report_portal.launch.finish()
+
+    assert sorted(sent) == [("item log", item_uuid), ("launch log", None)]
+    assert report_portal.launch.log_policy.flush_all() == {}
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from report_portal import ReportPortal
+
+
+def test_connect_with_prefetch_serves_lookups_from_memory(rp, stub, config_path):
+    seeded = stub.seed_items(rp.launch.uuid, count=12, children=3)
+    connected = ReportPortal(project_name=stub.project, config_path=config_path)
+    connected.launch.connect(rp.launch.uuid, prefetch=True, page_size=5, max_workers=4)
+    client = connected.launch.rp_client
+    requests = dict(stub.requests)
+
+    for uuid in seeded:
+        assert client.get_info(item_type="test_item", uuid=uuid)["name"] == stub.items[uuid]["name"]
+        assert client.get_id(item_type="test_item", uuid=uuid) == stub.items[uuid]["id"]
+
+    assert connected.launch.id == stub.launches[rp.launch.uuid]["id"]
+    assert {entry.uuid for entry in connected.launch.item_index.find()} == set(seeded)
+    assert stub.requests == requests
+
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import pytest
+
+from report_portal.client.rp_client import ItemRecord, record_type
+from report_portal.client.rp_client.records import project
+
+ITEM = {
+    "id": 7,
+    "uuid": "u-7",
+    "name": "test_login",
+    "statistics": {"executions": {"total": 3}},
+    "description": "dropped",
+}
+
+
+def test_project_keeps_requested_fields():
+    record, = project([ITEM], ("id", "uuid", "statistics.executions.total"))
+
+    assert isinstance(record, ItemRecord)
+    assert record.as_dict() == {"id": 7, "uuid": "u-7", "statistics_executions_total": 3}
+    assert record["statistics.executions.total"] == 3
+    assert record.get("description", "missing") == "missing"
+    with pytest.raises(KeyError):
+        record["description"]
+
+
+def test_missing_paths_are_none():
+    record, = project([{"id": 1, "statistics": None}], ("id", "statistics.executions.total", "name"))
+
+    assert tuple(record) == (1, None, None)
+
+
+def test_records_are_slotted_and_read_only():
+    record, = project([ITEM], ("id",))
+
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.id = 8
+
+
+def test_record_types_are_shared_per_projection():
+    assert record_type(["id", "uuid"]) is record_type(("id", "uuid"))
+    assert record_type(["id", "uuid"]) is not record_type(("uuid", "id"))
+
+    with pytest.raises(ValueError):
+        record_type(("a_b", "a.b"))
+
+
+def test_equality_hash_and_pickle():
+    first, second = project([ITEM, dict(ITEM)], ("id", "uuid"))
+
+    assert first == second
+    assert len({first, second}) == 1
+    assert pickle.loads(pickle.dumps(first)) == first
+    assert first != project([ITEM], ("id", "name"))[0]
+
+
+def test_get_items_projects_every_page(rp, stub):
+    seeded = stub.seed_items(rp.launch.uuid, count=25, children=4)
+    step = rp.get_step()
+
+    records = step.get_items(page_size=10, fields=("uuid", "name"))
+
+    assert sorted(record.uuid for record in records) == sorted(seeded)
+    assert all(type(record).__slots__ == ("uuid", "name") for record in records)
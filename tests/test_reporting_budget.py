@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import time
+
+from report_portal import ReportPortal
+from report_portal.utils.budget import ReportingBudget
+
+
+def test_charges_roll_up_into_parent():
+    launch = ReportingBudget(limit=10)
+    item = ReportingBudget(limit=2, parent=launch)
+
+    item.charge(1.5)
+    item.record_drop("log")
+
+    assert launch.spent == 1.5
+    assert launch.dropped == {"log": 1}
+    assert item.remaining == 0.5
+    assert not item.exhausted
+
+
+def test_exhausted_parent_exhausts_children():
+    launch = ReportingBudget(limit=1)
+    item = ReportingBudget(parent=launch)
+
+    launch.charge(1)
+
+    assert item.exhausted
+    assert item.remaining == 0.0
+
+
+def test_clip_uses_tightest_limit():
+    launch = ReportingBudget(limit=5)
+    item = ReportingBudget(limit=3, parent=launch)
+    launch.charge(4)
+
+    assert item.clip(10) == 1
+    assert item.clip(0.5) == 0.5
+    assert ReportingBudget().clip(None) is None
+    assert ReportingBudget().clip(2) == 2
+
+
+def test_reset_keeps_parent_totals():
+    launch = ReportingBudget()
+    item = ReportingBudget(limit=1, parent=launch)
+    with item.measure():
+        time.sleep(0.01)
+    item.record_drop("update")
+
+    item.reset()
+
+    assert item.spent == 0 and not item.dropped
+    assert launch.spent >= 0.01
+    assert launch.summary()["dropped"] == {"update": 1}
+
+
+def test_exhausted_item_budget_drops_logs(stub, config_path):
+    report_portal = ReportPortal(project_name=stub.project, config_path=config_path, item_reporting_budget=0.0)
+    report_portal.launch.start(name="budget")
+    try:
+        step = report_portal.get_step()
+        uuid = step.start(name="over budget")
+        logs = stub.logs
+
+        assert step.send_log("dropped", item_uuid=uuid) is None
+        assert step.update(uuid, description="dropped") is None
+
+        assert stub.logs == logs
+        assert report_portal.launch.reporting_budget.dropped == {"log": 1, "update": 1}
+        step.finish(return_code=0)
+    finally:
+        report_portal.launch.finish()
+
+
+def test_deadline_bounds_slow_lookups(rp, stub):
+    stub.latency = 0.5
+
+    started = time.monotonic()
+    assert rp.launch.rp_client.requests.fetch("item/missing", deadline=0.1) is None
+    assert time.monotonic() - started < 0.4
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+
+import pytest
+
+from report_portal.utils import InMemorySink, JsonLinesSink, Tracer
+from report_portal.utils.tracing import NOOP_SPAN
+
+
+@pytest.fixture
+def sink():
+    sink = Tracer().add_sink(InMemorySink())
+    yield sink
+    Tracer().remove_sink(sink)
+
+
+def test_no_sink_means_no_spans():
+    assert Tracer().span("noop") is NOOP_SPAN
+
+
+def test_spans_nest_and_record_errors(sink):
+    with Tracer().span("outer", kind="test") as outer:
+        with Tracer().span("inner"):
+            Tracer.annotate(annotated=True)
+        with pytest.raises(ValueError):
+            with Tracer().span("failing"):
+                raise ValueError("boom")
+
+    inner, = sink.find("inner")
+    failing, = sink.find("failing")
+    assert sink.children(outer) == [inner, failing]
+    assert inner.trace_id == outer.trace_id
+    assert inner.attributes == {"annotated": True}
+    assert failing.error == "ValueError: boom"
+    assert sink.summary()["failing"]["errors"] == 1
+
+
+def test_wrap_keeps_parent_in_other_threads(sink):
+    with Tracer().span("parent") as parent:
+        def _child():
+            with Tracer().span("child"):
+                pass
+
+        thread = threading.Thread(target=Tracer().wrap(_child))
+        thread.start()
+        thread.join()
+
+    child, = sink.find("child")
+    assert child.parent_id == parent.span_id
+
+
+def test_json_lines_sink(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    sink = Tracer().add_sink(JsonLinesSink(str(path)))
+    try:
+        with Tracer().span("written", size=3):
+            pass
+    finally:
+        Tracer().remove_sink(sink)
+        sink.close()
+
+    span, = [json.loads(line) for line in path.read_text().splitlines()]
+    assert span["name"] == "written" and span["attributes"] == {"size": 3}
+
+
+def test_item_calls_have_http_child_spans(rp, sink):
+    step = rp.get_step()
+    step.start(name="traced")
+    step.finish(return_code=0)
+
+    start, = sink.find("item.start")
+    finish, = sink.find("item.finish")
+    assert start.attributes["name"] == "traced"
+    assert [span.name for span in sink.children(start)] == ["http"]
+    assert "http" in [span.name for span in sink.children(finish)]
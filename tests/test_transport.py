@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import socket
+
+import pytest
+from reportportal_client._internal.http import ClientSession
+
+from report_portal.client.rp_client import Http2Transport, RequestsTransport, TransportError
+from report_portal.client.rp_client.transport import create_transport
+
+
+def _closed_port_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}/api/info"
+
+
+@pytest.mark.parametrize("name", ["requests", "http2"])
+def test_transports_send_requests(stub, name):
+    if name == "http2":
+        pytest.importorskip("h2")
+    transport = create_transport(name)
+    url = f"{stub.endpoint}/api/v1/{stub.project}/item"
+    try:
+        response = transport.request("GET", url, params={"page.page": 1}, timeout=(1, 1))
+        assert response.status_code == 200
+        assert response.json()["page"]["number"] == 1
+    finally:
+        transport.close()
+
+
+def test_client_session_falls_back_for_other_methods(stub):
+    transport = RequestsTransport(session=ClientSession())
+    try:
+        response = transport.request("DELETE", f"{stub.endpoint}/api/v1/{stub.project}/launch/0", timeout=1)
+        assert response.status_code == 404
+    finally:
+        transport.close()
+
+
+@pytest.mark.parametrize("transport_class", [RequestsTransport, Http2Transport])
+def test_connection_errors_raise_transport_error(transport_class):
+    if transport_class is Http2Transport:
+        pytest.importorskip("h2")
+    transport = transport_class()
+    try:
+        with pytest.raises(TransportError):
+            transport.request("GET", _closed_port_url(), timeout=1)
+    finally:
+        transport.close()
+
+
+def test_unknown_transport_is_rejected():
+    with pytest.raises(ValueError):
+        create_transport("http3")